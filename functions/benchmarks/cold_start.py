@@ -0,0 +1,198 @@
+"""함수별 cold start benchmark
+
+functions 디렉터리에서 실행한다:
+
+    python -m benchmarks.cold_start --runs 5
+    python -m benchmarks.cold_start --functions sync_analysis sync_company_ncav
+
+함수마다 새 Python 프로세스를 띄워 `import main` 시간, 첫 호출(first response)까지의 시간,
+warm 상태의 두 번째 호출 시간을 잰다. FMP는 FakeFmpServer, 저장소는 미리 채워 둔 sqlite backend를 쓴다.
+함수는 firebase decorator 안쪽(`__wrapped__`)을 직접 호출하므로 framework의 요청/event decoding은 빠진다.
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+logger = logging.getLogger(__name__)
+
+FUNCTIONS_DIR = Path(__file__).resolve().parent.parent
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+FUNCTIONS = ["sync_analysis", "sync_company_ncav", "sync_company_quote", "sync_company", "screen_companies"]
+# cold start 때 import 되지 않았는지 확인할 무거운 module
+HEAVY_MODULES = ["numpy", "aiohttp", "tenacity", "companies", "clients.fmp.fmpClient", "service.company_data_sync",
+                 "service.analysis", "service.analysis_batch", "service.screener", "service.leaderboard"]
+
+
+class _Snapshot:
+    def __init__(self, data):
+        self.data = data
+
+    def to_dict(self):
+        return dict(self.data)
+
+
+def _request(args):
+    from werkzeug.datastructures import MultiDict
+
+    return SimpleNamespace(args=MultiDict(args), headers={})
+
+
+def _event(after, before, params):
+    change = SimpleNamespace(after=_Snapshot(after) if after is not None else None,
+                             before=_Snapshot(before) if before is not None else None)
+    return SimpleNamespace(data=change, params=params)
+
+
+def _invocation(function_name, symbol, payload):
+    """함수 이름 → 호출 인자 (Firestore trigger는 seed 때 저장한 문서로 event를 만든다)"""
+    if function_name in ("sync_company", "sync_company_quote"):
+        return _request({"symbol": symbol})
+    if function_name == "screen_companies":
+        return _request({"limit": "10"})
+    if function_name == "sync_analysis":
+        quote = payload["quote"]
+        return _event({**quote, "marketCap": quote["marketCap"] * 1.01}, quote, {"symbol": symbol, "date": "today"})
+    if function_name == "sync_company_ncav":
+        return _event(payload["analysis"], None, {"symbol": symbol, "date": "today"})
+    raise ValueError(f"Unknown function {function_name}")
+
+
+def child(function_name, symbol, payload_path):
+    """새 프로세스 안에서 import와 첫 호출을 재고 결과를 JSON 한 줄로 출력한다"""
+    logging.disable(logging.CRITICAL)
+    payload = json.loads(Path(payload_path).read_text())
+    modules_before = len(sys.modules)
+
+    started = time.perf_counter()
+    import main
+    imported = time.perf_counter()
+
+    function = getattr(main, function_name).__wrapped__
+    with open(os.devnull, "w") as devnull:  # invocation summary 로그는 측정 결과 출력과 섞이지 않게 버린다
+        stdout, sys.stdout = sys.stdout, devnull
+        try:
+            function(_invocation(function_name, symbol, payload))
+            first = time.perf_counter()
+            function(_invocation(function_name, symbol, payload))
+            second = time.perf_counter()
+        finally:
+            sys.stdout = stdout
+
+    print(json.dumps({
+        "importMs": (imported - started) * 1000,
+        "firstCallMs": (first - imported) * 1000,
+        "timeToFirstResponseMs": (first - started) * 1000,
+        "warmCallMs": (second - first) * 1000,
+        "importedModules": len(sys.modules) - modules_before,
+        "heavyModules": [module for module in HEAVY_MODULES if module in sys.modules],
+    }))
+
+
+def seed(symbol) -> dict:
+    """sqlite 저장소에 symbol 하나를 sync/analysis 해 두고 trigger event에 쓸 문서를 돌려준다"""
+    from service.analysis import AnalysisService
+    from service.company_data_sync import CompanyDataSyncService
+
+    CompanyDataSyncService().sync_all(symbol)
+    analysis_service = AnalysisService()
+    quote = analysis_service.firestore.get_quote(symbol)
+    analysis_service.update_analysis(symbol, quote)
+    analysis = analysis_service.firestore.backend.get(
+        f"companies/{symbol}/analysis/{datetime.today().date().strftime('%Y-%m-%d')}")
+    return {"quote": quote, "analysis": analysis}
+
+
+def run_child(function_name, symbol, payload_path) -> dict:
+    started = time.perf_counter()
+    completed = subprocess.run([sys.executable, "-m", "benchmarks.cold_start", "--child", function_name,
+                                "--symbol", symbol, "--payload", payload_path],
+                               capture_output=True, text=True, cwd=FUNCTIONS_DIR, check=True)
+    result = json.loads(completed.stdout.strip().splitlines()[-1])
+    result["processMs"] = (time.perf_counter() - started) * 1000
+    return result
+
+
+def summarize(runs) -> dict:
+    keys = ["importMs", "firstCallMs", "timeToFirstResponseMs", "warmCallMs", "processMs"]
+    return {
+        "runs": len(runs),
+        **{key: {"median": statistics.median(run[key] for run in runs), "max": max(run[key] for run in runs)}
+           for key in keys},
+        "importedModules": runs[-1]["importedModules"],
+        "heavyModules": runs[-1]["heavyModules"],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cold start benchmark of the deployed functions")
+    parser.add_argument("--functions", nargs="+", choices=FUNCTIONS, default=FUNCTIONS)
+    parser.add_argument("--runs", type=int, default=3, help="fresh processes per function")
+    parser.add_argument("--symbol", default="AAPL")
+    parser.add_argument("--latency-ms", type=float, default=5)
+    parser.add_argument("--label", default="")
+    parser.add_argument("--output", help="result file (default: benchmarks/results/cold-start-<timestamp>.json)")
+    parser.add_argument("--child", choices=FUNCTIONS, help=argparse.SUPPRESS)
+    parser.add_argument("--payload", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        return child(args.child, args.symbol, args.payload)
+
+    logging.basicConfig(level=logging.WARNING)
+    logging.getLogger().setLevel(logging.WARNING)
+
+    from benchmarks.fake_fmp import FakeFmpServer
+    from benchmarks.run import git_commit
+
+    workdir = tempfile.mkdtemp(prefix="cold-start-")
+    payload_path = os.path.join(workdir, "payload.json")
+    with FakeFmpServer(args.latency_ms, 0, 0, 0, 0) as fmp:
+        # 자식 프로세스도 같은 환경 변수를 물려받는다
+        os.environ.update({
+            "STORAGE_BACKEND": "sqlite",
+            "STORAGE_SQLITE_PATH": os.path.join(workdir, "storage.sqlite3"),
+            "FMP_BASE_URL": fmp.base_url,
+            "FMP_CLIENT_API_KEY": "benchmark",
+            "FMP_RATE_LIMIT_PER_MINUTE": "1000000",
+            "FMP_RATE_LIMIT_BURST": "1000",
+        })
+        Path(payload_path).write_text(json.dumps(seed(args.symbol), default=str))
+
+        functions = {}
+        for function_name in args.functions:
+            functions[function_name] = summarize([run_child(function_name, args.symbol, payload_path)
+                                                  for _ in range(args.runs)])
+            logger.warning(f"{function_name}: import {functions[function_name]['importMs']['median']:.0f}ms, "
+                           f"first response {functions[function_name]['timeToFirstResponseMs']['median']:.0f}ms")
+
+    result = {
+        "label": args.label,
+        "createdAt": datetime.now().isoformat(),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "params": vars(args),
+        "functions": functions,
+    }
+    output = (Path(args.output) if args.output
+              else RESULTS_DIR / f"cold-start-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json")
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(result, indent=2, default=str))
+    print(json.dumps({"output": str(output), **{name: {"importMs": s["importMs"]["median"],
+                                                       "timeToFirstResponseMs": s["timeToFirstResponseMs"]["median"],
+                                                       "heavyModules": s["heavyModules"]}
+                                               for name, s in functions.items()}}, indent=2))
+    return result
+
+
+if __name__ == "__main__":
+    main()
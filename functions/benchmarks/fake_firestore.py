@@ -0,0 +1,178 @@
+import copy
+import threading
+import time
+from collections import Counter
+
+from google.cloud import firestore
+
+# where()에서 쓰는 비교 연산
+OPERATORS = {
+    "==": lambda a, b: a == b,
+    "!=": lambda a, b: a != b,
+    ">": lambda a, b: a is not None and a > b,
+    ">=": lambda a, b: a is not None and a >= b,
+    "<": lambda a, b: a is not None and a < b,
+    "<=": lambda a, b: a is not None and a <= b,
+}
+
+
+def _merge(target, data):
+    """set(merge=True)처럼 map은 필드 단위로 합친다"""
+    for key, value in data.items():
+        if isinstance(value, dict) and isinstance(target.get(key), dict):
+            _merge(target[key], value)
+        else:
+            target[key] = copy.deepcopy(value)
+
+
+def _check_path(path, kind):
+    """실제 client처럼 document 경로는 짝수, collection 경로는 홀수 개의 구간이어야 한다"""
+    elements = path.split("/")
+    if "" in elements:
+        raise ValueError(f"Path {path} contains an empty element")
+    if kind == "document" and len(elements) % 2:
+        raise ValueError(f"A document must have an even number of path elements: {path}")
+    if kind == "collection" and not len(elements) % 2:
+        raise ValueError(f"A collection must have an odd number of path elements: {path}")
+
+
+class FakeSnapshot:
+    def __init__(self, reference, data):
+        self.reference = reference
+        self.id = reference.id
+        self.exists = data is not None
+        self._data = data
+
+    def to_dict(self):
+        return copy.deepcopy(self._data)
+
+
+class FakeDocumentReference:
+    def __init__(self, db, path):
+        _check_path(path, "document")
+        self._db = db
+        self.path = path
+        self.id = path.rsplit("/", 1)[-1]
+
+    def get(self):
+        self._db.rpc("get", 1)
+        return FakeSnapshot(self, self._db.read(self.path))
+
+    def set(self, document_data, merge=False):
+        self._db.rpc("set", 1)
+        self._db.write(self.path, document_data, merge)
+
+    def collection(self, collection_id):
+        return FakeCollectionReference(self._db, f"{self.path}/{collection_id}")
+
+
+class FakeQuery:
+    def __init__(self, db, path, filters=(), fields=None):
+        self._db = db
+        self._path = path
+        self._filters = list(filters)
+        self._fields = fields
+
+    def where(self, field_path=None, op_string=None, value=None, filter=None):
+        if filter is not None:
+            field_path, op_string, value = filter.field_path, filter.op_string, filter.value
+        return FakeQuery(self._db, self._path, self._filters + [(field_path, op_string, value)], self._fields)
+
+    def select(self, field_paths):
+        return FakeQuery(self._db, self._path, self._filters, list(field_paths))
+
+    def stream(self):
+        snapshots = []
+        for path, data in self._db.children(self._path):
+            if all(OPERATORS[op](data.get(field), value) for field, op, value in self._filters):
+                if self._fields is not None:
+                    data = {field: data[field] for field in self._fields if field in data}
+                snapshots.append(FakeSnapshot(FakeDocumentReference(self._db, path), data))
+        self._db.rpc("stream", len(snapshots))
+        return iter(snapshots)
+
+
+class FakeCollectionReference(FakeQuery):
+    def __init__(self, db, path):
+        _check_path(path, "collection")
+        super().__init__(db, path)
+
+    def document(self, document_id):
+        return FakeDocumentReference(self._db, f"{self._path}/{document_id}")
+
+
+class FakeWriteBatch:
+    def __init__(self, db):
+        self._db = db
+        self._writes = []
+
+    def set(self, reference, document_data, merge=False):
+        self._writes.append((reference.path, document_data, merge))
+
+    def commit(self):
+        self._db.rpc("commit", len(self._writes))
+        for path, data, merge in self._writes:
+            self._db.write(path, data, merge)
+
+
+class FakeFirestoreClient:
+    """google.cloud.firestore.Client 대신 쓰는 in-process 저장소
+
+    서비스가 쓰는 API(document/collection/batch/get_all/stream/select/where)만 구현하고,
+    RPC 종류별 호출 수와 읽고 쓴 document 수를 센다. latency_ms를 주면 RPC마다 그만큼 기다린다.
+    """
+
+    def __init__(self, latency_ms=0):
+        self.latency_sec = latency_ms / 1000
+        self.documents = {}
+        self.calls = Counter()  # RPC 종류별 호출 수
+        self.document_counts = Counter()  # RPC 종류별 document 수
+        self.lock = threading.Lock()
+
+    def rpc(self, kind, documents):
+        with self.lock:
+            self.calls[kind] += 1
+            self.document_counts[kind] += documents
+        if self.latency_sec:
+            time.sleep(self.latency_sec)
+
+    def stats(self) -> dict:
+        with self.lock:
+            return {"calls": dict(self.calls), "documents": dict(self.document_counts)}
+
+    def read(self, path):
+        with self.lock:
+            return copy.deepcopy(self.documents.get(path))
+
+    def write(self, path, data, merge):
+        with self.lock:
+            if merge and path in self.documents:
+                _merge(self.documents[path], data)
+            else:
+                self.documents[path] = copy.deepcopy(data)
+
+    def children(self, collection_path):
+        prefix = f"{collection_path}/"
+        with self.lock:
+            return [(path, copy.deepcopy(data)) for path, data in self.documents.items()
+                    if path.startswith(prefix) and "/" not in path[len(prefix):]]
+
+    def document(self, path):
+        return FakeDocumentReference(self, path)
+
+    def collection(self, path):
+        return FakeCollectionReference(self, path)
+
+    def batch(self):
+        return FakeWriteBatch(self)
+
+    def get_all(self, references):
+        references = list(references)
+        self.rpc("get_all", len(references))
+        return iter([FakeSnapshot(reference, self.read(reference.path)) for reference in references])
+
+
+def install(client):
+    """이후 생성되는 FirestoreService가 모두 client를 쓰도록 firestore.Client를 바꾼다"""
+    firestore.Client = lambda *args, **kwargs: client
+    return client
@@ -0,0 +1,160 @@
+import json
+import random
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, unquote, urlparse
+
+FIXTURE_DIR = Path(__file__).resolve().parent.parent / "clients" / "fmp" / "data"
+
+# FMP statement endpoint → (annual fixture, quarter fixture). as-reported는 같은 데이터를 돌려준다
+STATEMENT_FIXTURES = {
+    "income-statement": ("income_statement_annual.json", "income_statement.json"),
+    "balance-sheet-statement": ("balance_sheet_annual.json", "balance_sheet.json"),
+    "cash-flow-statement": ("cash_flow_annual.json", "cash_flow.json"),
+}
+DATE_FIELDS = ["date", "fillingDate", "acceptedDate"]
+
+
+def _load(name):
+    return json.loads((FIXTURE_DIR / name).read_text())
+
+
+def _shift_years(items, years):
+    """fixture의 연도를 years만큼 옮긴다 (분석 코드가 현재 연도 기준으로 최신 재무제표를 찾기 때문)"""
+    shifted = []
+    for item in items:
+        item = dict(item)
+        for field in DATE_FIELDS:
+            if item.get(field):
+                item[field] = f"{int(item[field][:4]) + years}{item[field][4:]}"
+        if item.get("calendarYear"):
+            item["calendarYear"] = str(int(item["calendarYear"]) + years)
+        shifted.append(item)
+    return shifted
+
+
+class FakeFmpServer:
+    """clients/fmp/data fixture를 FMP API처럼 돌려주는 로컬 HTTP 서버
+
+    요청마다 latency_ms(+- jitter_ms)만큼 늦게 응답하고, error_rate 비율로 500을, throttle_rate 비율로
+    Retry-After가 붙은 429를 돌려준다. fixture의 symbol은 요청한 symbol로 바꿔서 응답한다.
+    """
+
+    def __init__(self, latency_ms=0, jitter_ms=0, error_rate=0.0, throttle_rate=0.0, seed=None):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.random = random.Random(seed)
+        self.random_lock = threading.Lock()
+        self.requests = Counter()  # endpoint별 요청 수
+        self.injected = Counter()  # 일부러 돌려준 error 수
+        self.stats_lock = threading.Lock()
+
+        statements = {endpoint: {"annual": _load(annual), "quarter": _load(quarter)}
+                      for endpoint, (annual, quarter) in STATEMENT_FIXTURES.items()}
+        latest_year = max(int(items[0]["date"][:4]) for periods in statements.values() for items in periods.values())
+        years = datetime.now().year - latest_year
+        self.statements = {endpoint: {scope: _shift_years(items, years) for scope, items in periods.items()}
+                           for endpoint, periods in statements.items()}
+        self.quote = _load("quote.json")[0]
+        self.core_info = _load("company_profile.json")[0]
+        self.server = None
+        self.thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}/api"
+
+    def start(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def stats(self) -> dict:
+        with self.stats_lock:
+            return {"requests": dict(self.requests), "injectedErrors": dict(self.injected)}
+
+    def _draw(self):
+        with self.random_lock:
+            return self.random.random(), self.random.uniform(-self.jitter_ms, self.jitter_ms)
+
+    def _count(self, counter, key):
+        with self.stats_lock:
+            counter[key] += 1
+
+    def respond(self, path, query):
+        """(status, headers, body) 반환"""
+        # api, v3|v4, endpoint, [symbol]. requests는 우선주 symbol의 ^를 %5E로 보낸다 (ABR^D)
+        parts = [unquote(part) for part in path.strip("/").split("/")]
+        if len(parts) < 3 or parts[0] != "api":
+            return 404, {}, b"not found"
+        endpoint = parts[2]
+        self._count(self.requests, endpoint)
+
+        draw, jitter = self._draw()
+        delay = max(0.0, self.latency_ms + jitter) / 1000
+        if delay:
+            time.sleep(delay)
+        if draw < self.throttle_rate:
+            self._count(self.injected, "429")
+            return 429, {"Retry-After": "1"}, b"rate limited"
+        if draw < self.throttle_rate + self.error_rate:
+            self._count(self.injected, "500")
+            return 500, {}, b"injected error"
+
+        # AKO/A처럼 /가 들어간 symbol은 path segment로 나뉘어 오므로 다시 잇는다
+        symbol = "/".join(parts[3:]) if len(parts) > 3 else query.get("symbol", [""])[0]
+        if endpoint == "quote":
+            data = [{**self.quote, "symbol": item} for item in symbol.split(",")]
+        elif endpoint == "company-core-information":
+            data = [{**self.core_info, "symbol": symbol}]
+        elif endpoint == "company-outlook":
+            data = {"profile": {"symbol": symbol, "currency": "USD", "country": "US", "sector": "Technology"}}
+        else:
+            statement = endpoint.replace("-as-reported", "")
+            if statement not in self.statements:
+                return 404, {}, b"not found"
+            period = query.get("period", ["annual"])[0]
+            items = self.statements[statement]["quarter" if period == "quarter" else "annual"]
+            limit = int(query["limit"][0]) if "limit" in query else len(items)
+            data = [{**item, "symbol": symbol} for item in items[:limit]]
+        return 200, {"Content-Type": "application/json"}, json.dumps(data).encode()
+
+    def _handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                status, headers, body = fake.respond(url.path, parse_qs(url.query))
+                self.send_response(status)
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
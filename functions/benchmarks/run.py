@@ -0,0 +1,262 @@
+"""sync/analysis 경로 end-to-end benchmark
+
+functions 디렉터리에서 실행한다:
+
+    python -m benchmarks.run --symbols 50 --latency-ms 30 --error-rate 0.01
+    python -m benchmarks.run --compare benchmarks/results/baseline.json
+
+FMP는 FakeFmpServer, Firestore는 FakeFirestoreClient를 쓴다. --firestore로
+emulator(FIRESTORE_EMULATOR_HOST)나 memory/sqlite 저장소 backend를 대신 쓸 수 있다.
+결과는 JSON으로 저장하고, --compare로 이전 결과와 비교할 수 있다.
+"""
+import argparse
+import asyncio
+import concurrent.futures
+import json
+import logging
+import os
+import platform
+import subprocess
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from benchmarks.fake_firestore import FakeFirestoreClient, install
+from benchmarks.fake_fmp import FakeFmpServer
+
+logger = logging.getLogger(__name__)
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+SCENARIOS = ["sync_all", "async_sync_all", "sync_all_companies_quotes", "update_analysis"]
+
+
+def percentile(values, q):
+    """nearest-rank percentile (values가 비어 있으면 None)"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(q / 100 * len(ordered) + 0.5) - 1))
+    return ordered[index]
+
+
+def summarize_latencies(latencies) -> dict:
+    milliseconds = [latency * 1000 for latency in latencies]
+    return {
+        "count": len(milliseconds),
+        "p50": percentile(milliseconds, 50),
+        "p99": percentile(milliseconds, 99),
+        "max": max(milliseconds, default=None),
+        "mean": sum(milliseconds) / len(milliseconds) if milliseconds else None,
+    }
+
+
+def counter_delta(before, after) -> dict:
+    delta = {}
+    for group, values in after.items():
+        previous = before.get(group, {})
+        changed = {key: value - previous.get(key, 0) for key, value in values.items() if value != previous.get(key, 0)}
+        delta[group] = changed
+    return delta
+
+
+class Benchmark:
+    def __init__(self, fmp, db, concurrency):
+        self.fmp = fmp
+        self.db = db  # FakeFirestoreClient (다른 저장소면 None)
+        self.concurrency = concurrency
+
+    def measure(self, name, symbol_count, run):
+        """run(latencies)를 실행하고 처리량/latency/RPC 수를 모은다. run은 unit별 소요 시간을 latencies에 넣는다
+
+        run이 실제로 처리한 symbol 수를 돌려주면 처리량은 그 수로 계산하고, 빠진 symbol 수를 함께 남긴다.
+        """
+        fmp_before = self.fmp.stats()
+        db_before = self.db.stats() if self.db else None
+        latencies = []
+        started = time.perf_counter()
+        completed = run(latencies)
+        wall = time.perf_counter() - started
+        completed = symbol_count if completed is None else completed
+        result = {
+            "symbols": completed,
+            "requestedSymbols": symbol_count,
+            "missingSymbols": symbol_count - completed,
+            "wallSeconds": wall,
+            "symbolsPerSec": completed / wall if wall else None,
+            "latencyMs": summarize_latencies(latencies),
+            "fmp": counter_delta(fmp_before, self.fmp.stats()),
+            "firestore": counter_delta(db_before, self.db.stats()) if self.db else None,
+        }
+        logger.warning(f"{name}: {completed}/{symbol_count} symbols in {wall:.2f}s ({result['symbolsPerSec']:.1f}/s), "
+                       f"p50 {result['latencyMs']['p50']:.1f}ms p99 {result['latencyMs']['p99']:.1f}ms")
+        return result
+
+    def timed_map(self, func, symbols, latencies):
+        def timed(symbol):
+            started = time.perf_counter()
+            func(symbol)
+            return time.perf_counter() - started
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            latencies.extend(executor.map(timed, symbols))
+
+    def sync_all(self, symbols):
+        from service.company_data_sync import CompanyDataSyncService
+
+        service = CompanyDataSyncService()
+        return self.measure("sync_all", len(symbols), lambda latencies: self.timed_map(service.sync_all, symbols, latencies))
+
+    def async_sync_all(self, symbols):
+        """AsyncCompanyDataSyncService.sync_all로 모든 symbol을 event loop 하나에서 동시에 sync한다"""
+        from service.async_company_data_sync import AsyncCompanyDataSyncService
+
+        service = AsyncCompanyDataSyncService()
+
+        async def run(latencies):
+            async def timed(symbol):
+                started = time.perf_counter()
+                await service.sync_all(symbol)
+                latencies.append(time.perf_counter() - started)
+
+            try:
+                await asyncio.gather(*(timed(symbol) for symbol in symbols))
+            finally:
+                await service.fmpClient.close()
+
+        return self.measure("async_sync_all", len(symbols), lambda latencies: asyncio.run(run(latencies)))
+
+    def sync_all_companies_quotes(self, shard, shard_count):
+        from service.company_data_sync import CompanyDataSyncService
+
+        service = CompanyDataSyncService()
+        symbols = service.taskStateService.get_update_company_quotes_companies(shard, shard_count)
+        sync_quotes = service.sync_quotes
+
+        def run(latencies):
+            stored = []
+
+            # unit(quote chunk)별 시간과 실제로 저장된 symbol 수를 재기 위해 instance의 sync_quotes를 감싼다
+            def timed_sync_quotes(chunk):
+                started = time.perf_counter()
+                stored.append(sync_quotes(chunk))
+                latencies.append(time.perf_counter() - started)
+
+            service.sync_quotes = timed_sync_quotes
+            service.sync_all_companies_quotes(None, shard, shard_count)
+            return sum(stored)
+
+        result = self.measure("sync_all_companies_quotes", len(symbols), run)
+        result["latencyUnit"] = "quoteChunk"
+        return result
+
+    def update_analysis(self, symbols):
+        from service.analysis import AnalysisService
+
+        service = AnalysisService()
+        quotes = {symbol: service.firestore.get_quote(symbol) for symbol in symbols}
+        symbols = [symbol for symbol in symbols if quotes[symbol]]
+        return self.measure("update_analysis", len(symbols), lambda latencies: self.timed_map(
+            lambda symbol: service.update_analysis(symbol, quotes[symbol]), symbols, latencies))
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=Path(__file__).resolve().parent, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(baseline, current) -> dict:
+    """scenario별 처리량과 p99의 비율 (1보다 크면 current가 처리량은 높고 p99는 느리다)"""
+    comparison = {}
+    for name, result in current["scenarios"].items():
+        previous = baseline["scenarios"].get(name)
+        if not previous:
+            continue
+        ratio = {}
+        if previous["symbolsPerSec"] and result["symbolsPerSec"]:
+            ratio["symbolsPerSec"] = result["symbolsPerSec"] / previous["symbolsPerSec"]
+        if previous["latencyMs"]["p99"] and result["latencyMs"]["p99"]:
+            ratio["p99"] = result["latencyMs"]["p99"] / previous["latencyMs"]["p99"]
+        comparison[name] = ratio
+    return comparison
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="End-to-end benchmark of the sync and analysis paths")
+    parser.add_argument("--symbols", type=int, default=20,
+                        help="number of symbols for sync_all/async_sync_all/update_analysis")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--latency-ms", type=float, default=20)
+    parser.add_argument("--jitter-ms", type=float, default=5)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="ratio of FMP requests answered with 500")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="ratio of FMP requests answered with 429")
+    parser.add_argument("--firestore", choices=["fake", "emulator", "memory", "sqlite"], default="fake",
+                        help="fake: in-process client that counts RPCs, memory/sqlite: STORAGE_BACKEND")
+    parser.add_argument("--sqlite-path", help="database file for --firestore sqlite (default: a new temp file)")
+    parser.add_argument("--firestore-latency-ms", type=float, default=0)
+    parser.add_argument("--quote-shards", type=int, default=1, help="run the quotes sync over 1/N of the universe")
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=SCENARIOS)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--label", default="")
+    parser.add_argument("--output", help="result file (default: benchmarks/results/<timestamp>.json)")
+    parser.add_argument("--compare", help="previous result file to compare against")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    logging.getLogger().setLevel(logging.WARNING)  # 서비스의 symbol별 INFO 로그는 측정을 흐린다
+
+    if args.firestore == "emulator" and not os.getenv("FIRESTORE_EMULATOR_HOST"):
+        parser.error("--firestore emulator needs FIRESTORE_EMULATOR_HOST")
+    db = install(FakeFirestoreClient(args.firestore_latency_ms)) if args.firestore == "fake" else None
+    if args.firestore in ("memory", "sqlite"):
+        os.environ["STORAGE_BACKEND"] = args.firestore
+        if args.firestore == "sqlite":
+            os.environ["STORAGE_SQLITE_PATH"] = args.sqlite_path or tempfile.mkstemp(suffix=".sqlite3")[1]
+
+    with FakeFmpServer(args.latency_ms, args.jitter_ms, args.error_rate, args.throttle_rate, args.seed) as fmp:
+        os.environ.update({
+            "FMP_BASE_URL": fmp.base_url,
+            "FMP_CLIENT_API_KEY": "benchmark",
+            # 로컬 서버이므로 client 쪽 rate limit은 측정에서 뺀다
+            "FMP_RATE_LIMIT_PER_MINUTE": "1000000",
+            "FMP_RATE_LIMIT_BURST": "1000",
+        })
+        from companies import companies
+
+        symbols = list(companies[:args.symbols])
+        benchmark = Benchmark(fmp, db, args.concurrency)
+        scenarios = {}
+        if "sync_all" in args.scenarios:
+            scenarios["sync_all"] = benchmark.sync_all(symbols)
+        if "async_sync_all" in args.scenarios:
+            scenarios["async_sync_all"] = benchmark.async_sync_all(symbols)
+        if "sync_all_companies_quotes" in args.scenarios:
+            scenarios["sync_all_companies_quotes"] = benchmark.sync_all_companies_quotes(0, args.quote_shards)
+        if "update_analysis" in args.scenarios:
+            scenarios["update_analysis"] = benchmark.update_analysis(symbols)
+
+    result = {
+        "label": args.label,
+        "createdAt": datetime.now().isoformat(),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "params": vars(args),
+        "scenarios": scenarios,
+    }
+    if args.compare:
+        result["comparison"] = compare(json.loads(Path(args.compare).read_text()), result)
+
+    output = Path(args.output) if args.output else RESULTS_DIR / f"{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(result, indent=2, default=str))
+    print(json.dumps({"output": str(output), **{name: {"symbolsPerSec": s["symbolsPerSec"], "p99": s["latencyMs"]["p99"]}
+                                               for name, s in scenarios.items()},
+                      "comparison": result.get("comparison")}, indent=2))
+    return result
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+import asyncio
+import json
+import ssl
+import threading
+
+import aiohttp
+import certifi
+from tenacity import retry, stop_after_attempt, wait_exponential
+
+from clients.fmp.fmpClient import DEFAULT_BASE_URL, FmpClient
+from clients.fmp.rateLimiter import get_rate_limiter, parse_retry_after
+from metrics import count_fmp_retry, fmp_endpoint, metrics
+
+# event loop 하나에서 동시에 보내는 최대 FMP 요청 수
+DEFAULT_ASYNC_CONCURRENCY = 200
+
+
+@retry(stop=stop_after_attempt(10), wait=wait_exponential(multiplier=1, min=4, max=10), before_sleep=count_fmp_retry)
+async def get_jsonparsed_data_async(url, session, rate_limiter):
+    await rate_limiter.acquire_async()
+    # rate limit 대기는 빼고 HTTP 요청 시간만 endpoint별로 기록한다
+    with metrics.timer("fmp", fmp_endpoint(url)) as result:
+        async with session.get(url) as response:
+            body = await response.read()
+            result["bytes"] = len(body)
+            if response.status == 429:
+                rate_limiter.backoff(parse_retry_after(response.headers.get("Retry-After")))
+            response.raise_for_status()  # Raise an exception for HTTP errors
+    return json.loads(body)
+
+
+class AsyncFmpClient(FmpClient):
+    """FmpClient의 모든 메서드를 coroutine으로 제공한다 (예: await client.get_quote(symbol))
+
+    URL 조립은 FmpClient를 그대로 쓰고 실제 요청(_fetch)만 aiohttp로 바꾼다. 재무제표도 응답을 한 번에 받는다.
+    aiohttp session과 semaphore는 event loop에 묶이므로 loop마다 따로 만들고, 실행이 끝나면 close()로 닫는다.
+    """
+
+    def __init__(self, base_url=DEFAULT_BASE_URL, api_key="", quote_chunk_size=100,
+                 concurrency=DEFAULT_ASYNC_CONCURRENCY, rate_limiter=None):
+        self.api_key = api_key
+        self.base_url = base_url
+        self.quote_chunk_size = quote_chunk_size
+        self.concurrency = concurrency
+        self.rate_limiter = rate_limiter or get_rate_limiter()
+        self.loops = {}  # event loop → (session, semaphore)
+        self.loops_lock = threading.Lock()
+
+    def _loop_state(self):
+        loop = asyncio.get_running_loop()
+        with self.loops_lock:
+            state = self.loops.get(loop)
+            if state is None:
+                ssl_context = ssl.create_default_context(cafile=certifi.where())
+                connector = aiohttp.TCPConnector(limit=self.concurrency, ssl=ssl_context)
+                state = self.loops[loop] = (aiohttp.ClientSession(connector=connector),
+                                            asyncio.Semaphore(self.concurrency))
+            return state
+
+    async def _fetch(self, url):
+        session, semaphore = self._loop_state()
+        async with semaphore:
+            return await get_jsonparsed_data_async(url, session, self.rate_limiter)
+
+    async def _fetch_statements(self, url, stream=False):
+        return await self._fetch(url)
+
+    async def get_quotes(self, symbols, chunk_size=None) -> list:
+        chunk_size = chunk_size or self.quote_chunk_size
+        chunks = [symbols[i:i + chunk_size] for i in range(0, len(symbols), chunk_size)]
+        results = await asyncio.gather(*(self.get_quote(",".join(chunk)) for chunk in chunks))
+        return [quote for result in results for quote in result]
+
+    async def close(self):
+        """지금 event loop의 session을 닫는다"""
+        with self.loops_lock:
+            state = self.loops.pop(asyncio.get_running_loop(), None)
+        if state is not None:
+            await state[0].close()
@@ -1,77 +1,188 @@
+import threading
+
 import requests
 import certifi
+from requests.adapters import HTTPAdapter
 from tenacity import retry, stop_after_attempt, wait_exponential
 
-
-@retry(stop=stop_after_attempt(10), wait=wait_exponential(multiplier=1, min=4, max=10))
-def get_jsonparsed_data(url):
-    response = requests.get(url, verify=certifi.where())
-    response.raise_for_status()  # Raise an exception for HTTP errors
+from clients.fmp.jsonStream import JsonTruncatedError, iter_json_array, prefetch
+from clients.fmp.rateLimiter import get_rate_limiter, parse_retry_after
+from metrics import count_fmp_retry, fmp_endpoint, metrics
+
+DEFAULT_BASE_URL = "https://financialmodelingprep.com/api"
+DEFAULT_POOL_SIZE = 32
+STREAM_CHUNK_BYTES = 64 * 1024
+# streaming 때 download thread가 미리 parse해 둘 수 있는 최대 period 수 (메모리 상한)
+STREAM_PREFETCH_ITEMS = 64
+# body를 받는 도중에 연결이 끊기거나 응답이 잘렸을 때 나는 예외 (header 전 실패는 open_json_stream이 다시 시도한다)
+# 배열이 아닌 body(JsonNotArrayError)나 형식이 잘못된 body는 다시 받아도 같으므로 포함하지 않는다
+STREAM_ERRORS = (requests.exceptions.RequestException, JsonTruncatedError)
+
+# 프로세스 단위로 공유되는 session (warm invocation 간에도 재사용)
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+
+def get_session(pool_size=DEFAULT_POOL_SIZE):
+    """pool_size별로 connection pool을 가진 keep-alive session을 하나만 만들어 공유"""
+    with _sessions_lock:
+        session = _sessions.get(pool_size)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.verify = certifi.where()
+            session.headers.update({
+                "Accept-Encoding": "gzip, deflate",
+                "Connection": "keep-alive",
+            })
+            _sessions[pool_size] = session
+        return session
+
+
+@retry(stop=stop_after_attempt(10), wait=wait_exponential(multiplier=1, min=4, max=10), before_sleep=count_fmp_retry)
+def get_jsonparsed_data(url, session=None, rate_limiter=None):
+    session = session or get_session()
+    rate_limiter = rate_limiter or get_rate_limiter()
+    rate_limiter.acquire()
+    # rate limit 대기는 빼고 HTTP 요청 시간만 endpoint별로 기록한다
+    with metrics.timer("fmp", fmp_endpoint(url)) as result:
+        response = session.get(url)
+        result["bytes"] = len(response.content)
+        if response.status_code == 429:
+            rate_limiter.backoff(parse_retry_after(response.headers.get("Retry-After")))
+        response.raise_for_status()  # Raise an exception for HTTP errors
     return response.json()
 
 
+@retry(stop=stop_after_attempt(10), wait=wait_exponential(multiplier=1, min=4, max=10), before_sleep=count_fmp_retry)
+def open_json_stream(url, session=None, rate_limiter=None):
+    """body는 읽지 않고 status만 확인한 response를 돌려준다 (header까지 받는 시간을 기록)"""
+    session = session or get_session()
+    rate_limiter = rate_limiter or get_rate_limiter()
+    rate_limiter.acquire()
+    with metrics.timer("fmp", fmp_endpoint(url)):
+        response = session.get(url, stream=True)
+        try:
+            if response.status_code == 429:
+                rate_limiter.backoff(parse_retry_after(response.headers.get("Retry-After")))
+            response.raise_for_status()
+        except Exception:
+            response.close()
+            raise
+    return response
+
+
+def iter_jsonparsed_data(url, session=None, rate_limiter=None):
+    """JSON 배열 응답을 받는 대로 원소 하나씩 돌려준다
+
+    body를 받기 시작한 뒤에 연결이 끊기면 다시 시도하지 않고 예외(STREAM_ERRORS)를 낸다 (이미 넘겨준 원소가 있으므로).
+    다시 받으려면 호출한 쪽이 요청부터 다시 한다 (CompanyDataSyncService._sync_statement).
+    """
+    response = open_json_stream(url, session, rate_limiter)
+    endpoint = fmp_endpoint(url)
+
+    def chunks():
+        for chunk in response.iter_content(chunk_size=STREAM_CHUNK_BYTES):
+            metrics.increment("fmpStreamedBytes", endpoint, len(chunk))
+            yield chunk
+
+    try:
+        yield from iter_json_array(chunks())
+    finally:
+        response.close()  # 끝까지 읽지 않았어도 connection을 pool에 돌려준다
+
+
 class FmpClient:
-    def __init__(self, base_url="https://financialmodelingprep.com/api", api_key=""):
+    def __init__(self, base_url=DEFAULT_BASE_URL, api_key="", quote_chunk_size=100,
+                 pool_size=DEFAULT_POOL_SIZE, rate_limiter=None, stream_prefetch=STREAM_PREFETCH_ITEMS):
         self.api_key = api_key
         self.base_url = base_url
+        self.quote_chunk_size = quote_chunk_size
+        self.session = get_session(pool_size)
+        self.rate_limiter = rate_limiter or get_rate_limiter()
+        self.stream_prefetch = stream_prefetch
+
+    def _fetch(self, url):
+        return get_jsonparsed_data(url, self.session, self.rate_limiter)
+
+    def _stream(self, url):
+        """응답 배열을 iterator로. download/parse는 별도 thread에서 stream_prefetch개까지 앞서 나간다"""
+        return prefetch(iter_jsonparsed_data(url, self.session, self.rate_limiter), self.stream_prefetch)
+
+    def _fetch_statements(self, url, stream=False):
+        return self._stream(url) if stream else self._fetch(url)
 
-    def __get_financial_url(self, statement_type, symbol, annual=True):
+    def __get_financial_url(self, statement_type, symbol, annual=True, limit=None):
         period = "annual" if annual else "quarter"
-        return f"{self.base_url}/v3/{statement_type}/{symbol}?period={period}&apikey={self.api_key}"
+        url = f"{self.base_url}/v3/{statement_type}/{symbol}?period={period}&apikey={self.api_key}"
+        # limit이 있으면 최신 period부터 limit개만 받는다
+        return f"{url}&limit={limit}" if limit else url
 
-    def __get_incomestmt_url(self, symbol, annual=True):
-        return self.__get_financial_url("income-statement", symbol, annual)
+    def __get_incomestmt_url(self, symbol, annual=True, limit=None):
+        return self.__get_financial_url("income-statement", symbol, annual, limit)
 
-    def __get_incomestmt_as_reported_url(self, symbol, annual=True):
-        return self.__get_financial_url("income-statement-as-reported", symbol, annual)
+    def __get_incomestmt_as_reported_url(self, symbol, annual=True, limit=None):
+        return self.__get_financial_url("income-statement-as-reported", symbol, annual, limit)
 
-    def __get_balancesheet_url(self, symbol, annual=True):
-        return self.__get_financial_url("balance-sheet-statement", symbol, annual)
+    def __get_balancesheet_url(self, symbol, annual=True, limit=None):
+        return self.__get_financial_url("balance-sheet-statement", symbol, annual, limit)
 
-    def __get_balancesheet_as_reported_url(self, symbol, annual=True):
-        return self.__get_financial_url("balance-sheet-statement-as-reported", symbol, annual)
+    def __get_balancesheet_as_reported_url(self, symbol, annual=True, limit=None):
+        return self.__get_financial_url("balance-sheet-statement-as-reported", symbol, annual, limit)
 
-    def __get_cashflow_url(self, symbol, annual=True):
-        return self.__get_financial_url("cash-flow-statement", symbol, annual)
+    def __get_cashflow_url(self, symbol, annual=True, limit=None):
+        return self.__get_financial_url("cash-flow-statement", symbol, annual, limit)
 
-    def __get_cashflow_as_reported_url(self, symbol, annual=True):
-        return self.__get_financial_url("cash-flow-statement-as-reported", symbol, annual)
+    def __get_cashflow_as_reported_url(self, symbol, annual=True, limit=None):
+        return self.__get_financial_url("cash-flow-statement-as-reported", symbol, annual, limit)
 
     def __get_quote_url(self, symbol):
         return f"{self.base_url}/v3/quote/{symbol}?apikey={self.api_key}"
 
     def get_company_core_info(self, symbol):
         url = f"{self.base_url}/v4/company-core-information?symbol={symbol}&apikey={self.api_key}"
-        return get_jsonparsed_data(url)
+        return self._fetch(url)
 
     def get_company_outlook(self, symbol):
         url = f"{self.base_url}/v4/company-outlook?symbol={symbol}&apikey={self.api_key}"
-        return get_jsonparsed_data(url)
+        return self._fetch(url)
 
-    def get_income_statement(self, symbol, annual=True) -> list:
-        url = self.__get_incomestmt_url(symbol, annual)
-        return get_jsonparsed_data(url)
+    def get_income_statement(self, symbol, annual=True, limit=None, stream=False):
+        url = self.__get_incomestmt_url(symbol, annual, limit)
+        return self._fetch_statements(url, stream)
 
-    def get_income_statement_as_reported(self, symbol, annual=True) -> list:
-        url = self.__get_incomestmt_as_reported_url(symbol, annual)
-        return get_jsonparsed_data(url)
+    def get_income_statement_as_reported(self, symbol, annual=True, limit=None, stream=False):
+        url = self.__get_incomestmt_as_reported_url(symbol, annual, limit)
+        return self._fetch_statements(url, stream)
 
-    def get_balance_sheet(self, symbol, annual=True) -> list:
-        url = self.__get_balancesheet_url(symbol, annual)
-        return get_jsonparsed_data(url)
+    def get_balance_sheet(self, symbol, annual=True, limit=None, stream=False):
+        url = self.__get_balancesheet_url(symbol, annual, limit)
+        return self._fetch_statements(url, stream)
 
-    def get_balance_sheet_as_reported(self, symbol, annual=True) -> list:
-        url = self.__get_balancesheet_as_reported_url(symbol, annual)
-        return get_jsonparsed_data(url)
+    def get_balance_sheet_as_reported(self, symbol, annual=True, limit=None, stream=False):
+        url = self.__get_balancesheet_as_reported_url(symbol, annual, limit)
+        return self._fetch_statements(url, stream)
 
-    def get_cash_flow(self, symbol, annual=True) -> list:
-        url = self.__get_cashflow_url(symbol, annual)
-        return get_jsonparsed_data(url)
+    def get_cash_flow(self, symbol, annual=True, limit=None, stream=False):
+        url = self.__get_cashflow_url(symbol, annual, limit)
+        return self._fetch_statements(url, stream)
 
-    def get_cash_flow_as_reported(self, symbol, annual=True) -> list:
-        url = self.__get_cashflow_as_reported_url(symbol, annual)
-        return get_jsonparsed_data(url)
+    def get_cash_flow_as_reported(self, symbol, annual=True, limit=None, stream=False):
+        url = self.__get_cashflow_as_reported_url(symbol, annual, limit)
+        return self._fetch_statements(url, stream)
 
     def get_quote(self, symbol):
         url = self.__get_quote_url(symbol)
-        return get_jsonparsed_data(url)
+        return self._fetch(url)
+
+    def get_quotes(self, symbols, chunk_size=None) -> list:
+        """여러 symbol의 quote를 comma로 묶어 chunk 단위로 요청"""
+        chunk_size = chunk_size or self.quote_chunk_size
+        quotes = []
+        for i in range(0, len(symbols), chunk_size):
+            chunk = symbols[i:i + chunk_size]
+            url = self.__get_quote_url(",".join(chunk))
+            quotes.extend(self._fetch(url))
+        return quotes
@@ -0,0 +1,145 @@
+import codecs
+import json
+import queue
+import threading
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+_DELIMITERS = _WHITESPACE + ",]"
+
+
+class JsonStreamError(ValueError):
+    pass
+
+
+class JsonNotArrayError(JsonStreamError):
+    """최상위 값이 배열이 아니다 (FMP 오류 객체 등). 다시 받아도 같은 응답이 온다"""
+
+
+class JsonTruncatedError(JsonStreamError):
+    """배열이 닫히기 전에 body가 끝났다 (연결이 끊긴 경우)"""
+
+
+def iter_json_array(chunks):
+    """bytes chunk들로 들어오는 JSON 배열을 원소 하나씩 parse해서 돌려준다
+
+    응답 전체를 메모리에 올리지 않고, 아직 parse하지 않은 원소 하나 + chunk 하나만큼만 buffer에 둔다.
+    최상위 값이 배열이 아니면 (예: FMP의 {"Error Message": ...}) JsonNotArrayError,
+    배열이 닫히기 전에 body가 끝나면 JsonTruncatedError, 그 밖에 형식이 잘못됐으면 JsonStreamError.
+    """
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    chunks = iter(chunks)
+    buffer = ""
+    position = 0
+    started = False
+    finished = False
+
+    def read_more():
+        nonlocal buffer, position, finished
+        if finished:
+            return False
+        try:
+            chunk = next(chunks)
+        except StopIteration:
+            finished = True
+            chunk = b""
+        # 이미 parse한 앞부분은 버린다
+        buffer = buffer[position:] + text_decoder.decode(chunk, final=finished)
+        position = 0
+        return True
+
+    def skip(characters):
+        nonlocal position
+        while True:
+            while position < len(buffer) and buffer[position] in characters:
+                position += 1
+            if position < len(buffer) or not read_more():
+                return
+
+    skip(_WHITESPACE + "\ufeff")  # BOM
+    while True:
+        if position >= len(buffer):
+            if not started:
+                raise JsonTruncatedError("Empty JSON response")
+            raise JsonTruncatedError("JSON array is not closed")
+        if not started:
+            if buffer[position] != "[":
+                raise JsonNotArrayError(f"Expected a JSON array, got {buffer[position:position + 80]!r}")
+            started = True
+            position += 1
+            skip(_WHITESPACE)
+            if position < len(buffer) and buffer[position] == "]":
+                return
+            continue
+
+        try:
+            item, end = _decoder.raw_decode(buffer, position)
+            truncated = False
+        except json.JSONDecodeError as e:
+            item, end = None, None
+            # buffer 끝까지 읽고서야 실패했거나 문자열이 닫히지 않았으면 잘린 것, 아니면 잘못된 원소
+            truncated = e.pos >= len(buffer) or e.msg.startswith("Unterminated string")
+        # 숫자는 buffer 끝에서 잘려도 ("2.5|e3") decode되므로, 원소 뒤에 구분자가 보일 때까지 더 읽는다
+        if end is None or (not finished and (end >= len(buffer) or buffer[end] not in _DELIMITERS)):
+            if read_more():
+                continue
+            error = JsonTruncatedError if truncated else JsonStreamError
+            raise error(f"Invalid JSON array element at {buffer[position:position + 80]!r}")
+        yield item
+
+        position = end
+        skip(_WHITESPACE)
+        if position < len(buffer) and buffer[position] == "]":
+            return
+        if position >= len(buffer):
+            raise JsonTruncatedError("JSON array is not closed")
+        if buffer[position] != ",":
+            raise JsonStreamError("Expected ',' or ']' after a JSON array element")
+        position += 1
+        skip(_WHITESPACE)
+
+
+def prefetch(iterable, maxsize):
+    """iterable을 별도 thread에서 최대 maxsize개까지 미리 읽는다 (download와 소비 쪽 처리를 겹치게)
+
+    소비하는 쪽이 중간에 멈추면 (generator close) 읽는 thread도 다음 원소에서 멈춘다.
+    """
+    items = queue.Queue(maxsize=maxsize)
+    stopped = threading.Event()
+    done = object()
+
+    def put(item):
+        while not stopped.is_set():
+            try:
+                items.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce():
+        try:
+            for item in iterable:
+                if not put((item, None)):
+                    return
+            put((done, None))
+        except Exception as e:
+            put((done, e))
+        finally:
+            close = getattr(iterable, "close", None)
+            if close is not None:
+                close()
+
+    thread = threading.Thread(target=produce, daemon=True)
+    thread.start()
+    try:
+        while True:
+            item, error = items.get()
+            if item is done:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        stopped.set()
+        thread.join()
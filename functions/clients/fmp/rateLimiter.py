@@ -0,0 +1,123 @@
+import asyncio
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+from metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BACKOFF_SECONDS = 10
+
+
+def parse_retry_after(value, default=DEFAULT_BACKOFF_SECONDS) -> float:
+    """Retry-After header (초 또는 HTTP-date)를 대기 시간(초)으로 변환"""
+    if not value:
+        return default
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return default
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class RateLimiter:
+    """process 전체의 FMP 호출이 공유하는 token bucket
+
+    분당 per_minute개의 token이 채워지고 최대 burst개까지 쌓인다.
+    reserve()는 token을 하나 예약하고 기다려야 할 시간을 돌려준다.
+    429를 받으면 backoff()로 모든 호출을 함께 멈춘다.
+    stats()는 프로세스 누적 값이고, invocation별 값은 metrics의 fmpRateLimiter counter에 남는다.
+    """
+
+    def __init__(self, per_minute=300, burst=10):
+        self.rate = per_minute / 60.0
+        self.capacity = float(burst)
+        self.tokens = float(burst)
+        self.updated = time.monotonic()  # pause 중이면 미래 시각 (refill 시작 시점)
+        self.lock = threading.Lock()
+
+        self.calls = 0
+        self.waited_calls = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.backoffs = 0
+
+    def reserve(self) -> float:
+        with self.lock:
+            now = time.monotonic()
+            if now > self.updated:
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+            self.tokens -= 1
+            delay = (self.updated - now) + max(0.0, -self.tokens) / self.rate
+
+            self.calls += 1
+            if delay > 0:
+                self.waited_calls += 1
+                self.total_wait += delay
+                self.max_wait = max(self.max_wait, delay)
+        metrics.increment("fmpRateLimiter", "calls")
+        if delay > 0:
+            metrics.increment("fmpRateLimiter", "waitedCalls")
+            metrics.increment("fmpRateLimiter", "waitMs", round(delay * 1000))
+        return delay
+
+    def acquire(self) -> float:
+        delay = self.reserve()
+        if delay > 0:
+            logger.debug(f"Rate limiter wait {delay:.3f}s")
+            time.sleep(delay)
+        return delay
+
+    async def acquire_async(self) -> float:
+        """acquire()와 같지만 event loop를 막지 않고 기다린다 (AsyncFmpClient)"""
+        delay = self.reserve()
+        if delay > 0:
+            logger.debug(f"Rate limiter wait {delay:.3f}s")
+            await asyncio.sleep(delay)
+        return delay
+
+    def backoff(self, seconds):
+        """429 이후 seconds 동안 모든 호출을 멈추고, 그 뒤로는 빈 bucket에서 다시 채운다"""
+        with self.lock:
+            resume_at = time.monotonic() + seconds
+            if resume_at > self.updated:
+                self.tokens = min(self.tokens, 0.0)
+                self.updated = resume_at
+            self.backoffs += 1
+        metrics.increment("fmpRateLimiter", "backoffs")
+        logger.warning(f"FMP rate limited, pausing all calls for {seconds:.1f}s")
+
+    def stats(self) -> dict:
+        with self.lock:
+            return {
+                "calls": self.calls,
+                "waitedCalls": self.waited_calls,
+                "totalWaitSeconds": round(self.total_wait, 3),
+                "avgWaitSeconds": round(self.total_wait / self.calls, 3) if self.calls else 0.0,
+                "maxWaitSeconds": round(self.max_wait, 3),
+                "backoffs": self.backoffs,
+            }
+
+
+_rate_limiter = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    global _rate_limiter
+    with _rate_limiter_lock:
+        if _rate_limiter is None:
+            _rate_limiter = RateLimiter(
+                per_minute=int(os.getenv("FMP_RATE_LIMIT_PER_MINUTE", "300")),
+                burst=int(os.getenv("FMP_RATE_LIMIT_BURST", "10")),
+            )
+        return _rate_limiter
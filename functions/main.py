@@ -1,9 +1,10 @@
-from firebase_functions import https_fn, scheduler_fn, firestore_fn
+from firebase_functions import https_fn, scheduler_fn, firestore_fn, options
 from firebase_admin import initialize_app
-from companies import companies
-from service.company_data_sync import CompanyDataSyncService
-from service.analysis import AnalysisService
+from metrics import instrumented
+import json
 import logging
+import os
+from datetime import datetime, timezone
 from firebase_functions.firestore_fn import Event, Change, DocumentSnapshot
 
 # Configure logging
@@ -12,41 +13,122 @@ logger = logging.getLogger(__name__)
 
 app = initialize_app()
 
+# 배포된 함수마다 같은 main.py를 import하므로, 무거운 의존성(FMP client, numpy, symbol 목록 등)은
+# 각 함수가 처음 호출될 때 필요한 것만 import한다 (cold start를 줄이기 위해)
+
+# scheduled 함수의 timeout. RunBudget은 이 시간에서 safety margin을 남기고 새 작업을 멈춘다
+SYNC_COMPANY_TIMEOUT_SEC = 540
+SYNC_QUOTES_TIMEOUT_SEC = 300
+SYNC_SAFETY_MARGIN_SEC = int(os.getenv("SYNC_SAFETY_MARGIN_SEC", "30"))
+# 1보다 크면 scheduled 실행이 symbol 목록을 나눠 sync_companies_shard worker들에게 fan-out 한다
+SYNC_SHARDS = int(os.getenv("SYNC_SHARDS", "1"))
+# company info sync engine: threads (CompanyDataSyncService) 또는 async (AsyncCompanyDataSyncService, 한 event loop)
+SYNC_ENGINE = os.getenv("SYNC_ENGINE", "threads")
+
 
 @https_fn.on_request()
+@instrumented
 def sync_company(req: https_fn.Request) -> https_fn.Response:
+    from companies import companies
+    from service.registry import get_company_data_sync_service
+
     symbol = req.args.get("symbol")
     if symbol not in companies:
         logger.error(f"Symbol {symbol} is not in the defined list")
         return https_fn.Response("symbol is not in defined list", status=400)
-    company_service = CompanyDataSyncService()
-    company_service.sync_all(symbol)
+    full_refresh = req.args.get("full") == "true"  # true면 FMP에서 전체 period를 다시 받는다
+    company_service = get_company_data_sync_service()
+    company_service.sync_all(symbol, full_refresh)
     return https_fn.Response(f"Company {symbol} information updated")
 
 
-@scheduler_fn.on_schedule(schedule="every 9 minutes from 00:01 to 06:00 on SUN")
+@scheduler_fn.on_schedule(schedule="every 9 minutes from 00:01 to 06:00 on SUN", timeout_sec=SYNC_COMPANY_TIMEOUT_SEC)
+@instrumented
 def sync_company_scheduled(event: scheduler_fn.ScheduledEvent) -> None:
-    sync_companies_exec()
+    from service.deadline import RunBudget
+
+    if SYNC_SHARDS > 1:
+        dispatch_shards("info")
+        return
+    sync_companies_exec(RunBudget(SYNC_COMPANY_TIMEOUT_SEC, SYNC_SAFETY_MARGIN_SEC))
 
 
 @https_fn.on_request()
+@instrumented
 def sync_company_quote(req: https_fn.Request) -> https_fn.Response:
+    from companies import companies
+    from service.registry import get_company_data_sync_service
+
     symbol = req.args.get("symbol")
     if symbol not in companies:
         logger.error(f"Symbol {symbol} is not in the defined list")
         return https_fn.Response("symbol is not in defined list", status=400)
-    company_service = CompanyDataSyncService()
+    company_service = get_company_data_sync_service()
     company_service.sync_quote(symbol)
     return https_fn.Response(f"Company {symbol} quotes updated")
 
 
-@scheduler_fn.on_schedule(schedule="every 5 minutes from 09:30 to 16:00 on Mon, Tue, Wed, Thu, Fri")
+@scheduler_fn.on_schedule(schedule="every 5 minutes from 09:30 to 16:00 on Mon, Tue, Wed, Thu, Fri",
+                          timeout_sec=SYNC_QUOTES_TIMEOUT_SEC)
+@instrumented
 def sync_companies_quotes_scheduled(event: scheduler_fn.ScheduledEvent) -> None:
-    sync_companies_quote_exec()
+    from service.deadline import RunBudget
+
+    if SYNC_SHARDS > 1:
+        dispatch_shards("quotes")
+        return
+    sync_companies_quote_exec(RunBudget(SYNC_QUOTES_TIMEOUT_SEC, SYNC_SAFETY_MARGIN_SEC))
+
+
+@https_fn.on_request(timeout_sec=SYNC_COMPANY_TIMEOUT_SEC)
+@instrumented
+def sync_companies_shard(req: https_fn.Request) -> https_fn.Response:
+    from service.sharding import SHARD_TOKEN_HEADER
+
+    token = os.getenv("SHARD_DISPATCH_TOKEN")
+    if token and req.headers.get(SHARD_TOKEN_HEADER) != token:
+        logger.error("Invalid shard dispatch token")
+        return https_fn.Response("forbidden", status=403)
+
+    task = req.args.get("task")
+    try:
+        shard = int(req.args.get("shard"))
+        shard_count = int(req.args.get("shards"))
+    except (TypeError, ValueError):
+        return https_fn.Response("shard and shards must be integers", status=400)
+    if task not in ("info", "quotes") or not 0 <= shard < shard_count:
+        return https_fn.Response("invalid task or shard", status=400)
+
+    return https_fn.Response(run_shard(task, shard, shard_count))
+
+
+@https_fn.on_request(timeout_sec=SYNC_COMPANY_TIMEOUT_SEC, memory=options.MemoryOption.GB_1)
+@instrumented
+def sync_all_analysis(req: https_fn.Request) -> https_fn.Response:
+    from service.analysis_batch import BatchAnalysisEngine
+
+    report = BatchAnalysisEngine().run()
+    return https_fn.Response(f"Analysis updated for {report['analyzed']}/{report['symbols']} companies")
+
+
+@https_fn.on_request(memory=options.MemoryOption.GB_1, min_instances=int(os.getenv("SCREENER_MIN_INSTANCES", "0")))
+@instrumented
+def screen_companies(req: https_fn.Request) -> https_fn.Response:
+    from service.screener import ScreenerQueryError, get_screener, parse_query
+
+    try:
+        query = parse_query(req.args)
+        result = get_screener().screen(**query)
+    except ScreenerQueryError as e:
+        return https_fn.Response(str(e), status=400)
+    return https_fn.Response(json.dumps(result), mimetype="application/json")
 
 
 @firestore_fn.on_document_written(document="companies/{symbol}/quotes/{date}")
+@instrumented
 def sync_analysis(event: Event[Change[DocumentSnapshot | None]]) -> None:
+    from service.registry import get_analysis_service
+
     document = (event.data.after.to_dict()
                 if event.data.after is not None else None)
 
@@ -54,12 +136,16 @@ def sync_analysis(event: Event[Change[DocumentSnapshot | None]]) -> None:
         logger.error("Document is empty")
         return
 
-    analysis_service = AnalysisService()
-    analysis_service.update_analysis(event.params["symbol"], document)
+    analysis_service = get_analysis_service()
+    analysis_service.update_analysis_on_quote_change(event.params["symbol"], document)
 
 
 @firestore_fn.on_document_written(document="companies/{symbol}/analysis/{date}")
+@instrumented
 def sync_company_ncav(event: Event[Change[DocumentSnapshot | None]]) -> None:
+    # FMP client 없이 Firestore만 쓴다
+    from service.registry import get_firestore_service
+
     document = (event.data.after.to_dict()
                 if event.data.after is not None else None)
 
@@ -67,8 +153,9 @@ def sync_company_ncav(event: Event[Change[DocumentSnapshot | None]]) -> None:
         logger.error("Document is empty")
         return
 
-    analysis_service = CompanyDataSyncService()
-    analysis_service.add_company_profile(event.params["symbol"], {
+    symbol = event.params["symbol"]
+    firestore = get_firestore_service()
+    firestore.store_company_profile(symbol, {
         "annualNcavRatio": document["annualNcavRatio"],
         "quarterNcavRatio": document["quarterNcavRatio"],
         "annualRetainedEarnings": document["annualRetainedEarnings"],
@@ -77,21 +164,68 @@ def sync_company_ncav(event: Event[Change[DocumentSnapshot | None]]) -> None:
         "roi": document["roi"],
         "per": document["per"],
         "pbr": document["pbr"],
-        "eps": document["eps"]
+        "eps": document["eps"],
+        "shareholderReturns": document.get("shareholderReturns"),
+        # 다음 quote 변경 때 재무 데이터를 다시 읽지 않고 지표를 보정하기 위한 기준값
+        "analysisMarketCap": document.get("marketCap"),
+        "analysisFundamentalsVersion": document.get("fundamentalsVersion"),
+        # 순위 board는 refresh_leaderboards_scheduled가 이 시각 이후 바뀐 profile을 모아서 갱신한다
+        "analysisUpdatedAt": datetime.now(timezone.utc)
     })
 
 
-def sync_companies_exec() -> str:
-    logger.info("Updating company information")
-    company_service = CompanyDataSyncService()
-    company_service.sync_all_companies_info()
+@https_fn.on_request(timeout_sec=SYNC_COMPANY_TIMEOUT_SEC, memory=options.MemoryOption.GB_1)
+@instrumented
+def rebuild_leaderboards(req: https_fn.Request) -> https_fn.Response:
+    from service.leaderboard import LeaderboardService
+
+    report = LeaderboardService().refresh(full=True)
+    return https_fn.Response(f"Rebuilt {report['boards']} leaderboards from {report['profiles']} companies")
+
+
+@scheduler_fn.on_schedule(schedule="every 5 minutes")
+@instrumented
+def refresh_leaderboards_scheduled(event: scheduler_fn.ScheduledEvent) -> None:
+    from service.leaderboard import LeaderboardService
+
+    LeaderboardService().refresh()
+
+
+def sync_companies_exec(budget=None, shard=0, shard_count=1) -> str:
+    from service.registry import get_async_company_data_sync_service, get_company_data_sync_service
+
+    logger.info(f"Updating company information ({SYNC_ENGINE} engine)")
+    if SYNC_ENGINE == "async":
+        company_service = get_async_company_data_sync_service()
+    else:
+        company_service = get_company_data_sync_service()
+    company_service.sync_all_companies_info(budget, shard, shard_count)
     logger.info("Company information updated")
     return "Company information updated"
 
 
-def sync_companies_quote_exec() -> str:
+def sync_companies_quote_exec(budget=None, shard=0, shard_count=1) -> str:
+    from service.registry import get_company_data_sync_service
+
     logger.info("Updating company quotes")
-    company_service = CompanyDataSyncService()
-    company_service.sync_all_companies_quotes()
+    company_service = get_company_data_sync_service()
+    company_service.sync_all_companies_quotes(budget, shard, shard_count)
     logger.info("Company quotes updated")
     return "Company quotes updated"
+
+
+def run_shard(task, shard, shard_count) -> str:
+    from service.deadline import RunBudget
+
+    logger.info(f"Running {task} shard {shard}/{shard_count}")
+    if task == "info":
+        return sync_companies_exec(RunBudget(SYNC_COMPANY_TIMEOUT_SEC, SYNC_SAFETY_MARGIN_SEC), shard, shard_count)
+    return sync_companies_quote_exec(RunBudget(SYNC_QUOTES_TIMEOUT_SEC, SYNC_SAFETY_MARGIN_SEC), shard, shard_count)
+
+
+def dispatch_shards(task):
+    from service.sharding import get_shard_dispatcher
+
+    results = get_shard_dispatcher(run_shard).dispatch(task, SYNC_SHARDS)
+    failed = [shard for shard, result in results.items() if isinstance(result, Exception)]
+    logger.info(f"Dispatched {task} to {SYNC_SHARDS} shards ({len(failed)} failed: {failed})")
@@ -0,0 +1,161 @@
+import bisect
+import functools
+import json
+import re
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from urllib.parse import urlparse
+
+# latency histogram bucket 상한 (ms). 마지막 bucket은 그 이상 전부
+BUCKET_BOUNDS_MS = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 30000]
+_FMP_ENDPOINT = re.compile(r"/v\d+/([^/?]+)")
+
+
+class Histogram:
+    """고정 bucket latency histogram (기록은 O(log bucket 수), 메모리는 key당 bucket 수만큼)"""
+
+    __slots__ = ("buckets", "count", "errors", "bytes", "total_ms", "max_ms")
+
+    def __init__(self):
+        self.buckets = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+        self.count = 0
+        self.errors = 0
+        self.bytes = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, ms, nbytes=0, error=False):
+        self.buckets[bisect.bisect_left(BUCKET_BOUNDS_MS, ms)] += 1
+        self.count += 1
+        self.errors += int(error)
+        self.bytes += nbytes
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def percentile(self, q):
+        """q번째 percentile이 들어 있는 bucket의 상한 (마지막 bucket이면 max)"""
+        if not self.count:
+            return None
+        rank = q / 100 * self.count
+        seen = 0
+        for index, bucket in enumerate(self.buckets):
+            seen += bucket
+            if seen >= rank:
+                return BUCKET_BOUNDS_MS[index] if index < len(BUCKET_BOUNDS_MS) else round(self.max_ms, 1)
+        return round(self.max_ms, 1)
+
+    def summary(self) -> dict:
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "bytes": self.bytes,
+            "totalMs": round(self.total_ms, 1),
+            "maxMs": round(self.max_ms, 1),
+            "p50Ms": self.percentile(50),
+            "p99Ms": self.percentile(99),
+            # 값이 있는 bucket만 {상한: 개수}
+            "buckets": {str(BUCKET_BOUNDS_MS[i]) if i < len(BUCKET_BOUNDS_MS) else "inf": bucket
+                        for i, bucket in enumerate(self.buckets) if bucket},
+        }
+
+
+class Metrics:
+    """group(fmp/firestore)별 key마다 latency histogram과, 이름별 counter를 모은다
+
+    요청 처리 중 만들어지는 thread pool worker에서도 기록되도록 ContextVar가 아니라 프로세스 단위로 둔다.
+    (instance 하나가 요청을 하나씩 처리한다고 가정한다. 동시에 여러 요청을 받으면 summary가 섞인다)
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.histograms = {}
+            self.counters = {}
+            self.started_at = time.perf_counter()
+
+    def record(self, group, key, seconds, nbytes=0, error=False):
+        with self.lock:
+            histogram = self.histograms.setdefault(group, {}).get(key)
+            if histogram is None:
+                histogram = self.histograms[group][key] = Histogram()
+            histogram.record(seconds * 1000, nbytes, error)
+
+    def increment(self, name, key, amount=1):
+        with self.lock:
+            counter = self.counters.setdefault(name, {})
+            counter[key] = counter.get(key, 0) + amount
+
+    @contextmanager
+    def timer(self, group, key):
+        """with 블록 시간을 기록한다. 블록 안에서 예외가 나면 error로 센다. yield한 dict에 bytes를 넣을 수 있다"""
+        result = {"bytes": 0}
+        started = time.perf_counter()
+        try:
+            yield result
+        except Exception:
+            self.record(group, key, time.perf_counter() - started, result["bytes"], error=True)
+            raise
+        self.record(group, key, time.perf_counter() - started, result["bytes"])
+
+    def summary(self) -> dict:
+        with self.lock:
+            return {
+                "durationMs": round((time.perf_counter() - self.started_at) * 1000, 1),
+                **{group: {key: histogram.summary() for key, histogram in sorted(histograms.items())}
+                   for group, histograms in self.histograms.items()},
+                "counters": {name: dict(counter) for name, counter in self.counters.items()},
+            }
+
+
+metrics = Metrics()
+
+
+def fmp_endpoint(url):
+    """FMP URL → endpoint 이름 (예: income-statement, quote, company-outlook)"""
+    match = _FMP_ENDPOINT.search(urlparse(url).path)
+    return match.group(1) if match else "unknown"
+
+
+def collection_pattern(path):
+    """document path → collection pattern (companies/AAPL/quotes/2024-01-01 → companies/*/quotes/*)"""
+    segments = path.split("/")
+    return "/".join(segment if index % 2 == 0 else "*" for index, segment in enumerate(segments))
+
+
+def count_fmp_retry(retry_state):
+    """tenacity before_sleep: 다시 시도할 때마다 endpoint별 retry 수를 센다"""
+    url = retry_state.args[0] if retry_state.args else retry_state.kwargs.get("url", "")
+    metrics.increment("fmpRetries", fmp_endpoint(url))
+
+
+def emit_summary(function_name, extra=None):
+    """invocation 하나의 metric을 Cloud Logging이 구조화해서 읽을 수 있는 JSON 한 줄로 출력"""
+    record = {
+        "severity": "INFO",
+        "message": f"{function_name} invocation summary",
+        "function": function_name,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        **metrics.summary(),
+        **(extra or {}),
+    }
+    print(json.dumps(record, default=str), flush=True)
+    return record
+
+
+def instrumented(func):
+    """함수 호출 하나를 invocation으로 보고 시작할 때 metric을 비우고 끝날 때 summary를 남긴다"""
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        metrics.reset()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            emit_summary(func.__name__)
+
+    return wrapper
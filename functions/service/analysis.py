@@ -1,6 +1,8 @@
+import os
 import statistics
 
 from service.firestore import FirestoreService
+from service.registry import get_firestore_service
 from datetime import datetime
 import logging
 
@@ -8,63 +10,154 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# fundamentals summary에 남기는 재무제표 필드
+BALANCE_SHEET_FIELDS = ["totalCurrentAssets", "totalLiabilities", "totalAssets", "retainedEarnings"]
+INCOME_STATEMENT_FIELDS = ["netIncome", "eps"]
+SHAREHOLDER_RETURN_YEARS = 5
+SHAREHOLDER_RETURN_HISTORY_YEARS = 100
+# 분석 문서와 company profile에 함께 저장되는 지표
+ANALYSIS_FIELDS = ["annualNcavRatio", "quarterNcavRatio", "annualRetainedEarnings", "quarterRetainedEarnings",
+                   "shareholderReturns", "shareholderReturnFrequency", "roi", "per", "pbr", "eps"]
+
+
+# marketCap에 반비례하는 지표들 (rescale 시 old/new 배)
+INVERSE_MARKET_CAP_FIELDS = ["annualNcavRatio", "quarterNcavRatio", "roi"]
+# marketCap에 비례하는 지표들 (rescale 시 new/old 배)
+MARKET_CAP_FIELDS = ["per", "pbr"]
+
 
 class AnalysisService:
-    def __init__(self):
-        self.firestore = FirestoreService()
+    def __init__(self, firestore=None):
+        self.firestore = firestore or get_firestore_service()
+        # quote 사이 marketCap 변화가 이 비율보다 작으면 분석을 다시 하지 않는다
+        self.market_cap_threshold = float(os.getenv("ANALYSIS_MARKET_CAP_THRESHOLD", "0.005"))
+
+    def update_analysis_on_quote_change(self, symbol, quote) -> str:
+        """quote 문서 변경 시 필요한 만큼만 분석을 갱신하고, 수행한 방식(skipped/rescaled/full)을 반환
+
+        - 마지막 분석 이후 재무 데이터(fundamentals version)가 그대로이고
+          분석에 쓴 marketCap(analysisMarketCap)과의 차이가 threshold 미만이면 건너뛴다
+        - 재무 데이터가 그대로면 저장된 지표를 marketCap 비율로만 보정한다
+        - 그 외에는 전체 분석을 다시 한다
+        """
+        market_cap = quote["marketCap"]
+        profile = self.firestore.get_company_profile(symbol) or {}
+        analysis_market_cap = profile.get("analysisMarketCap")
+        fundamentals_unchanged = (profile.get("fundamentalsVersion") is not None
+                                  and profile.get("analysisFundamentalsVersion") == profile.get("fundamentalsVersion"))
+
+        # 직전 quote가 아니라 마지막 분석 기준으로 비교해야 작은 변화가 쌓여도 다시 계산된다
+        if (fundamentals_unchanged and analysis_market_cap and market_cap
+                and relative_change(analysis_market_cap, market_cap) < self.market_cap_threshold):
+            logger.info(f"Market cap of {symbol} moved less than {self.market_cap_threshold:.2%} "
+                        f"since the last analysis, skipping analysis")
+            return "skipped"
+
+        if fundamentals_unchanged and analysis_market_cap and market_cap:
+            self.firestore.store_analysis(symbol, self.rescale_analysis(profile, analysis_market_cap, market_cap))
+            logger.info(f"Analysis for {symbol} rescaled to new market cap")
+            return "rescaled"
+
+        self.update_analysis(symbol, quote)
+        return "full"
+
+    def rescale_analysis(self, analysis, previous_market_cap, market_cap) -> dict:
+        """재무 데이터가 그대로일 때 marketCap만 바뀐 분석 결과를 계산"""
+        data = {field: analysis.get(field) for field in ANALYSIS_FIELDS}
+        for field in INVERSE_MARKET_CAP_FIELDS:
+            value = data.get(field)
+            # NCAV의 -1은 재무제표가 없다는 표시라 그대로 둔다
+            if value is not None and not (field.endswith("NcavRatio") and value == -1):
+                data[field] = value * previous_market_cap / market_cap
+        for field in MARKET_CAP_FIELDS:
+            if data.get(field) is not None:
+                data[field] = data[field] * market_cap / previous_market_cap
+        data["marketCap"] = market_cap
+        data["fundamentalsVersion"] = analysis.get("analysisFundamentalsVersion")
+        return data
 
     def update_analysis(self, symbol, quote):
+        # sync 때 만들어 둔 fundamentals summary가 있으면 그 문서 하나만 읽는다
+        with self.firestore.read_cache() as cache:
+            fundamentals = self.firestore.get_fundamentals(symbol)
+            if fundamentals is None:
+                logger.warning(f"Fundamentals summary not found for {symbol}, reading statements")
+                fundamentals = self.build_fundamentals(symbol)
+        logger.info(f"Analysis reads for {symbol}: {cache.stats()}")
+
         data = {}
-        data.update(self.get_roi(symbol, quote))
-        data.update(self.get_ncav_ratio(symbol, quote))
-        data.update(self.get_retained_earnings(symbol))
-        data.update(self.get_median_shareholder_returns(symbol))
-        data.update(self.get_shareholder_return_frequency(symbol))
-        data.update(self.get_per(symbol, quote))
-        data.update(self.get_pbr(symbol, quote))
-        data.update(self.get_eps(symbol))
+        data.update(self.get_roi(fundamentals, quote))
+        data.update(self.get_ncav_ratio(fundamentals, quote))
+        data.update(self.get_retained_earnings(fundamentals))
+        data.update(self.get_median_shareholder_returns(fundamentals))
+        data.update(self.get_shareholder_return_frequency(fundamentals))
+        data.update(self.get_per(fundamentals, quote))
+        data.update(self.get_pbr(fundamentals, quote))
+        data.update(self.get_eps(fundamentals))
+        data["marketCap"] = quote["marketCap"]
+        data["fundamentalsVersion"] = fundamentals.get("version")
 
         self.firestore.store_analysis(symbol, data)
+        return cache.stats()
 
-    def get_shareholder_return_frequency(self, symbol):
-        cashflows = self.get_latest_n_years_annual_cashflow(symbol, 100)
-        shareholder_returns = []
-        cnt = 0
-        for cashflow in cashflows:
-            shareholder_returns.append(self.get_shareholders_return(cashflow))
+    def build_fundamentals(self, symbol) -> dict:
+        """분석에 필요한 최신 재무 데이터만 모은 summary를 만든다 (quote와 무관한 부분)"""
+        current_year = datetime.now().year
 
-        for shareholder_return in shareholder_returns:
-            if shareholder_return > 0:
-                cnt += 1
+        # 같은 재무 문서를 여러 곳에서 쓰므로 document별로 한 번만 읽는다
+        with self.firestore.read_cache():
+            annual_balancesheet = self.get_latest_annual_balancesheet(symbol)
+            quarter_balancesheet = self.get_latest_quarter_balance_sheet(symbol)
+            annual_incomestmt = self.get_latest_annual_income_statement(symbol)
+            years = list(range(current_year, current_year - SHAREHOLDER_RETURN_HISTORY_YEARS, -1))
+            cashflows = self.firestore.get_cashflows(symbol, [f"{year}-FY" for year in years])
+
+        # 최신 연도부터
+        history = [
+            {"year": year, "shareholderReturn": self.get_shareholders_return(cashflow)}
+            for year, cashflow in zip(years, cashflows) if cashflow
+        ]
+        recent_returns = [item["shareholderReturn"] for item in history
+                          if item["year"] > current_year - SHAREHOLDER_RETURN_YEARS]
+        positive_returns = [item for item in history if item["shareholderReturn"] > 0]
+
+        fundamentals = {
+            "annualBalanceSheet": pick_fields(annual_balancesheet, BALANCE_SHEET_FIELDS),
+            "quarterBalanceSheet": pick_fields(quarter_balancesheet, BALANCE_SHEET_FIELDS),
+            "annualIncomeStatement": pick_fields(annual_incomestmt, INCOME_STATEMENT_FIELDS),
+            "shareholderReturnsHistory": history,
+            "shareholderReturns": statistics.median(recent_returns) if recent_returns else None,
+            "shareholderReturnFrequency": len(positive_returns) / len(history) if history else None,
+        }
+        # 내용이 같으면 같은 version → 분석 결과를 marketCap 비율로만 보정해도 되는지 판단할 때 쓴다
+        fundamentals["version"] = FirestoreService.content_hash(fundamentals)
+        fundamentals["updatedAt"] = datetime.now().isoformat()
+        return fundamentals
 
+    def get_shareholder_return_frequency(self, fundamentals):
         return {
-            "shareholderReturnFrequency":  cnt / len(shareholder_returns)
+            "shareholderReturnFrequency": fundamentals.get("shareholderReturnFrequency")
         }
 
-    def get_retained_earnings(self, symbol):
-        annual_balancesheet = self.get_latest_annual_balancesheet(symbol)
-        quarter_balancesheet = self.get_latest_quarter_balance_sheet(symbol)
+    def get_retained_earnings(self, fundamentals):
+        annual_balancesheet = fundamentals.get("annualBalanceSheet") or {}
+        quarter_balancesheet = fundamentals.get("quarterBalanceSheet") or {}
 
         return {
             "annualRetainedEarnings": annual_balancesheet.get("retainedEarnings"),
             "quarterRetainedEarnings": quarter_balancesheet.get("retainedEarnings")
         }
 
-    def get_roi(self, symbol, quote):
-        sharedholder_returns = self.get_median_shareholder_returns(symbol)["shareholderReturns"]
+    def get_roi(self, fundamentals, quote):
+        sharedholder_returns = fundamentals.get("shareholderReturns")
         market_cap = quote["marketCap"]
         return {
-            "roi": sharedholder_returns / market_cap
+            "roi": sharedholder_returns / market_cap if sharedholder_returns is not None else None
         }
 
-    def get_median_shareholder_returns(self, symbol):
-        cashflows = self.get_latest_n_years_annual_cashflow(symbol, 5)
-        shareholder_returns = []
-        for cashflow in cashflows:
-            shareholder_returns.append(self.get_shareholders_return(cashflow))
-
+    def get_median_shareholder_returns(self, fundamentals):
         return {
-            "shareholderReturns": statistics.median(shareholder_returns)
+            "shareholderReturns": fundamentals.get("shareholderReturns")
         }
 
     def get_shareholders_return(self, cashflow):
@@ -72,33 +165,18 @@ class AnalysisService:
         common_stock_repurchased = cashflow.get("commonStockRepurchased", 0)
         return -1 * (dividends_paid + common_stock_repurchased)
 
-    def get_ncav_ratio(self, symbol, quote):
-        annual_ncav_ratio = self.get_annual_ncav(symbol, quote)
-        quarter_ncav_ratio = self.get_quarter_ncav(symbol, quote)
+    def get_ncav_ratio(self, fundamentals, quote):
+        annual_ncav_ratio = self.get_ncav(fundamentals.get("annualBalanceSheet"), quote)
+        quarter_ncav_ratio = self.get_ncav(fundamentals.get("quarterBalanceSheet"), quote)
 
         return {
             "annualNcavRatio": annual_ncav_ratio,
             "quarterNcavRatio": quarter_ncav_ratio
         }
 
-    def get_annual_ncav(self, symbol, quote) -> float:
-        balancesheet = self.get_latest_annual_balancesheet(symbol)
-
-        if not balancesheet:
-            logger.warning(f"Balancesheet not found for {symbol}")
-            return -1
-
-        nca = balancesheet.get("totalCurrentAssets") - balancesheet.get("totalLiabilities")
-        market_cap = quote["marketCap"]
-        ncav_ratio = nca / market_cap
-
-        return ncav_ratio
-
-    def get_quarter_ncav(self, symbol, quote) -> float:
-        balancesheet = self.get_latest_quarter_balance_sheet(symbol)
-
+    def get_ncav(self, balancesheet, quote) -> float:
         if not balancesheet:
-            logger.warning(f"Balancesheet not found for {symbol}")
+            logger.warning("Balancesheet not found")
             return -1
 
         nca = balancesheet.get("totalCurrentAssets") - balancesheet.get("totalLiabilities")
@@ -107,51 +185,46 @@ class AnalysisService:
 
         return ncav_ratio
 
-    def get_per(self, symbol, quote):
-        net_income = self.get_latest_net_income(symbol)
+    def get_per(self, fundamentals, quote):
+        net_income = (fundamentals.get("annualIncomeStatement") or {}).get("netIncome")
         market_cap = quote.get("marketCap", 1)  # Default to 1 to avoid division by zero
         per = market_cap / net_income if net_income else None
         return {
             "per": per
         }
 
-    def get_pbr(self, symbol, quote):
-        book_value = self.get_latest_book_value(symbol)
+    def get_pbr(self, fundamentals, quote):
+        book_value = self.get_book_value(fundamentals.get("annualBalanceSheet"))
         market_cap = quote.get("marketCap", 1)  # Default to 1 to avoid division by zero
         pbr = market_cap / book_value if book_value else None
         return {
             "pbr": pbr
         }
 
-    def get_eps(self, symbol):
-        incomestmt = self.get_latest_annual_income_statement(symbol)
+    def get_eps(self, fundamentals):
+        incomestmt = fundamentals.get("annualIncomeStatement") or {}
         return {
-            "eps": incomestmt["eps"]
+            "eps": incomestmt.get("eps")
         }
 
-    def get_latest_net_income(self, symbol):
-        annual_income_statement = self.get_latest_annual_income_statement(symbol)
-        return annual_income_statement.get("netIncome")
-
-    def get_latest_book_value(self, symbol):
-        annual_balancesheet = self.get_latest_annual_balancesheet(symbol)
-        return annual_balancesheet.get("totalAssets") - annual_balancesheet.get("totalLiabilities")
+    def get_book_value(self, balancesheet):
+        if not balancesheet:
+            return None
+        return balancesheet.get("totalAssets") - balancesheet.get("totalLiabilities")
 
     def get_latest_annual_income_statement(self, symbol):
         current_year = datetime.now().year
 
-        for year in [current_year, current_year - 1]:  # 현재년도 → 작년도 순서로 시도
-            incomestmt = self.firestore.get_incomestmt(symbol, str(year), "FY")
-            if incomestmt:  # 데이터가 있으면 중단
-                return incomestmt
+        # 현재년도 → 작년도 순서로 시도
+        period_ids = [f"{year}-FY" for year in [current_year, current_year - 1]]
+        return first_found(self.firestore.get_incomestmts(symbol, period_ids))
 
     def get_latest_annual_balancesheet(self, symbol):
         current_year = datetime.now().year
 
-        for year in [current_year, current_year - 1]:  # 현재년도 → 작년도 순서로 시도
-            balancesheet = self.firestore.get_balancesheet(symbol, str(year), "FY")
-            if balancesheet:  # 데이터가 있으면 중단
-                return balancesheet
+        # 현재년도 → 작년도 순서로 시도
+        period_ids = [f"{year}-FY" for year in [current_year, current_year - 1]]
+        return first_found(self.firestore.get_balancesheets(symbol, period_ids))
 
     def get_latest_quarter_balance_sheet(self, symbol):
         current_year = datetime.now().year
@@ -160,18 +233,22 @@ class AnalysisService:
             (current_year, "Q4"), (current_year, "Q3"), (current_year, "Q2"), (current_year, "Q1"),
             (current_year - 1, "Q4"), (current_year - 1, "Q3")
         ]
-        for year, quarter in quarters:
-            balancesheet = self.firestore.get_balancesheet(symbol, str(year), quarter)
-            if balancesheet:
-                return balancesheet
+        period_ids = [f"{year}-{quarter}" for year, quarter in quarters]
+        return first_found(self.firestore.get_balancesheets(symbol, period_ids))
 
-    def get_latest_n_years_annual_cashflow(self, symbol, n):
-        current_year = datetime.now().year
 
-        cashflows = []
-        for year in range(current_year, current_year - n, -1):
-            cashflow = self.firestore.get_cashflow(symbol, str(year), "FY")
-            if cashflow:
-                cashflows.append(cashflow)
+def first_found(documents):
+    """후보 순서대로 처음 존재하는 문서를 반환 (모두 없으면 None)"""
+    for document in documents:
+        if document:  # 데이터가 있으면 중단
+            return document
+
+
+def pick_fields(document, fields):
+    if not document:
+        return None
+    return {field: document.get(field) for field in fields}
+
 
-        return cashflows
+def relative_change(previous, current):
+    return abs(current - previous) / abs(previous)
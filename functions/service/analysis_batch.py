@@ -0,0 +1,144 @@
+import logging
+import warnings
+from datetime import datetime
+
+import numpy as np
+
+from companies import companies
+from service.analysis import SHAREHOLDER_RETURN_HISTORY_YEARS, SHAREHOLDER_RETURN_YEARS
+from service.registry import get_firestore_service
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+READ_CHUNK_SIZE = 500
+
+
+def _field(documents, key, field):
+    """documents[i][key][field]를 float 배열로 (없으면 nan)"""
+    values = np.full(len(documents), np.nan)
+    for i, document in enumerate(documents):
+        value = (document.get(key) or {}).get(field)
+        if value is not None:
+            values[i] = value
+    return values
+
+
+def _to_python(value):
+    if value is None:
+        return None
+    value = float(value)
+    return None if np.isnan(value) else value
+
+
+class BatchAnalysisEngine:
+    """전체 symbol의 분석 지표를 NumPy 배열로 한 번에 계산한다
+
+    AnalysisService.update_analysis와 같은 입력(최신 quote + fundamentals summary)을 쓰고,
+    재무제표가 없으면 NCAV는 -1, 분모가 0이거나 값이 없으면 None으로 scalar 코드와 같게 처리한다.
+    """
+
+    def __init__(self, firestore=None):
+        self.firestore = firestore or get_firestore_service()
+
+    def load(self, symbols, date_str=None):
+        """quote와 fundamentals가 모두 있는 symbol만 (symbols, market_caps, fundamentals)로 반환
+
+        quote는 symbol마다 가장 최근에 저장한 것을 쓴다 (date_str을 주면 그 날짜의 quote).
+        """
+        loaded_symbols, market_caps, fundamentals = [], [], []
+        for i in range(0, len(symbols), READ_CHUNK_SIZE):
+            chunk = symbols[i:i + READ_CHUNK_SIZE]
+            if date_str:
+                quote_paths = {symbol: f"companies/{symbol}/quotes/{date_str}" for symbol in chunk}
+            else:
+                quote_paths = {symbol: f"companies/{symbol}/summary/quote" for symbol in chunk}
+            summary_paths = {symbol: f"companies/{symbol}/summary/fundamentals" for symbol in chunk}
+            documents = self.firestore.get_many(list(quote_paths.values()) + list(summary_paths.values()))
+            for symbol in chunk:
+                quote = documents[quote_paths[symbol]]
+                summary = documents[summary_paths[symbol]]
+                if not quote or not quote.get("marketCap") or summary is None:
+                    continue
+                loaded_symbols.append(symbol)
+                market_caps.append(quote["marketCap"])
+                fundamentals.append(summary)
+        return loaded_symbols, np.array(market_caps, dtype=float), fundamentals
+
+    def shareholder_returns_matrix(self, fundamentals, current_year=None):
+        """(symbol 수, 연도 수) 배열. column j는 current_year - j년의 주주환원액 (없으면 nan)"""
+        current_year = current_year or datetime.now().year
+        matrix = np.full((len(fundamentals), SHAREHOLDER_RETURN_HISTORY_YEARS), np.nan)
+        for i, document in enumerate(fundamentals):
+            for item in document.get("shareholderReturnsHistory") or []:
+                offset = current_year - item["year"]
+                if 0 <= offset < SHAREHOLDER_RETURN_HISTORY_YEARS:
+                    matrix[i, offset] = item["shareholderReturn"]
+        return matrix
+
+    def compute(self, market_caps, fundamentals, current_year=None) -> dict:
+        """지표 이름 → symbol 순서의 배열 (값이 없으면 nan, NCAV는 재무제표가 없으면 -1)"""
+        annual_present = np.array([bool(document.get("annualBalanceSheet")) for document in fundamentals])
+        quarter_present = np.array([bool(document.get("quarterBalanceSheet")) for document in fundamentals])
+
+        annual_current_assets = _field(fundamentals, "annualBalanceSheet", "totalCurrentAssets")
+        annual_liabilities = _field(fundamentals, "annualBalanceSheet", "totalLiabilities")
+        annual_assets = _field(fundamentals, "annualBalanceSheet", "totalAssets")
+        quarter_current_assets = _field(fundamentals, "quarterBalanceSheet", "totalCurrentAssets")
+        quarter_liabilities = _field(fundamentals, "quarterBalanceSheet", "totalLiabilities")
+        net_income = _field(fundamentals, "annualIncomeStatement", "netIncome")
+
+        returns = self.shareholder_returns_matrix(fundamentals, current_year)
+        observed = ~np.isnan(returns)
+        observed_count = observed.sum(axis=1)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)  # 최근 5년 데이터가 전혀 없는 symbol (All-NaN)
+            median_returns = np.nanmedian(returns[:, :SHAREHOLDER_RETURN_YEARS], axis=1)
+        positive_count = (np.nan_to_num(returns, nan=0.0) > 0).sum(axis=1)
+        frequency = np.divide(positive_count, observed_count, out=np.full(len(fundamentals), np.nan),
+                              where=observed_count > 0)
+
+        book_value = annual_assets - annual_liabilities
+        # 0이거나 값이 없으면 나누지 않는다 (scalar 코드의 `if net_income` / `if book_value`)
+        per_valid = ~np.isnan(net_income) & (net_income != 0)
+        pbr_valid = annual_present & ~np.isnan(book_value) & (book_value != 0)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return {
+                "annualNcavRatio": np.where(annual_present,
+                                            (annual_current_assets - annual_liabilities) / market_caps, -1.0),
+                "quarterNcavRatio": np.where(quarter_present,
+                                             (quarter_current_assets - quarter_liabilities) / market_caps, -1.0),
+                "shareholderReturns": median_returns,
+                "shareholderReturnFrequency": frequency,
+                "roi": median_returns / market_caps,
+                "per": np.where(per_valid, market_caps / np.where(per_valid, net_income, 1.0), np.nan),
+                "pbr": np.where(pbr_valid, market_caps / np.where(pbr_valid, book_value, 1.0), np.nan),
+            }
+
+    def to_documents(self, symbols, market_caps, fundamentals, metrics) -> dict:
+        analyses = {}
+        for i, symbol in enumerate(symbols):
+            annual_balancesheet = fundamentals[i].get("annualBalanceSheet") or {}
+            quarter_balancesheet = fundamentals[i].get("quarterBalanceSheet") or {}
+            data = {name: _to_python(values[i]) for name, values in metrics.items()}
+            data.update({
+                "annualRetainedEarnings": annual_balancesheet.get("retainedEarnings"),
+                "quarterRetainedEarnings": quarter_balancesheet.get("retainedEarnings"),
+                "eps": (fundamentals[i].get("annualIncomeStatement") or {}).get("eps"),
+                "marketCap": float(market_caps[i]),
+                "fundamentalsVersion": fundamentals[i].get("version"),
+            })
+            analyses[symbol] = data
+        return analyses
+
+    def run(self, symbols=companies) -> dict:
+        """전체 symbol을 다시 평가해 분석 문서를 batch로 저장하고 요약을 반환"""
+        loaded_symbols, market_caps, fundamentals = self.load(symbols)
+        metrics = self.compute(market_caps, fundamentals)
+        analyses = self.to_documents(loaded_symbols, market_caps, fundamentals, metrics)
+        failed = self.firestore.store_analyses(analyses)
+        report = {"symbols": len(symbols), "analyzed": len(analyses) - len(failed), "failed": len(failed)}
+        logger.info(f"Batch analysis completed: {report}")
+        return report
@@ -0,0 +1,157 @@
+import asyncio
+import functools
+import logging
+import os
+import time
+
+from service.company_data_sync import STATEMENT_TYPES, SyncCheckpoint
+from service.registry import get_async_fmp_client, get_company_data_sync_service
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# data_type → AsyncFmpClient / FirestoreService 메서드 이름
+FETCH_METHODS = {
+    "incomeStatements": "get_income_statement",
+    "balanceSheets": "get_balance_sheet",
+    "cashFlows": "get_cash_flow",
+    "incomeStatementsAsReported": "get_income_statement_as_reported",
+    "balanceSheetsAsReported": "get_balance_sheet_as_reported",
+    "cashFlowsAsReported": "get_cash_flow_as_reported",
+}
+STORE_METHODS = {
+    "incomeStatements": "store_incomestmt",
+    "balanceSheets": "store_balancesheet",
+    "cashFlows": "store_cashflow",
+    "incomeStatementsAsReported": "store_incomestmt_as_reported",
+    "balanceSheetsAsReported": "store_balancesheet_as_reported",
+    "cashFlowsAsReported": "store_cashflow_as_reported",
+}
+
+
+class AsyncCompanyDataSyncService:
+    """CompanyDataSyncService.sync_all과 company info scheduled sync의 asyncio 버전
+
+    FMP 요청은 event loop 하나에서 AsyncFmpClient의 semaphore만큼 동시에 보내고 (thread 수와 무관),
+    Firestore 읽기/쓰기는 asyncio.to_thread로 넘긴다. manifest/incremental limit, 재무제표 저장, checkpoint와
+    RunBudget은 CompanyDataSyncService의 코드를 그대로 쓴다.
+    """
+
+    def __init__(self, sync_service=None, fmp_client=None):
+        self.syncService = sync_service or get_company_data_sync_service()
+        self.firestore = self.syncService.firestore
+        self.taskStateService = self.syncService.taskStateService
+        self.fmpClient = fmp_client or get_async_fmp_client()
+        # 동시에 진행하는 symbol 수. symbol 하나가 FMP 요청 15개를 내므로 semaphore가 빌 틈이 없을 만큼 둔다
+        self.symbol_concurrency = int(os.getenv("SYNC_ASYNC_SYMBOLS", "32"))
+
+    async def sync_company_profile(self, symbol):
+        company_outlook, company_core_info = await asyncio.gather(
+            self.fmpClient.get_company_outlook(symbol),
+            self.fmpClient.get_company_core_info(symbol),
+        )
+        data = self.syncService.company_profile_data(symbol, company_outlook, company_core_info)
+        if data is None:
+            return
+        await asyncio.to_thread(self.firestore.store_company_profile, symbol, data)
+        logger.info(f"Company profile for {symbol} synced")
+
+    async def sync_quote(self, symbol):
+        quote = await self.fmpClient.get_quote(symbol)
+        if len(quote) == 0:
+            logger.error(f"Quote for {symbol} not found")
+            return
+        await asyncio.to_thread(self.firestore.store_quote, symbol, quote[0])
+        logger.info(f"Quote for {symbol} synced")
+
+    async def sync_statement(self, symbol, data_type, annual, full_refresh, manifest):
+        fetch = getattr(self.fmpClient, FETCH_METHODS[data_type])
+        store = getattr(self.firestore, STORE_METHODS[data_type])
+        scope, limit = self.syncService.statement_scope(manifest, annual, full_refresh)
+        statements = await fetch(symbol, annual, limit)
+        return await asyncio.to_thread(self.syncService.store_statements, symbol, statements, store, limit,
+                                       full_refresh, manifest, scope)
+
+    async def sync_financials(self, symbol, full_refresh=False):
+        manifests = await asyncio.to_thread(self.firestore.get_financial_manifests, symbol, STATEMENT_TYPES)
+
+        async def sync_type(data_type):
+            # annual/quarter는 같은 manifest 문서를 이어서 쓰므로 순서대로, 종류끼리는 동시에
+            for annual in [True, False]:
+                await self.sync_statement(symbol, data_type, annual, full_refresh, manifests[data_type])
+
+        await asyncio.gather(*(sync_type(data_type) for data_type in STATEMENT_TYPES))
+        await asyncio.to_thread(self.syncService.sync_fundamentals, symbol)
+        logger.info(f"Financials for {symbol} synced")
+
+    async def sync_all(self, symbol, full_refresh=False):
+        await asyncio.gather(
+            self.sync_company_profile(symbol),
+            self.sync_financials(symbol, full_refresh),
+            self.sync_quote(symbol),
+        )
+        logger.info(f"Data for {symbol} synced")
+
+    async def sync_all_companies_task(self, get_companies_func, sync_func, set_latest_func, budget=None):
+        """CompanyDataSyncService.sync_all_companies_task와 같은 sliding window를 event loop 위에서 돈다"""
+        symbols = await asyncio.to_thread(get_companies_func)
+
+        async def process_symbol(index):
+            started = time.monotonic()
+            await sync_func(symbols[index])
+            if budget is not None:
+                budget.record(time.monotonic() - started)
+
+        concurrency = self.symbol_concurrency
+        # checkpoint 저장은 몇 symbol마다 한 번이라 loop 안에서 바로 쓴다
+        checkpoint = SyncCheckpoint(symbols, set_latest_func, concurrency)
+        next_index = 0
+        error = None
+        out_of_time = False
+
+        pending = {}
+        while pending or (error is None and not out_of_time and next_index < len(symbols)):
+            while error is None and not out_of_time and next_index < len(symbols) and len(pending) < concurrency:
+                if budget is not None and not budget.can_admit():
+                    out_of_time = True
+                    logger.warning(f"Stopping before deadline with {len(symbols) - next_index} units left")
+                    break
+                pending[asyncio.create_task(process_symbol(next_index))] = next_index
+                next_index += 1
+            if not pending:
+                break
+
+            finished, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in finished:
+                index = pending.pop(task)
+                try:
+                    task.result()
+                    checkpoint.complete(index)
+                except Exception as e:
+                    # 실패한 symbol 이후로는 새 작업을 시작하지 않고, 다음 실행에서 이 symbol부터 다시 한다
+                    logger.error(f"Error syncing {symbols[index]}: {e}")
+                    error = error or e
+
+        checkpoint.save()
+        if error is not None:
+            raise error
+        return checkpoint.report(out_of_time, budget)
+
+    async def _sync_all_companies_info(self, budget, shard, shard_count):
+        try:
+            return await self.sync_all_companies_task(
+                functools.partial(self.taskStateService.get_update_company_info_companies, shard, shard_count),
+                self.sync_all,
+                functools.partial(self.taskStateService.set_latest_updated_company_info,
+                                  shard=shard, shard_count=shard_count),
+                budget=budget
+            )
+        finally:
+            await self.fmpClient.close()
+
+    def sync_all_companies_info(self, budget=None, shard=0, shard_count=1):
+        report = asyncio.run(self._sync_all_companies_info(budget, shard, shard_count))
+        logger.info("All companies info data synced")
+        return report
+
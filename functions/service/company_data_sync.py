@@ -1,8 +1,15 @@
+import functools
 import logging
 import os
+import time
+from datetime import datetime, timedelta
 
-from clients.fmp.fmpClient import FmpClient
-from service.firestore import FirestoreService
+from tenacity import before_sleep_log, retry, retry_if_exception_type, stop_after_attempt, wait_exponential
+
+from clients.fmp.fmpClient import STREAM_ERRORS
+from clients.fmp.jsonStream import JsonNotArrayError
+from service.analysis import AnalysisService
+from service.registry import get_firestore_service, get_fmp_client
 from service.task_state import TaskStateService
 import concurrent.futures
 
@@ -10,23 +17,91 @@ import concurrent.futures
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# streaming 중 body가 끊긴 재무제표를 요청부터 다시 받는 최대 횟수
+STATEMENT_STREAM_ATTEMPTS = 3
+# 재무제표 종류 (manifest data_type)
+STATEMENT_TYPES = ["incomeStatements", "balanceSheets", "cashFlows",
+                   "incomeStatementsAsReported", "balanceSheetsAsReported", "cashFlowsAsReported"]
+
+
+class SyncCheckpoint:
+    """unit은 순서대로 시작하지만 끝나는 순서는 제각각이므로, 앞에서부터 연속으로 끝난 unit까지만 checkpoint를 남긴다
+
+    units[:watermark]는 모두 완료됨 → checkpoint는 여기까지만 전진. every개가 더 끝날 때마다 set_latest_func을 부른다.
+    """
+
+    def __init__(self, units, set_latest_func, every, chunked=False):
+        self.units = units
+        self.set_latest_func = set_latest_func
+        self.every = every
+        self.chunked = chunked
+        self.completed = [False] * len(units)
+        self.watermark = 0
+        self.checkpointed = 0
+
+    def last_symbol(self, index):
+        return self.units[index][-1] if self.chunked else self.units[index]
+
+    def complete(self, index):
+        self.completed[index] = True
+        while self.watermark < len(self.units) and self.completed[self.watermark]:
+            self.watermark += 1
+        if self.watermark - self.checkpointed >= self.every:
+            self.save()
+
+    def save(self):
+        if self.watermark > self.checkpointed:
+            self.set_latest_func(self.last_symbol(self.watermark - 1))
+            self.checkpointed = self.watermark
+            logger.info(f"Checkpoint advanced to {self.last_symbol(self.watermark - 1)} "
+                        f"({self.watermark}/{len(self.units)})")
+
+    def report(self, out_of_time, budget=None) -> dict:
+        report = {"completedUnits": self.watermark, "totalUnits": len(self.units), "stoppedEarly": out_of_time}
+        if budget is not None:
+            report.update(budget.report())
+        logger.info(f"Sync run report: {report}")
+        return report
+
 
 class CompanyDataSyncService:
-    def __init__(self):
-        self.fmpClient = FmpClient(api_key=os.getenv("FMP_CLIENT_API_KEY"))
-        self.firestore = FirestoreService()
-        self.taskStateService = TaskStateService()
+    def __init__(self, fmp_client=None, firestore=None):
+        # client는 프로세스에서 공유하는 것을 쓴다 (service/registry.py)
+        self.fmpClient = fmp_client or get_fmp_client()
+        self.firestore = firestore or get_firestore_service()
+        self.analysisService = AnalysisService(self.firestore)
+        self.taskStateService = TaskStateService(self.firestore)
+        # incremental sync: 마지막 전체 sync 후 full_refresh_days 동안은 최근 period만 받는다
+        self.incremental = os.getenv("FMP_INCREMENTAL_SYNC", "true").lower() == "true"
+        self.incremental_annual_limit = int(os.getenv("FMP_INCREMENTAL_ANNUAL_LIMIT", "3"))
+        self.incremental_quarter_limit = int(os.getenv("FMP_INCREMENTAL_QUARTER_LIMIT", "8"))
+        self.full_refresh_days = int(os.getenv("FMP_FULL_REFRESH_DAYS", "90"))
+        self.sync_concurrency = int(os.getenv("SYNC_CONCURRENCY", "4"))
+        # 재무제표 응답을 전부 받기 전에 period 단위로 parse해서 바로 batch 저장으로 넘긴다
+        self.stream_statements = os.getenv("FMP_STREAM_STATEMENTS", "true").lower() == "true"
 
     def sync_company_profile(self, symbol):
-        company_profile = self.fmpClient.get_company_outlook(symbol).get("profile")
-        if company_profile is None:
+        company_outlook = self.fmpClient.get_company_outlook(symbol)
+        if company_outlook.get("profile") is None:
             logger.error(f"Company Profile for {symbol} not found")
             return
 
-        company_core_info = self.fmpClient.get_company_core_info(symbol)
+        data = self.company_profile_data(symbol, company_outlook, self.fmpClient.get_company_core_info(symbol))
+        if data is None:
+            return
+        self.firestore.store_company_profile(symbol, data)
+        logger.info(f"Company profile for {symbol} synced")
+
+    @staticmethod
+    def company_profile_data(symbol, company_outlook, company_core_info):
+        """company outlook + core info 응답 → profile 문서 (없으면 None)"""
+        company_profile = company_outlook.get("profile")
+        if company_profile is None:
+            logger.error(f"Company Profile for {symbol} not found")
+            return None
         if len(company_core_info) == 0:
             logger.error(f"Company Core Info for {symbol} not found")
-            return
+            return None
 
         data = {}
         data.update({
@@ -35,16 +110,7 @@ class CompanyDataSyncService:
             "sector": company_profile["sector"],
         })
         data.update(company_core_info[0])
-
-        self.firestore.store_company_profile(symbol, data)
-        logger.info(f"Company profile for {symbol} synced")
-
-    def add_company_profile(self, symbol, data):
-        if data is None:
-            logger.error(f"data to add to {symbol} is None")
-            return
-        self.firestore.store_company_profile(symbol, data)
-        logger.info(f"Company profile for {symbol} synced\n data: {data}")
+        return data
 
     def sync_quote(self, symbol):
         quote = self.fmpClient.get_quote(symbol)
@@ -54,95 +120,211 @@ class CompanyDataSyncService:
         self.firestore.store_quote(symbol, quote[0])
         logger.info(f"Quote for {symbol} synced")
 
-    def sync_incomstmt(self, symbol, annual=True):
-        incomestmts = self.fmpClient.get_income_statement(symbol, annual)
-        self.firestore.store_incomestmt(symbol, incomestmts)
+    def sync_quotes(self, symbols) -> int:
+        """symbol 목록의 quote를 받아 저장하고 실제로 저장한 symbol 수를 반환"""
+        quotes = self.fmpClient.get_quotes(symbols)
+        quotes_by_symbol = {quote["symbol"]: quote for quote in quotes}
+        for symbol in symbols:
+            if symbol not in quotes_by_symbol:
+                logger.error(f"Quote for {symbol} not found")
+        failed = self.firestore.store_quotes(quotes_by_symbol)
+        if failed:
+            logger.error(f"Failed to store quotes for {failed}")
+        stored = len(quotes_by_symbol) - len(failed)
+        logger.info(f"Quotes for {stored}/{len(symbols)} symbols synced")
+        return stored
+
+    def _incremental_limit(self, sync_state, annual):
+        """마지막 전체 sync 이후라면 최근 몇 개 period만 받도록 FMP limit을 돌려준다 (None이면 전체)"""
+        if not self.incremental or not sync_state.get("latestDate") or not sync_state.get("lastFullSync"):
+            return None
+        last_full_sync = datetime.fromisoformat(sync_state["lastFullSync"])
+        if datetime.now() - last_full_sync >= timedelta(days=self.full_refresh_days):
+            return None
+        return self.incremental_annual_limit if annual else self.incremental_quarter_limit
+
+    def statement_scope(self, manifest, annual, full_refresh):
+        """manifest의 sync 상태 → (scope, FMP limit). limit이 None이면 전체 period를 받는다"""
+        scope = "annual" if annual else "quarter"
+        limit = None if full_refresh else self._incremental_limit(manifest.get(scope) or {}, annual)
+        return scope, limit
+
+    def _sync_statement(self, symbol, data_type, fetch, store, annual, full_refresh, manifest=None):
+        if manifest is None:
+            manifest = self.firestore.get_financial_manifest(symbol, data_type)
+        scope, limit = self.statement_scope(manifest, annual, full_refresh)
+        return self._fetch_and_store(symbol, fetch, store, annual, limit, full_refresh, manifest, scope)
+
+    # body가 끊겨도 manifest는 모든 period를 저장한 뒤에만 쓰므로, 이미 쓴 period가 있어도 통째로 다시 하면 된다
+    @retry(retry=retry_if_exception_type(STREAM_ERRORS), stop=stop_after_attempt(STATEMENT_STREAM_ATTEMPTS),
+           wait=wait_exponential(multiplier=1, min=4, max=10), before_sleep=before_sleep_log(logger, logging.WARNING),
+           reraise=True)
+    def _fetch_and_store(self, symbol, fetch, store, annual, limit, full_refresh, manifest, scope):
+        statements = fetch(symbol, annual, limit, stream=self.stream_statements)
+        # streaming이면 download thread가 앞서 읽는 만큼(stream_prefetch)씩 commit해서 period가 batch에 쌓이지 않게 한다
+        batch_size = self.fmpClient.stream_prefetch if self.stream_statements else None
+        return self.store_statements(symbol, statements, store, limit, full_refresh, manifest, scope, batch_size)
+
+    def store_statements(self, symbol, statements, store, limit, full_refresh, manifest, scope, batch_size=None):
+        """FMP 응답을 저장하고 manifest의 scope(annual/quarter) sync 상태를 갱신한다"""
+        if statements is None or isinstance(statements, (dict, str)):
+            # 오류 응답 ({"Error Message": ...})은 빈 재무제표로 보고 sync 상태도 남기지 않는다
+            logger.error(f"Skipping {scope} statements of {symbol}: expected a list, got {str(statements)[:200]}")
+            return {"written": 0, "skipped": 0, "failed": 0}
+
+        # manifest는 period를 모두 저장한 뒤에 쓰이므로, streaming 중에 최신 period를 같은 dict에 채워 둔다
+        new_state = dict(manifest.get(scope) or {})
+        if limit is None:
+            new_state["lastFullSync"] = datetime.now().isoformat()
+
+        def track_latest(items):
+            for item in items:
+                date = item.get("date") if isinstance(item, dict) else None
+                if isinstance(date, str) and date >= new_state.get("latestDate", ""):
+                    new_state.update(latestDate=date, latestPeriod=item.get("period"))
+                yield item
+
+        try:
+            # full refresh면 manifest hash가 같아도 period 문서를 다시 써서 지워지거나 손상된 문서를 복구한다
+            return store(symbol, track_latest(statements), force=full_refresh, manifest=manifest,
+                         manifest_fields={scope: new_state}, batch_size=batch_size)
+        except JsonNotArrayError as e:
+            # streaming으로 받은 오류 응답도 buffered 때처럼 건너뛴다 (첫 원소 전에 나므로 저장된 period는 없다)
+            logger.error(f"Skipping {scope} statements of {symbol}: {e}")
+            return {"written": 0, "skipped": 0, "failed": 0}
+
+    def sync_incomstmt(self, symbol, annual=True, full_refresh=False, manifest=None):
+        self._sync_statement(symbol, "incomeStatements", self.fmpClient.get_income_statement,
+                             self.firestore.store_incomestmt, annual, full_refresh, manifest)
         logger.info(f"Income statements for {symbol} synced")
 
-    def sync_incomstmt_as_reported(self, symbol, annual=True):
-        incomestmts = self.fmpClient.get_income_statement_as_reported(symbol, annual)
-        self.firestore.store_incomestmt_as_reported(symbol, incomestmts)
+    def sync_incomstmt_as_reported(self, symbol, annual=True, full_refresh=False, manifest=None):
+        self._sync_statement(symbol, "incomeStatementsAsReported", self.fmpClient.get_income_statement_as_reported,
+                             self.firestore.store_incomestmt_as_reported, annual, full_refresh, manifest)
         logger.info(f"Income statements As Reported for {symbol} synced")
 
-    def sync_balancesheet(self, symbol, annual=True):
-        balancesheets = self.fmpClient.get_balance_sheet(symbol, annual)
-        self.firestore.store_balancesheet(symbol, balancesheets)
+    def sync_balancesheet(self, symbol, annual=True, full_refresh=False, manifest=None):
+        self._sync_statement(symbol, "balanceSheets", self.fmpClient.get_balance_sheet,
+                             self.firestore.store_balancesheet, annual, full_refresh, manifest)
         logger.info(f"Balance sheets for {symbol} synced")
 
-    def sync_balancesheet_as_reported(self, symbol, annual=True):
-        balancesheets = self.fmpClient.get_balance_sheet_as_reported(symbol, annual)
-        self.firestore.store_balancesheet_as_reported(symbol, balancesheets)
+    def sync_balancesheet_as_reported(self, symbol, annual=True, full_refresh=False, manifest=None):
+        self._sync_statement(symbol, "balanceSheetsAsReported", self.fmpClient.get_balance_sheet_as_reported,
+                             self.firestore.store_balancesheet_as_reported, annual, full_refresh, manifest)
         logger.info(f"Balance sheets As Reported for {symbol} synced")
 
-    def sync_cashflow(self, symbol, annual=True):
-        cashflows = self.fmpClient.get_cash_flow(symbol, annual)
-        self.firestore.store_cashflow(symbol, cashflows)
+    def sync_cashflow(self, symbol, annual=True, full_refresh=False, manifest=None):
+        self._sync_statement(symbol, "cashFlows", self.fmpClient.get_cash_flow,
+                             self.firestore.store_cashflow, annual, full_refresh, manifest)
         logger.info(f"Cash flows for {symbol} synced")
 
-    def sync_cashflow_as_reported(self, symbol, annual=True):
-        cashflows = self.fmpClient.get_cash_flow_as_reported(symbol, annual)
-        self.firestore.store_cashflow_as_reported(symbol, cashflows)
+    def sync_cashflow_as_reported(self, symbol, annual=True, full_refresh=False, manifest=None):
+        self._sync_statement(symbol, "cashFlowsAsReported", self.fmpClient.get_cash_flow_as_reported,
+                             self.firestore.store_cashflow_as_reported, annual, full_refresh, manifest)
         logger.info(f"Cash flows As Reported for {symbol} synced")
 
-    def sync_all(self, symbol):
+    def sync_all(self, symbol, full_refresh=False):
         self.sync_company_profile(symbol)
-        self.sync_financials(symbol)
+        self.sync_financials(symbol, full_refresh)
         self.sync_quote(symbol)
         logger.info(f"Data for {symbol} synced")
 
-    def sync_financials(self, symbol):
-        self.sync_incomstmt(symbol)
-        self.sync_balancesheet(symbol)
-        self.sync_cashflow(symbol)
-        self.sync_incomstmt(symbol, annual=False)
-        self.sync_balancesheet(symbol, annual=False)
-        self.sync_cashflow(symbol, annual=False)
-        self.sync_incomstmt_as_reported(symbol)
-        self.sync_balancesheet_as_reported(symbol)
-        self.sync_cashflow_as_reported(symbol)
-        self.sync_incomstmt_as_reported(symbol, annual=False)
-        self.sync_balancesheet_as_reported(symbol, annual=False)
-        self.sync_cashflow_as_reported(symbol, annual=False)
+    def sync_financials(self, symbol, full_refresh=False):
+        statement_syncs = [
+            ("incomeStatements", self.sync_incomstmt),
+            ("balanceSheets", self.sync_balancesheet),
+            ("cashFlows", self.sync_cashflow),
+            ("incomeStatementsAsReported", self.sync_incomstmt_as_reported),
+            ("balanceSheetsAsReported", self.sync_balancesheet_as_reported),
+            ("cashFlowsAsReported", self.sync_cashflow_as_reported),
+        ]
+        # 6종류 manifest를 한 번에 읽고, annual/quarter sync는 같은 manifest를 이어서 쓴다
+        manifests = self.firestore.get_financial_manifests(symbol, STATEMENT_TYPES)
+        for annual in [True, False]:
+            for data_type, sync in statement_syncs:
+                sync(symbol, annual, full_refresh, manifests[data_type])
+        self.sync_fundamentals(symbol)
         logger.info(f"Financials for {symbol} synced")
 
-    def sync_all_companies_task(self, get_companies_func, sync_func, set_latest_func):
+    def sync_fundamentals(self, symbol):
+        """저장된 재무제표로 분석용 fundamentals summary 문서를 다시 만든다"""
+        fundamentals = self.analysisService.build_fundamentals(symbol)
+        self.firestore.store_fundamentals(symbol, fundamentals)
+        # quote trigger가 summary를 읽지 않고도 재무 데이터 변경 여부를 알 수 있도록 profile에 version을 남긴다
+        self.firestore.store_company_profile(symbol, {"fundamentalsVersion": fundamentals["version"]})
+        logger.info(f"Fundamentals summary for {symbol} synced")
+
+    def sync_all_companies_task(self, get_companies_func, sync_func, set_latest_func, chunk_size=None, budget=None):
+        """budget(RunBudget)이 주어지면 timeout 전에 끝낼 수 없는 작업은 시작하지 않고 checkpoint만 남긴다"""
         companies = get_companies_func()
 
-        def process_symbol(symbol):
-            """sync_all 작업"""
-            sync_func(symbol)
-            return symbol  # 처리 완료된 symbol 반환
+        # chunk_size가 주어지면 sync_func은 symbol 대신 symbol 목록(chunk)을 받는다
+        if chunk_size:
+            units = [companies[i:i + chunk_size] for i in range(0, len(companies), chunk_size)]
+        else:
+            units = companies
 
-        # 4개씩 처리
-        batch_size = 4
-        for i in range(0, len(companies), batch_size):
-            batch = companies[i:i + batch_size]  # 4개씩 추출
+        def process_unit(unit):
+            started = time.monotonic()
+            sync_func(unit)
+            if budget is not None:
+                budget.record(time.monotonic() - started, len(unit) if chunk_size else 1)
 
-            with concurrent.futures.ThreadPoolExecutor(max_workers=batch_size) as executor:
-                # batch의 symbol을 병렬로 처리
-                futures = [executor.submit(process_symbol, symbol) for symbol in batch]
+        # worker가 하나라도 비면 바로 다음 symbol을 시작한다 (batch 단위로 기다리지 않음)
+        concurrency = self.sync_concurrency
+        checkpoint = SyncCheckpoint(units, set_latest_func, concurrency, chunked=bool(chunk_size))
+        next_index = 0
+        error = None
+        out_of_time = False
 
-                # 모든 작업 완료 대기 및 결과 수집
-                results = [future.result() for future in concurrent.futures.as_completed(futures)]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as executor:
+            pending = {}
+            while pending or (error is None and not out_of_time and next_index < len(units)):
+                while error is None and not out_of_time and next_index < len(units) and len(pending) < concurrency:
+                    if budget is not None and not budget.can_admit():
+                        out_of_time = True
+                        logger.warning(f"Stopping before deadline with {len(units) - next_index} units left")
+                        break
+                    pending[executor.submit(process_unit, units[next_index])] = next_index
+                    next_index += 1
+                if not pending:
+                    break
 
-            # 가장 뒤에 있는 symbol (정렬 기준에 따라 results[-1])
-            last_symbol = batch[-1]  # batch의 마지막 symbol 사용
-            set_latest_func(last_symbol)
+                finished, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in finished:
+                    index = pending.pop(future)
+                    try:
+                        future.result()
+                        checkpoint.complete(index)
+                    except Exception as e:
+                        # 실패한 symbol 이후로는 새 작업을 시작하지 않고, 다음 실행에서 이 symbol부터 다시 한다
+                        logger.error(f"Error syncing {units[index]}: {e}")
+                        error = error or e
 
-            logger.info(f"Batch completed: {batch}, updated with last symbol: {last_symbol}")
+        checkpoint.save()
+        if error is not None:
+            raise error
+        return checkpoint.report(out_of_time, budget)
 
-    def sync_all_companies_info(self):
-        self.sync_all_companies_task(
-            self.taskStateService.get_update_company_info_companies,
+    def sync_all_companies_info(self, budget=None, shard=0, shard_count=1):
+        report = self.sync_all_companies_task(
+            functools.partial(self.taskStateService.get_update_company_info_companies, shard, shard_count),
             self.sync_all,
-            self.taskStateService.set_latest_updated_company_info
+            functools.partial(self.taskStateService.set_latest_updated_company_info,
+                              shard=shard, shard_count=shard_count),
+            budget=budget
         )
         logger.info("All companies info data synced")
+        return report
 
-    def sync_all_companies_quotes(self):
-        self.sync_all_companies_task(
-            self.taskStateService.get_update_company_quotes_companies,
-            self.sync_quote,
-            self.taskStateService.set_latest_updated_company_quote
+    def sync_all_companies_quotes(self, budget=None, shard=0, shard_count=1):
+        report = self.sync_all_companies_task(
+            functools.partial(self.taskStateService.get_update_company_quotes_companies, shard, shard_count),
+            self.sync_quotes,
+            functools.partial(self.taskStateService.set_latest_updated_company_quote,
+                              shard=shard, shard_count=shard_count),
+            chunk_size=self.fmpClient.quote_chunk_size,
+            budget=budget
         )
         logger.info("All companies quotes data synced")
+        return report
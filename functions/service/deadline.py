@@ -0,0 +1,55 @@
+import threading
+import time
+
+
+class RunBudget:
+    """scheduled 실행에 남은 시간을 추적해서 새 작업을 시작해도 되는지 판단한다
+
+    작업 하나가 끝날 때마다 record()로 걸린 시간을 남기면, 평균 소요 시간(EWMA)과 safety_margin을 더해도
+    timeout 전에 끝날 수 있을 때만 can_admit()이 True를 돌려준다.
+    """
+
+    def __init__(self, timeout_sec, safety_margin_sec=30, smoothing=0.2):
+        self.timeout_sec = timeout_sec
+        self.safety_margin_sec = safety_margin_sec
+        self.smoothing = smoothing
+        self.started = time.monotonic()
+        self.deadline = self.started + timeout_sec
+        self.lock = threading.Lock()
+
+        self.completed_units = 0
+        self.completed_symbols = 0
+        self.avg_unit_seconds = None
+
+    def record(self, seconds, symbols=1):
+        with self.lock:
+            self.completed_units += 1
+            self.completed_symbols += symbols
+            if self.avg_unit_seconds is None:
+                self.avg_unit_seconds = seconds
+            else:
+                self.avg_unit_seconds += self.smoothing * (seconds - self.avg_unit_seconds)
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+
+    def remaining(self) -> float:
+        return self.deadline - time.monotonic()
+
+    def can_admit(self) -> bool:
+        with self.lock:
+            expected = self.avg_unit_seconds or 0.0
+        return self.remaining() > expected + self.safety_margin_sec
+
+    def report(self) -> dict:
+        with self.lock:
+            elapsed = self.elapsed()
+            symbols_per_sec = self.completed_symbols / elapsed if elapsed > 0 else 0.0
+            return {
+                "completedSymbols": self.completed_symbols,
+                "elapsedSeconds": round(elapsed, 1),
+                "avgUnitSeconds": round(self.avg_unit_seconds or 0.0, 3),
+                "symbolsPerSecond": round(symbols_per_sec, 3),
+                # 같은 속도라면 timeout(안전 여유 제외) 동안 처리할 수 있는 symbol 수
+                "projectedSymbolsPerRun": int(symbols_per_sec * (self.timeout_sec - self.safety_margin_sec)),
+            }
@@ -1,30 +1,189 @@
+import hashlib
+import json
 import logging
-import concurrent.futures
-from google.cloud import firestore
+import os
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime
 
+from metrics import collection_pattern, metrics
+from service.storage import get_storage_backend
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Firestore commit 한 번에 들어갈 수 있는 최대 write 수 / 요청 크기(10MiB)보다 약간 작은 값
+MAX_BATCH_WRITES = 500
+MAX_BATCH_BYTES = 9 * 1024 * 1024
+
+
+class ReadCache:
+    """하나의 요청(invocation) 동안 document path별 읽기 결과를 기억하는 cache"""
 
-class FirestoreService:
     def __init__(self):
-        # Initialize Firestore client
-        self.db = firestore.Client()
-        logger.info("Initialized Firestore client")
+        self.documents = {}
+        self.reads = 0  # 실제로 Firestore에서 읽은 document 수
+        self.hits = 0  # cache에서 바로 돌려준 document 수
+
+    def stats(self) -> dict:
+        lookups = self.reads + self.hits
+        return {
+            "reads": self.reads,
+            "hits": self.hits,
+            "hitRate": round(self.hits / lookups, 3) if lookups else 0.0,
+        }
+
+
+# thread/요청마다 따로 잡히도록 ContextVar에 둔다
+_read_cache = ContextVar("firestore_read_cache", default=None)
+
+
+class FirestoreService:
+    def __init__(self, backend=None):
+        # 실제 저장소 (STORAGE_BACKEND: firestore | memory | sqlite)
+        self.backend = backend or get_storage_backend()
+        self.batch_size = min(int(os.getenv("FIRESTORE_BATCH_SIZE", str(MAX_BATCH_WRITES))), MAX_BATCH_WRITES)
+        logger.info(f"Initialized {self.backend.name} storage backend")
+
+    @contextmanager
+    def read_cache(self):
+        """with 블록 안에서는 같은 document를 한 번만 읽는다. 읽기 통계를 담은 ReadCache를 넘겨준다
+
+        이미 열린 cache가 있으면 그 cache를 그대로 쓴다.
+        """
+        if _read_cache.get() is not None:
+            yield _read_cache.get()
+            return
+        cache = ReadCache()
+        token = _read_cache.set(cache)
+        try:
+            yield cache
+        finally:
+            _read_cache.reset(token)
+
+    def _invalidate_cached(self, path):
+        cache = _read_cache.get()
+        if cache is not None:
+            cache.documents.pop(path, None)
+
+    @staticmethod
+    def _timed(operation, paths):
+        """backend 호출 하나의 시간을 "operation collection pattern"별로 기록하고 document 수를 센다"""
+        key = f"{operation} {','.join(sorted({collection_pattern(path) for path in paths}))}"
+        metrics.increment("firestoreDocuments", key, len(paths))
+        return metrics.timer("firestore", key)
+
+    def _stream(self, collection_path, fields=None, filters=()) -> dict:
+        key = f"stream {collection_pattern(f'{collection_path}/*')}"
+        with metrics.timer("firestore", key):
+            documents = self.backend.stream(collection_path, fields, filters)
+        metrics.increment("firestoreDocuments", key, len(documents))
+        return documents
 
     def _get_document(self, collection_path, document_id):
-        logger.info(f"Fetching document from {collection_path}/{document_id}")
-        return self.db.collection(collection_path).document(document_id).get().to_dict()
+        path = f"{collection_path}/{document_id}"
+        cache = _read_cache.get()
+        if cache is not None and path in cache.documents:
+            cache.hits += 1
+            return cache.documents[path]
+
+        logger.debug(f"Fetching document from {path}")
+        with self._timed("get", [path]):
+            document = self.backend.get(path)
+        if cache is not None:
+            cache.reads += 1
+            cache.documents[path] = document
+        return document
+
+    def get_many(self, paths) -> dict:
+        """document path 목록을 get_all로 한 번에 읽어 {path: dict 또는 None}으로 반환"""
+        paths = list(dict.fromkeys(paths))
+        cache = _read_cache.get()
+        documents = {}
+        if cache is not None:
+            for path in paths:
+                if path in cache.documents:
+                    documents[path] = cache.documents[path]
+            cache.hits += len(documents)
+
+        missing = [path for path in paths if path not in documents]
+        if missing:
+            logger.info(f"Fetching {len(missing)} documents")
+            with self._timed("get_all", missing):
+                documents.update(self.backend.get_many(missing))
+            if cache is not None:
+                cache.reads += len(missing)
+                cache.documents.update((path, documents[path]) for path in missing)
+        return documents
+
+    def _stream_collection(self, collection_path) -> list:
+        logger.info(f"Streaming documents from {collection_path}")
+        return list(self._stream(collection_path).values())
 
     def _store_document(self, collection_path, document_id, data):
-        doc_ref = self.db.collection(collection_path).document(document_id)
-        doc_ref.set(
-            document_data=data,
-            merge=True
-        )
-        logger.info(f"Stored document in {collection_path}/{document_id}")
+        self._invalidate_cached(f"{collection_path}/{document_id}")
+        path = f"{collection_path}/{document_id}"
+        with self._timed("set", [path]):
+            self.backend.set(path, data)
+        logger.debug(f"Stored document in {path}")
+
+    def _store_documents(self, documents, batch_size=None) -> list:
+        """(document_path, data) 목록을 WriteBatch로 나눠 merge 저장하고, 저장에 실패한 document_path 목록을 반환
+
+        batch는 write 수(batch_size, 기본값 self.batch_size)와 요청 크기 제한에 맞춰 자동으로 나눈다.
+        batch commit이 실패하면 해당 batch만 한 건씩 다시 써서 어떤 document가 실패했는지 남긴다.
+        """
+        batch_size = min(batch_size or self.batch_size, self.batch_size)
+        failed = []
+        written = 0
+        chunk = []
+        chunk_bytes = 0
+
+        def commit(chunk):
+            try:
+                with self._timed("commit", [document_path for document_path, _ in chunk]):
+                    self.backend.commit(chunk)
+                return len(chunk)
+            except Exception as e:
+                logger.warning(f"Batch commit of {len(chunk)} documents failed ({e}), retrying one by one")
+
+            stored = 0
+            for document_path, data in chunk:
+                try:
+                    with self._timed("set", [document_path]):
+                        self.backend.set(document_path, data)
+                    stored += 1
+                except Exception as e:
+                    logger.error(f"Error storing document {document_path}: {e}")
+                    failed.append(document_path)
+            return stored
+
+        for document_path, data in documents:
+            self._invalidate_cached(document_path)
+            size = len(json.dumps(data, default=str))
+            if chunk and (len(chunk) >= batch_size or chunk_bytes + size > MAX_BATCH_BYTES):
+                written += commit(chunk)
+                chunk, chunk_bytes = [], 0
+            chunk.append((document_path, data))
+            chunk_bytes += size
+        if chunk:
+            written += commit(chunk)
+
+        logger.info(f"Stored {written} documents in batches ({len(failed)} failed)")
+        return failed
+
+    def update_documents_transactionally(self, paths, update) -> dict:
+        """paths를 transaction 안에서 읽어 update({path: dict 또는 None})가 돌려준 {path: data}만 덮어쓴다
+
+        다른 instance가 동시에 같은 문서를 바꾸면 transaction이 처음부터 다시 실행되므로 update는 부작용이 없어야 한다.
+        """
+        with self._timed("transaction", paths):
+            changes = self.backend.transaction(paths, update)
+        for path in changes:
+            self._invalidate_cached(path)
+        logger.info(f"Updated {len(changes)} of {len(paths)} documents in a transaction")
+        return changes
 
     def get_task_state(self, task_name):
         return self._get_document("task_state", task_name)
@@ -39,81 +198,189 @@ class FirestoreService:
         date_str = datetime.today().date().strftime("%Y-%m-%d")
         return self._get_document(f"companies/{symbol}/quotes", date_str)
 
-    def _get_financial(self, symbol, data_type, year, period):
-        return self._get_document(f"companies/{symbol}/financials/{data_type}/periods", f"{year}-{period}")
+    def get_latest_quote(self, symbol):
+        """가장 최근에 저장한 quote (quoteDate에 저장한 날짜). 주말/휴장일에도 마지막 거래일 quote가 남아 있다"""
+        return self._get_document(f"companies/{symbol}/summary", "quote")
+
+    def _get_financials(self, symbol, data_type, period_ids) -> list:
+        """period_id("{year}-{period}") 목록의 문서를 한 번에 읽어 같은 순서의 목록으로 반환 (없으면 None)"""
+        collection_path = f"companies/{symbol}/financials/{data_type}/periods"
+        paths = [f"{collection_path}/{period_id}" for period_id in period_ids]
+        documents = self.get_many(paths)
+        return [documents[path] for path in paths]
+
+    def get_financial_periods(self, symbol, data_type) -> list:
+        return self._stream_collection(f"companies/{symbol}/financials/{data_type}/periods")
+
+    def get_incomestmts(self, symbol, period_ids):
+        return self._get_financials(symbol, "incomeStatements", period_ids)
+
+    def get_balancesheets(self, symbol, period_ids):
+        return self._get_financials(symbol, "balanceSheets", period_ids)
 
-    def get_incomestmt(self, symbol, year, period):
-        return self._get_financial(symbol, "incomeStatements", year, period)
+    def get_cashflows(self, symbol, period_ids):
+        return self._get_financials(symbol, "cashFlows", period_ids)
 
-    def get_balancesheet(self, symbol, year, period):
-        return self._get_financial(symbol, "balanceSheets", year, period)
+    def get_fundamentals(self, symbol):
+        return self._get_document(f"companies/{symbol}/summary", "fundamentals")
 
-    def get_cashflow(self, symbol, year, period):
-        return self._get_financial(symbol, "cashFlows", year, period)
+    def store_fundamentals(self, symbol, data):
+        self._store_document(f"companies/{symbol}/summary", "fundamentals", data)
+
+    def stream_company_profiles(self, fields, updated_after=None) -> dict:
+        """companies 컬렉션에서 fields만 읽어 {symbol: profile}로 반환. updated_after가 있으면 그 이후 분석된 것만"""
+        filters = [("analysisUpdatedAt", ">", updated_after)] if updated_after is not None else []
+        logger.info(f"Streaming company profiles updated after {updated_after}")
+        return self._stream("companies", fields, filters)
 
     def store_company_profile(self, symbol, data):
         self._store_document("companies", symbol, data)
 
+    @staticmethod
+    def _company_symbol(document_path):
+        """companies/{symbol}/{collection}/{id} → symbol ("/"가 들어간 AKO/A 같은 symbol도 그대로)"""
+        return document_path[len("companies/"):].rsplit("/", 2)[0]
+
+    @staticmethod
+    def _quote_documents(symbol, quote, date_str):
+        """날짜별 quote 문서와 최신 quote 문서 (summary/quote는 quote trigger 경로가 아니므로 분석을 다시 돌리지 않는다)"""
+        yield f"companies/{symbol}/quotes/{date_str}", quote
+        yield f"companies/{symbol}/summary/quote", {**quote, "quoteDate": date_str}
+
     def store_quote(self, symbol, data):
         date_str = datetime.today().date().strftime("%Y-%m-%d")
-        self._store_document(f"companies/{symbol}/quotes", date_str, data)
+        documents = list(self._quote_documents(symbol, data, date_str))
+        for document_path, _ in documents:
+            self._invalidate_cached(document_path)
+        # 두 문서를 한 batch로 써서 최신 quote가 날짜별 quote와 어긋나지 않게 한다
+        with self._timed("commit", [document_path for document_path, _ in documents]):
+            self.backend.commit(documents)
+
+    def store_quotes(self, quotes) -> list:
+        """{symbol: quote}를 batch로 저장하고 저장에 실패한 symbol 목록을 반환"""
+        date_str = datetime.today().date().strftime("%Y-%m-%d")
+        documents = (document for symbol, quote in quotes.items()
+                     for document in self._quote_documents(symbol, quote, date_str))
+        failed = self._store_documents(documents)
+        return list(dict.fromkeys(self._company_symbol(document_path) for document_path in failed))
 
     def store_analysis(self, symbol, data):
         date_str = datetime.today().date().strftime("%Y-%m-%d")
         self._store_document(f"companies/{symbol}/analysis", date_str, data)
 
-    def _store_financial(self, symbol, data_type, data_list):
-        def process_item(item):
-            """각 item을 처리하는 작업"""
-            year = item.get("calendarYear")
-            period = item.get("period")
-
-            if not year:
-                date = item.get("date")
-                year = datetime.strptime(date, "%Y-%m-%d").year
-
-            if not year or not period:
-                logger.warning(f"Skipping item with missing year or period: {item}")
-                return
-
-            self._store_document(
-                f"companies/{symbol}/financials/{data_type}/periods",
-                f"{year}-{period}",
-                item
-            )
-
-        # ThreadPoolExecutor를 사용하여 병렬 처리
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            # 각 item에 대해 process_item 함수를 병렬로 실행
-            futures = [executor.submit(process_item, item) for item in data_list]
-
-            # 완료된 작업 확인 (선택적)
-            for future in concurrent.futures.as_completed(futures):
+    def store_analyses(self, analyses) -> list:
+        """{symbol: analysis}를 batch로 저장하고 저장에 실패한 symbol 목록을 반환"""
+        date_str = datetime.today().date().strftime("%Y-%m-%d")
+        documents = ((f"companies/{symbol}/analysis/{date_str}", data) for symbol, data in analyses.items())
+        failed = self._store_documents(documents)
+        return [self._company_symbol(document_path) for document_path in failed]
+
+    def store_leaderboards(self, boards) -> list:
+        """(board path, board) 목록을 batch로 저장하고 저장에 실패한 path 목록을 반환"""
+        return self._store_documents(boards)
+
+    @staticmethod
+    def _period_id(item):
+        year = item.get("calendarYear")
+        period = item.get("period")
+
+        if not year:
+            date = item.get("date")
+            year = datetime.strptime(date, "%Y-%m-%d").year if date else None
+
+        if not year or not period:
+            return None
+        return f"{year}-{period}"
+
+    @staticmethod
+    def content_hash(item):
+        payload = json.dumps(item, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+    def get_financial_manifests(self, symbol, data_types) -> dict:
+        paths = {data_type: f"companies/{symbol}/financials/{data_type}" for data_type in data_types}
+        documents = self.get_many(paths.values())
+        return {data_type: documents[path] or {} for data_type, path in paths.items()}
+
+    def get_financial_manifest(self, symbol, data_type):
+        """companies/{symbol}/financials/{data_type} 문서에 period별 content hash를 모아 둔다"""
+        return self._get_document(f"companies/{symbol}/financials", data_type) or {}
+
+    def _store_financial(self, symbol, data_type, data_list, force=False, manifest=None, manifest_fields=None,
+                         batch_size=None) -> dict:
+        """새로 생겼거나 내용이 바뀐 period만 저장한다. force=True면 hash와 상관없이 모두 저장
+
+        manifest에는 미리 읽어 둔 manifest를 넘길 수 있고, manifest_fields는 manifest 문서에 함께 저장된다.
+        data_list가 streaming iterator면 batch_size를 작게 줘서 period가 batch에 오래 쌓여 있지 않게 한다.
+        """
+        collection_path = f"companies/{symbol}/financials/{data_type}/periods"
+        if data_list is None or isinstance(data_list, (dict, str)):
+            # FMP는 오류를 {"Error Message": ...} 같은 객체로 돌려준다. 빈 재무제표로 보고 manifest도 건드리지 않는다
+            logger.error(f"{collection_path}: expected a list of periods, got {str(data_list)[:200]}")
+            return {"written": 0, "skipped": 0, "failed": 0}
+        if manifest is None:
+            manifest = self.get_financial_manifest(symbol, data_type)
+        stored_hashes = manifest.get("periodHashes", {})
+        changed_hashes = {}
+        skipped = 0
+        invalid = 0
+
+        def to_documents():
+            nonlocal skipped, invalid
+            for item in data_list:
+                # item 하나가 잘못돼도 (날짜 형식, dict가 아닌 원소 등) 나머지 period는 저장한다
                 try:
-                    future.result()  # 작업 결과를 확인 (필요시)
+                    period_id = self._period_id(item)
+                    content_hash = self.content_hash(item) if period_id is not None else None
                 except Exception as e:
-                    logger.error(f"Error processing item: {e}")
+                    logger.error(f"Error processing item: {e} {str(item)[:200]}")
+                    invalid += 1
+                    continue
+                if period_id is None:
+                    logger.warning(f"Skipping item with missing year or period: {item}")
+                    continue
+                if not force and stored_hashes.get(period_id) == content_hash:
+                    skipped += 1
+                    continue
+                changed_hashes[period_id] = content_hash
+                yield f"{collection_path}/{period_id}", item
+
+        failed = self._store_documents(to_documents(), batch_size)
+        for document_path in failed:
+            changed_hashes.pop(document_path.rsplit("/", 1)[-1], None)
+        if changed_hashes or manifest_fields:
+            manifest_update = {"periodHashes": {**stored_hashes, **changed_hashes}, **(manifest_fields or {})}
+            self._store_document(f"companies/{symbol}/financials", data_type, manifest_update)
+            # 같은 manifest로 다음 저장(annual → quarter)을 이어서 할 수 있도록 갱신해 둔다
+            manifest.update(manifest_update)
+
+        stats = {"written": len(changed_hashes), "skipped": skipped, "failed": len(failed) + invalid}
+        # 실제로 쓴/변경이 없어 건너뛴 period 수는 invocation summary의 counter로 남긴다
+        for key, value in stats.items():
+            metrics.increment("financialPeriods", key, value)
+        logger.info(f"{collection_path}: {stats}")
+        return stats
 
-    def _store_financial_as_reported(self, symbol, data_type, data_list):
-        self._store_financial(symbol, f"{data_type}AsReported", data_list)
+    def _store_financial_as_reported(self, symbol, data_type, data_list, **options):
+        return self._store_financial(symbol, f"{data_type}AsReported", data_list, **options)
 
-    def _store_financial_refined(self, symbol, data_type, data_list):
-        self._store_financial(symbol, f"{data_type}", data_list)
+    def _store_financial_refined(self, symbol, data_type, data_list, **options):
+        return self._store_financial(symbol, f"{data_type}", data_list, **options)
 
-    def store_incomestmt(self, symbol, data_list):
-        self._store_financial_refined(symbol, "incomeStatements", data_list)
+    def store_incomestmt(self, symbol, data_list, **options):
+        return self._store_financial_refined(symbol, "incomeStatements", data_list, **options)
 
-    def store_incomestmt_as_reported(self, symbol, data_list):
-        self._store_financial_as_reported(symbol, "incomeStatements", data_list)
+    def store_incomestmt_as_reported(self, symbol, data_list, **options):
+        return self._store_financial_as_reported(symbol, "incomeStatements", data_list, **options)
 
-    def store_balancesheet(self, symbol, data_list):
-        self._store_financial_refined(symbol, "balanceSheets", data_list)
+    def store_balancesheet(self, symbol, data_list, **options):
+        return self._store_financial_refined(symbol, "balanceSheets", data_list, **options)
 
-    def store_balancesheet_as_reported(self, symbol, data_list):
-        self._store_financial_as_reported(symbol, "balanceSheets", data_list)
+    def store_balancesheet_as_reported(self, symbol, data_list, **options):
+        return self._store_financial_as_reported(symbol, "balanceSheets", data_list, **options)
 
-    def store_cashflow(self, symbol, data_list):
-        self._store_financial_refined(symbol, "cashFlows", data_list)
+    def store_cashflow(self, symbol, data_list, **options):
+        return self._store_financial_refined(symbol, "cashFlows", data_list, **options)
 
-    def store_cashflow_as_reported(self, symbol, data_list):
-        self._store_financial_as_reported(symbol, "cashFlows", data_list)
+    def store_cashflow_as_reported(self, symbol, data_list, **options):
+        return self._store_financial_as_reported(symbol, "cashFlows", data_list, **options)
@@ -0,0 +1,149 @@
+import logging
+import math
+import os
+from datetime import datetime, timedelta, timezone
+
+from service.registry import get_firestore_service
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# metric → 정렬 방향. PER/PBR은 낮을수록 위이고 0 이하(적자/자본잠식)는 순위에서 뺀다
+LEADERBOARDS = {
+    "annualNcavRatio": {"descending": True, "positive_only": False},
+    "roi": {"descending": True, "positive_only": False},
+    "per": {"descending": False, "positive_only": True},
+    "pbr": {"descending": False, "positive_only": True},
+}
+NCAV_MISSING = -1  # AnalysisService.get_ncav가 재무제표가 없을 때 쓰는 값
+# board 갱신 watermark를 저장하는 task state 이름
+TASK_NAME = "leaderboards"
+# 갱신 사이에 commit된 분석을 놓치지 않도록 조금 겹쳐서 다시 읽는다 (같은 값을 다시 반영해도 결과는 같다)
+REFRESH_OVERLAP_SEC = 60
+PROFILE_FIELDS = list(LEADERBOARDS) + ["sector"]
+
+
+def _qualifies(metric, value):
+    if not isinstance(value, (int, float)) or isinstance(value, bool) or math.isnan(value):
+        return False
+    if metric == "annualNcavRatio" and value == NCAV_MISSING:
+        return False
+    return value > 0 or not LEADERBOARDS[metric]["positive_only"]
+
+
+def _sort_entries(metric, entries):
+    sign = -1 if LEADERBOARDS[metric]["descending"] else 1
+    entries.sort(key=lambda entry: (sign * entry["value"], entry["symbol"]))
+    return entries
+
+
+def _scopes(sector):
+    """전체 board(None)와, sector가 있으면 sector board"""
+    return (None, sector) if sector else (None,)
+
+
+def apply_entry(metric, entries, symbol, value, capacity):
+    """board entries에 symbol의 새 값을 반영한 목록을 반환 (순위가 바뀌지 않으면 None)"""
+    entries = entries or []
+    updated = [entry for entry in entries if entry["symbol"] != symbol]
+    if _qualifies(metric, value):
+        candidate = {"symbol": symbol, "value": value}
+        if len(updated) < capacity or _sort_entries(metric, [updated[-1], candidate])[0] is candidate:
+            updated.append(candidate)
+            _sort_entries(metric, updated)
+            del updated[capacity:]
+    return None if updated == entries else updated
+
+
+class LeaderboardService:
+    """metric별 top-N 순위를 전체/sector별 문서 하나로 유지한다
+
+    leaderboards/{metric}, leaderboards/{metric}/sectors/{sector}
+    문서에는 size + reserve개를 들고 있어 순위 안의 company 몇 개가 빠져도 상위 size개는 유지된다.
+    """
+
+    def __init__(self, firestore=None, size=None, reserve=None):
+        self.firestore = firestore or get_firestore_service()
+        self.size = size or int(os.getenv("LEADERBOARD_SIZE", "100"))
+        self.reserve = reserve if reserve is not None else int(os.getenv("LEADERBOARD_RESERVE", "50"))
+
+    @property
+    def capacity(self):
+        return self.size + self.reserve
+
+    @staticmethod
+    def board_path(metric, sector=None):
+        if not sector:
+            return f"leaderboards/{metric}"
+        return f"leaderboards/{metric}/sectors/{sector.replace('/', '-')}"
+
+    def _board(self, metric, sector, entries):
+        return {
+            "metric": metric,
+            "sector": sector,
+            "descending": LEADERBOARDS[metric]["descending"],
+            "size": self.size,
+            "entries": entries,
+            "updatedAt": datetime.now(),
+        }
+
+    def _changes(self, profiles, boards) -> dict:
+        """{symbol: profile}을 board마다 차례로 반영하고, 바뀐 board만 {path: board}로 반환"""
+        entries_by_board = {}
+        for symbol, profile in profiles.items():
+            for metric in LEADERBOARDS:
+                for board_sector in _scopes(profile.get("sector")):
+                    key = (metric, board_sector)
+                    current = entries_by_board.get(key, (boards.get(self.board_path(*key)) or {}).get("entries"))
+                    entries = apply_entry(metric, current, symbol, profile.get(metric), self.capacity)
+                    if entries is not None:
+                        entries_by_board[key] = entries
+        return {self.board_path(metric, sector): self._board(metric, sector, entries)
+                for (metric, sector), entries in entries_by_board.items()}
+
+    def apply_updates(self, profiles) -> list:
+        """바뀐 company profile들을 transaction 하나로 board에 반영하고 바뀐 board path 목록을 반환
+
+        analysis trigger마다 같은 board 문서를 transaction으로 쓰면 문서당 쓰기 한도를 넘으므로,
+        refresh()가 모아 둔 변경을 board마다 한 번만 쓴다.
+        """
+        if not profiles:
+            return []
+        sectors = sorted({profile.get("sector") for profile in profiles.values() if profile.get("sector")})
+        paths = [self.board_path(metric, board_sector) for metric in LEADERBOARDS for board_sector in (None, *sectors)]
+        changes = self.firestore.update_documents_transactionally(paths, lambda boards: self._changes(profiles, boards))
+        logger.info(f"Leaderboards updated from {len(profiles)} profiles: {sorted(changes)}")
+        return list(changes)
+
+    def refresh(self, full=False) -> dict:
+        """마지막 refresh 이후 분석이 바뀐 company만 board에 반영한다 (처음이거나 full이면 전체 rebuild)"""
+        state = self.firestore.get_task_state(TASK_NAME) or {}
+        started_at = datetime.now(timezone.utc) - timedelta(seconds=REFRESH_OVERLAP_SEC)
+        if full or state.get("updatedUntil") is None:
+            profiles = self.firestore.stream_company_profiles(PROFILE_FIELDS)
+            report = {"mode": "rebuild", "profiles": len(profiles), "boards": self.rebuild(profiles)}
+        else:
+            profiles = self.firestore.stream_company_profiles(PROFILE_FIELDS, updated_after=state["updatedUntil"])
+            report = {"mode": "incremental", "profiles": len(profiles), "boards": len(self.apply_updates(profiles))}
+        self.firestore.set_task_state(TASK_NAME, {"updatedUntil": started_at})
+        logger.info(f"Leaderboards refreshed: {report}")
+        return report
+
+    def rebuild(self, profiles) -> int:
+        """{symbol: company profile} 전체로 모든 board를 새로 만든다 (reserve가 바닥난 board 복구용)"""
+        boards = {}
+        for symbol, profile in profiles.items():
+            sector = profile.get("sector")
+            for metric in LEADERBOARDS:
+                if not _qualifies(metric, profile.get(metric)):
+                    continue
+                for board_sector in _scopes(sector):
+                    boards.setdefault((metric, board_sector), []).append({"symbol": symbol, "value": profile[metric]})
+
+        documents = [(self.board_path(metric, sector), self._board(metric, sector,
+                                                                   _sort_entries(metric, entries)[:self.capacity]))
+                     for (metric, sector), entries in boards.items()]
+        failed = self.firestore.store_leaderboards(documents)
+        logger.info(f"Rebuilt {len(documents)} leaderboards from {len(profiles)} profiles ({len(failed)} failed)")
+        return len(documents) - len(failed)
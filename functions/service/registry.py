@@ -0,0 +1,77 @@
+import logging
+import os
+import threading
+
+from service.firestore import FirestoreService
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# 프로세스 단위로 하나씩만 만드는 client/service (warm invocation 간에도 재사용)
+_instances = {}
+# service factory가 안에서 다시 client를 꺼내므로 재진입 가능한 lock
+_instances_lock = threading.RLock()
+
+
+def _get_or_create(name, factory):
+    instance = _instances.get(name)
+    if instance is None:
+        with _instances_lock:
+            instance = _instances.get(name)
+            if instance is None:
+                instance = _instances[name] = factory()
+                logger.info(f"Created shared {name}")
+    return instance
+
+
+def get_firestore_service() -> FirestoreService:
+    """Firestore client(credential 조회, gRPC channel)를 프로세스에서 한 번만 만든다"""
+    return _get_or_create("firestore", FirestoreService)
+
+
+def get_fmp_client():
+    """connection pool을 가진 FMP client 하나를 공유한다"""
+    # Firestore trigger처럼 FMP를 쓰지 않는 함수가 requests/tenacity를 import하지 않도록 여기서 import
+    from clients.fmp.fmpClient import DEFAULT_BASE_URL, FmpClient
+
+    return _get_or_create("fmp", lambda: FmpClient(base_url=os.getenv("FMP_BASE_URL", DEFAULT_BASE_URL),
+                                                   api_key=os.getenv("FMP_CLIENT_API_KEY"),
+                                                   quote_chunk_size=int(os.getenv("FMP_QUOTE_CHUNK_SIZE", "100")),
+                                                   pool_size=int(os.getenv("FMP_HTTP_POOL_SIZE", "32"))))
+
+
+def get_async_fmp_client():
+    """AsyncFmpClient 하나를 공유한다 (aiohttp session은 event loop마다 client 안에서 따로 만든다)"""
+    from clients.fmp.asyncFmpClient import DEFAULT_ASYNC_CONCURRENCY, AsyncFmpClient
+    from clients.fmp.fmpClient import DEFAULT_BASE_URL
+
+    return _get_or_create("async_fmp", lambda: AsyncFmpClient(
+        base_url=os.getenv("FMP_BASE_URL", DEFAULT_BASE_URL),
+        api_key=os.getenv("FMP_CLIENT_API_KEY"),
+        quote_chunk_size=int(os.getenv("FMP_QUOTE_CHUNK_SIZE", "100")),
+        concurrency=int(os.getenv("FMP_ASYNC_CONCURRENCY", str(DEFAULT_ASYNC_CONCURRENCY)))))
+
+
+def get_company_data_sync_service():
+    from service.company_data_sync import CompanyDataSyncService
+
+    return _get_or_create("company_data_sync", CompanyDataSyncService)
+
+
+def get_async_company_data_sync_service():
+    from service.async_company_data_sync import AsyncCompanyDataSyncService
+
+    return _get_or_create("async_company_data_sync", AsyncCompanyDataSyncService)
+
+
+def get_analysis_service():
+    from service.analysis import AnalysisService
+
+    return _get_or_create("analysis", AnalysisService)
+
+
+def reset():
+    """공유 instance를 모두 버린다 (환경 변수를 바꾼 뒤 다시 만들 때)"""
+    with _instances_lock:
+        _instances.clear()
@@ -0,0 +1,205 @@
+import logging
+import os
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+from service.registry import get_firestore_service
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# sync_company_ncav가 company profile에 쓰는 지표
+NUMERIC_FIELDS = ["annualNcavRatio", "quarterNcavRatio", "annualRetainedEarnings", "quarterRetainedEarnings",
+                  "shareholderReturnFrequency", "shareholderReturns", "roi", "per", "pbr", "eps", "analysisMarketCap"]
+STRING_FIELDS = ["sector", "country", "currency", "exchange"]
+UPDATED_AT_FIELD = "analysisUpdatedAt"
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 500
+REFRESH_OVERLAP_SEC = 30
+FILTER_PATTERN = re.compile(r"^(\w+)(>=|<=|!=|>|<|=)(.+)$")
+
+
+class ScreenerQueryError(ValueError):
+    pass
+
+
+class ScreenerIndex:
+    """company profile 지표를 column 배열로 들고 filter/sort/top-K를 한 번에 계산하는 in-memory index"""
+
+    def __init__(self, capacity=8192):
+        self.symbols = []
+        self.rows = {}
+        self.numeric = {field: np.full(capacity, np.nan) for field in NUMERIC_FIELDS}
+        self.strings = {field: np.full(capacity, None, dtype=object) for field in STRING_FIELDS}
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.symbols)
+
+    def _grow(self):
+        capacity = len(self.numeric[NUMERIC_FIELDS[0]])
+        for field, values in self.numeric.items():
+            self.numeric[field] = np.concatenate([values, np.full(capacity, np.nan)])
+        for field, values in self.strings.items():
+            self.strings[field] = np.concatenate([values, np.full(capacity, None, dtype=object)])
+
+    def upsert(self, symbol, profile):
+        """profile에 들어 있는 필드만 갱신 (없는 필드는 기존 값 유지)"""
+        with self.lock:
+            row = self.rows.get(symbol)
+            if row is None:
+                row = len(self.symbols)
+                if row >= len(self.numeric[NUMERIC_FIELDS[0]]):
+                    self._grow()
+                self.symbols.append(symbol)
+                self.rows[symbol] = row
+            for field in NUMERIC_FIELDS:
+                if field in profile:
+                    value = profile[field]
+                    self.numeric[field][row] = value if isinstance(value, (int, float)) else np.nan
+            for field in STRING_FIELDS:
+                if field in profile:
+                    self.strings[field][row] = profile[field]
+
+    def _mask(self, count, filters):
+        mask = np.ones(count, dtype=bool)
+        for field, op, raw_value in filters:
+            if field in NUMERIC_FIELDS:
+                try:
+                    value = float(raw_value)
+                except ValueError:
+                    raise ScreenerQueryError(f"{field} needs a numeric value, got {raw_value}")
+                values = self.numeric[field][:count]
+                with np.errstate(invalid="ignore"):
+                    mask &= {
+                        ">": values > value, ">=": values >= value, "<": values < value,
+                        "<=": values <= value, "=": values == value, "!=": values != value,
+                    }[op]
+                mask &= ~np.isnan(values)  # 값이 없는 company는 조건을 만족하지 않는다
+            elif field in STRING_FIELDS:
+                if op not in ("=", "!="):
+                    raise ScreenerQueryError(f"{field} only supports = and !=")
+                values = self.strings[field][:count]
+                matches = values == raw_value
+                mask &= matches if op == "=" else ~matches
+            else:
+                raise ScreenerQueryError(f"Unknown field {field}")
+        return mask
+
+    def query(self, filters=(), sort=None, limit=DEFAULT_LIMIT, offset=0) -> dict:
+        """filters: (field, op, value) 목록, sort: "roi"(오름차순) 또는 "-roi"(내림차순)"""
+        limit = max(1, min(limit, MAX_LIMIT))
+        offset = max(0, offset)
+        with self.lock:
+            count = len(self.symbols)
+            matched = np.flatnonzero(self._mask(count, filters))
+            total = len(matched)
+
+            if sort:
+                descending = sort.startswith("-")
+                field = sort.lstrip("-")
+                if field not in NUMERIC_FIELDS:
+                    raise ScreenerQueryError(f"Cannot sort by {field}")
+                values = self.numeric[field][matched]
+                # nan은 정렬 방향과 상관없이 항상 뒤로
+                keys = np.where(np.isnan(values), np.inf, -values if descending else values)
+                if offset + limit < len(matched):
+                    # 필요한 top-K만 부분 정렬. K번째 값과 같은 값은 모두 후보에 넣어야 전체 정렬과 같은 순서가 되어
+                    # page 경계에서 같은 값끼리 순서가 바뀌지 않는다 (argpartition은 동점 중 아무거나 고른다)
+                    kth = np.partition(keys, offset + limit - 1)[offset + limit - 1]
+                    top = np.flatnonzero(keys <= kth)
+                    matched = matched[top[np.argsort(keys[top], kind="stable")][:offset + limit]]
+                else:
+                    matched = matched[np.argsort(keys, kind="stable")]
+
+            page = matched[offset:offset + limit]
+            results = []
+            for row in page:
+                item = {"symbol": self.symbols[row]}
+                for field in NUMERIC_FIELDS:
+                    value = self.numeric[field][row]
+                    item[field] = None if np.isnan(value) else float(value)
+                for field in STRING_FIELDS:
+                    item[field] = self.strings[field][row]
+                results.append(item)
+
+        next_offset = offset + limit
+        return {
+            "total": total,
+            "offset": offset,
+            "nextOffset": next_offset if next_offset < total else None,
+            "results": results,
+        }
+
+
+def parse_query(args):
+    """request args → ScreenerIndex.query 인자
+
+    filter=annualNcavRatio>0.66&filter=per<10&sector=Technology&sort=-roi&limit=20&offset=0
+    """
+    filters = []
+    for expression in args.getlist("filter"):
+        match = FILTER_PATTERN.match(expression.replace(" ", ""))
+        if match is None:
+            raise ScreenerQueryError(f"Invalid filter {expression}")
+        filters.append(match.groups())
+    for field in STRING_FIELDS:
+        if args.get(field):
+            filters.append((field, "=", args.get(field)))
+    try:
+        limit = int(args.get("limit", DEFAULT_LIMIT))
+        offset = int(args.get("offset", 0))
+    except ValueError:
+        raise ScreenerQueryError("limit and offset must be integers")
+    return {"filters": filters, "sort": args.get("sort"), "limit": limit, "offset": offset}
+
+
+class ScreenerService:
+    """warm instance 동안 index를 유지하고, refresh_sec마다 바뀐 profile만 다시 읽는다"""
+
+    def __init__(self, firestore=None, refresh_sec=None):
+        self.firestore = firestore or get_firestore_service()
+        self.refresh_sec = refresh_sec if refresh_sec is not None else int(os.getenv("SCREENER_REFRESH_SEC", "60"))
+        self.index = ScreenerIndex()
+        self.loaded_at = None  # 마지막으로 반영한 analysisUpdatedAt 기준 시각
+        self.checked_at = 0.0
+        self.refresh_lock = threading.Lock()
+
+    def refresh(self, force=False):
+        if not force and time.monotonic() - self.checked_at < self.refresh_sec:
+            return
+        with self.refresh_lock:
+            if not force and time.monotonic() - self.checked_at < self.refresh_sec:
+                return
+            # 읽는 도중 commit된 변경을 놓치지 않도록 조금 겹쳐서 다시 읽는다 (upsert라 중복은 무해)
+            started_at = datetime.now(timezone.utc) - timedelta(seconds=REFRESH_OVERLAP_SEC)
+            fields = NUMERIC_FIELDS + STRING_FIELDS
+            # 처음에는 전체 snapshot, 이후에는 마지막 refresh 이후 분석이 바뀐 company만
+            profiles = self.firestore.stream_company_profiles(fields, updated_after=self.loaded_at)
+            for symbol, profile in profiles.items():
+                self.index.upsert(symbol, profile)
+            logger.info(f"Screener index refreshed with {len(profiles)} profiles ({len(self.index)} total)")
+            self.loaded_at = started_at
+            self.checked_at = time.monotonic()
+
+    def screen(self, filters=(), sort=None, limit=DEFAULT_LIMIT, offset=0) -> dict:
+        self.refresh()
+        return self.index.query(filters, sort, limit, offset)
+
+
+_screener = None
+_screener_lock = threading.Lock()
+
+
+def get_screener() -> ScreenerService:
+    global _screener
+    with _screener_lock:
+        if _screener is None:
+            _screener = ScreenerService()
+        return _screener
@@ -0,0 +1,91 @@
+import concurrent.futures
+import logging
+import math
+import os
+import zlib
+
+import requests
+
+from companies import SymbolList
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+SHARD_TOKEN_HEADER = "X-Shard-Token"
+
+
+def shard_companies(companies, shard, shard_count, strategy="range"):
+    """전체 symbol 목록 중 shard번째 조각을 반환 (원래 순서 유지)
+
+    range: 연속된 구간으로 나눈다. hash: symbol의 crc32로 나눠 목록이 바뀌어도 대부분 같은 shard에 남는다.
+    """
+    if shard_count <= 1:
+        return companies
+    if not 0 <= shard < shard_count:
+        raise ValueError(f"shard {shard} is out of range for {shard_count} shards")
+    if strategy == "hash":
+        return SymbolList.of(symbol for symbol in companies if zlib.crc32(symbol.encode()) % shard_count == shard)
+    size = math.ceil(len(companies) / shard_count)
+    return companies[shard * size:(shard + 1) * size]
+
+
+class LocalShardDispatcher:
+    """shard를 같은 프로세스의 thread로 실행하는 dispatcher (로컬 실행/테스트용)
+
+    worker(task, shard, shard_count)를 shard마다 호출한다.
+    """
+
+    def __init__(self, worker):
+        self.worker = worker
+
+    def dispatch(self, task, shard_count) -> dict:
+        results = {}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=shard_count) as executor:
+            futures = {executor.submit(self.worker, task, shard, shard_count): shard for shard in range(shard_count)}
+            for future in concurrent.futures.as_completed(futures):
+                shard = futures[future]
+                try:
+                    results[shard] = future.result()
+                except Exception as e:
+                    logger.error(f"Shard {shard}/{shard_count} of {task} failed: {e}")
+                    results[shard] = e
+        return results
+
+
+class HttpShardDispatcher:
+    """shard마다 worker HTTPS 함수를 병렬로 호출해 서로 다른 instance에서 실행되게 한다 (fire-and-forget)
+
+    worker는 자기 RunBudget과 checkpoint로 끝까지 실행되므로 결과를 기다리지 않는다. 요청을 보낸 뒤
+    ack_timeout_sec 안에 응답이 없으면 dispatch된 것으로 보고, 연결 실패나 바로 돌아온 HTTP 오류만 실패로 남긴다.
+    scheduler는 timeout(300/540초)보다 한참 전에 끝난다.
+    """
+
+    def __init__(self, worker_url, token=None, connect_timeout_sec=10, ack_timeout_sec=10):
+        self.worker_url = worker_url
+        self.token = token
+        self.connect_timeout_sec = connect_timeout_sec
+        self.ack_timeout_sec = ack_timeout_sec
+
+    def _invoke(self, task, shard, shard_count):
+        headers = {SHARD_TOKEN_HEADER: self.token} if self.token else {}
+        try:
+            response = requests.post(self.worker_url, params={"task": task, "shard": shard, "shards": shard_count},
+                                     headers=headers, timeout=(self.connect_timeout_sec, self.ack_timeout_sec))
+        except requests.exceptions.ReadTimeout:
+            # 요청은 전달됐고 worker가 실행 중이다
+            logger.info(f"Shard {shard}/{shard_count} of {task} dispatched")
+            return "dispatched"
+        response.raise_for_status()
+        return response.text
+
+    def dispatch(self, task, shard_count) -> dict:
+        return LocalShardDispatcher(self._invoke).dispatch(task, shard_count)
+
+
+def get_shard_dispatcher(worker):
+    """SHARD_WORKER_URL이 있으면 HTTP로 fan-out, 없으면 같은 프로세스에서 worker를 실행"""
+    worker_url = os.getenv("SHARD_WORKER_URL")
+    if worker_url:
+        return HttpShardDispatcher(worker_url, os.getenv("SHARD_DISPATCH_TOKEN"))
+    return LocalShardDispatcher(worker)
@@ -0,0 +1,223 @@
+import argparse
+import json
+import logging
+import os
+import shutil
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+STATEMENT_TYPES = ["incomeStatements", "balanceSheets", "cashFlows"]
+# clients/fmp/data 의 fixture 파일 → statement type
+FIXTURE_FILES = {
+    "incomeStatements": ["income_statement.json", "income_statement_annual.json"],
+    "balanceSheets": ["balance_sheet.json", "balance_sheet_annual.json"],
+    "cashFlows": ["cash_flow.json", "cash_flow_annual.json"],
+}
+FIXTURE_DIR = Path(__file__).resolve().parent.parent / "clients" / "fmp" / "data"
+MANIFEST_FILE = "manifest.json"
+# .npy로 옮길 때 한 번에 복사하는 row 수
+SNAPSHOT_COPY_ROWS = 1 << 16
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _sort_key(record):
+    return record["symbol"], record["date"], record.get("period") or ""
+
+
+class StatementSnapshotWriter:
+    """symbol 순서대로 재무제표 record를 받아 column 파일에 바로 이어 쓴다
+
+    메모리에는 symbol 하나의 record만 두고, 각 column은 임시 파일에 append한 뒤 close()에서 .npy로 옮긴다.
+    key column은 symbol/date/period이고, 숫자 필드는 모두 float64 column이 된다 (값이 없으면 nan).
+    """
+
+    KEY_DTYPES = {"symbol": "U16", "date": "datetime64[D]", "period": "U4"}
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        self.raw_dir = self.directory / "raw"
+        (self.raw_dir / "columns").mkdir(parents=True, exist_ok=True)
+        (self.directory / "columns").mkdir(exist_ok=True)
+        self.rows = 0
+        self.last_symbol = None
+        self.files = {name: open(self.raw_dir / f"{name}.bin", "wb") for name in self.KEY_DTYPES}
+        self.columns = {}
+
+    def _column_file(self, name):
+        file = self.columns[name] = open(self.raw_dir / "columns" / f"{name}.bin", "wb")
+        # 앞선 row에는 이 column이 없었으므로 nan으로 채운다
+        np.full(self.rows, np.nan).tofile(file)
+        return file
+
+    def append(self, symbol, records):
+        """symbol 하나의 record 목록을 추가한다. symbol은 오름차순으로 들어와야 한다"""
+        if self.last_symbol is not None and symbol <= self.last_symbol:
+            raise ValueError(f"Symbols must be appended in ascending order ({symbol} after {self.last_symbol})")
+        self.last_symbol = symbol
+
+        # 같은 (date, period)는 나중 record 하나만 남긴다
+        unique = {}
+        for record in records:
+            if record.get("date"):
+                record = {**record, "symbol": symbol}
+                unique[_sort_key(record)] = record
+        records = [unique[key] for key in sorted(unique)]
+        if not records:
+            return
+
+        names = {key for record in records for key, value in record.items() if _is_number(value)}
+        for name in names - self.columns.keys():
+            self._column_file(name)
+        np.array([symbol] * len(records), dtype=self.KEY_DTYPES["symbol"]).tofile(self.files["symbol"])
+        np.array([record["date"] for record in records], dtype=self.KEY_DTYPES["date"]).tofile(self.files["date"])
+        np.array([record.get("period") or "" for record in records],
+                 dtype=self.KEY_DTYPES["period"]).tofile(self.files["period"])
+        for name, file in self.columns.items():
+            np.array([record.get(name) if _is_number(record.get(name)) else np.nan for record in records],
+                     dtype=np.float64).tofile(file)
+        self.rows += len(records)
+
+    def _finish(self, raw_path, npy_path, dtype):
+        """임시 파일을 chunk 단위로 .npy에 복사한다 (column 전체를 메모리에 올리지 않는다)"""
+        target = np.lib.format.open_memmap(npy_path, mode="w+", dtype=dtype, shape=(self.rows,))
+        if self.rows:
+            source = np.memmap(raw_path, mode="r", dtype=dtype, shape=(self.rows,))
+            for i in range(0, self.rows, SNAPSHOT_COPY_ROWS):
+                target[i:i + SNAPSHOT_COPY_ROWS] = source[i:i + SNAPSHOT_COPY_ROWS]
+            del source
+        target.flush()
+        del target
+        raw_path.unlink()
+
+    def close(self) -> dict:
+        for file in [*self.files.values(), *self.columns.values()]:
+            file.close()
+        for name, dtype in self.KEY_DTYPES.items():
+            self._finish(self.raw_dir / f"{name}.bin", self.directory / f"{name}.npy", dtype)
+        for name in self.columns:
+            self._finish(self.raw_dir / "columns" / f"{name}.bin", self.directory / "columns" / f"{name}.npy",
+                         np.float64)
+        shutil.rmtree(self.raw_dir)
+
+        manifest = {"rows": self.rows, "columns": sorted(self.columns), "createdAt": datetime.now().isoformat()}
+        (self.directory / MANIFEST_FILE).write_text(json.dumps(manifest))
+        logger.info(f"Wrote {self.rows} rows x {len(self.columns)} columns to {self.directory}")
+        return manifest
+
+
+def write_statement_snapshot(directory, records):
+    """재무제표 record 목록을 (symbol, date) 순으로 정렬해 column별 .npy 파일로 저장 (작은 목록용)"""
+    by_symbol = {}
+    for record in records:
+        if record.get("symbol") and record.get("date"):
+            by_symbol.setdefault(record["symbol"], []).append(record)
+    writer = StatementSnapshotWriter(directory)
+    for symbol in sorted(by_symbol):
+        writer.append(symbol, by_symbol[symbol])
+    return writer.close()
+
+
+class StatementSnapshot:
+    """write_statement_snapshot으로 만든 snapshot을 memory-map으로 연다 (필요한 column만 실제로 읽힌다)"""
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        self.manifest = json.loads((self.directory / MANIFEST_FILE).read_text())
+        self.symbol = np.load(self.directory / "symbol.npy", mmap_mode="r")
+        self.date = np.load(self.directory / "date.npy", mmap_mode="r")
+        self.period = np.load(self.directory / "period.npy", mmap_mode="r")
+        self._columns = {}
+
+    def __len__(self):
+        return self.manifest["rows"]
+
+    @property
+    def columns(self) -> list:
+        return self.manifest["columns"]
+
+    def column(self, name):
+        if name not in self._columns:
+            if name not in self.manifest["columns"]:
+                raise KeyError(f"Column {name} not in snapshot {self.directory}")
+            self._columns[name] = np.load(self.directory / "columns" / f"{name}.npy", mmap_mode="r")
+        return self._columns[name]
+
+    def rows_for(self, symbol) -> slice:
+        """symbol의 row 범위 (symbol로 정렬되어 있으므로 이진 탐색)"""
+        start = int(np.searchsorted(self.symbol, symbol, side="left"))
+        stop = int(np.searchsorted(self.symbol, symbol, side="right"))
+        return slice(start, stop)
+
+    def latest(self, symbol, annual=True):
+        """symbol의 가장 최근 annual(FY) 또는 quarter row index (없으면 None)"""
+        rows = self.rows_for(symbol)
+        periods = self.period[rows]
+        matches = np.flatnonzero(periods == "FY") if annual else np.flatnonzero(periods != "FY")
+        if len(matches) == 0:
+            return None
+        return rows.start + int(matches[-1])  # date 오름차순이므로 마지막이 최신
+
+    def record(self, index, columns=None) -> dict:
+        columns = columns or self.columns
+        data = {
+            "symbol": str(self.symbol[index]),
+            "date": str(self.date[index]),
+            "period": str(self.period[index]),
+        }
+        for name in columns:
+            value = float(self.column(name)[index])
+            data[name] = None if np.isnan(value) else value
+        return data
+
+
+def load_snapshot(root) -> dict:
+    """snapshot root 아래의 statement type별 StatementSnapshot"""
+    root = Path(root)
+    return {statement_type: StatementSnapshot(root / statement_type)
+            for statement_type in STATEMENT_TYPES if (root / statement_type / MANIFEST_FILE).exists()}
+
+
+def export_fixtures(root, data_dir=FIXTURE_DIR) -> dict:
+    manifests = {}
+    for statement_type, files in FIXTURE_FILES.items():
+        records = []
+        for file in files:
+            records.extend(json.loads((Path(data_dir) / file).read_text()))
+        manifests[statement_type] = write_statement_snapshot(Path(root) / statement_type, records)
+    return manifests
+
+
+def export_from_firestore(root, symbols, firestore=None) -> dict:
+    """symbol마다 읽은 period를 바로 snapshot에 이어 쓴다 (한 번에 symbol 하나의 period만 메모리에 둔다)"""
+    from service.registry import get_firestore_service
+
+    firestore = firestore or get_firestore_service()
+    manifests = {}
+    for statement_type in STATEMENT_TYPES:
+        writer = StatementSnapshotWriter(Path(root) / statement_type)
+        for symbol in sorted(symbols):
+            writer.append(symbol, firestore.get_financial_periods(symbol, statement_type))
+        manifests[statement_type] = writer.close()
+    return manifests
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export financial statements to a columnar snapshot")
+    parser.add_argument("source", choices=["fixtures", "firestore"])
+    parser.add_argument("root", nargs="?", default=os.getenv("SNAPSHOT_DIR", "snapshot"))
+    args = parser.parse_args()
+
+    if args.source == "fixtures":
+        export_fixtures(args.root)
+    else:
+        from companies import companies
+        export_from_firestore(args.root, companies)
@@ -0,0 +1,289 @@
+import copy
+import json
+import logging
+import os
+import sqlite3
+import threading
+from datetime import datetime
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# stream()의 filters에서 쓰는 비교 연산 (Firestore where와 같은 의미: 필드가 없으면 조건을 만족하지 않는다)
+OPERATORS = {
+    "==": lambda a, b: a == b,
+    "!=": lambda a, b: a is not None and a != b,
+    ">": lambda a, b: a is not None and a > b,
+    ">=": lambda a, b: a is not None and a >= b,
+    "<": lambda a, b: a is not None and a < b,
+    "<=": lambda a, b: a is not None and a <= b,
+}
+
+
+def merge_document(target, data):
+    """Firestore set(merge=True)처럼 map은 필드 단위로 합치고 나머지 값은 덮어쓴다"""
+    for key, value in data.items():
+        if isinstance(value, dict) and isinstance(target.get(key), dict):
+            merge_document(target[key], value)
+        else:
+            target[key] = copy.deepcopy(value)
+    return target
+
+
+def _collection_of(path):
+    return path.rsplit("/", 1)[0]
+
+
+def _matches(data, filters, fields):
+    if not all(OPERATORS[op](data.get(field), value) for field, op, value in filters):
+        return None
+    if fields is None:
+        return data
+    return {field: data[field] for field in fields if field in data}
+
+
+class StorageBackend:
+    """FirestoreService가 쓰는 document 단위 저장소 연산
+
+    path는 "collection/document/collection/document" 형식의 document path이고,
+    문서가 없으면 None을 돌려준다. 모든 쓰기는 merge 저장이다 (transaction 제외).
+    """
+
+    name = None
+
+    def get(self, path):
+        raise NotImplementedError
+
+    def get_many(self, paths) -> dict:
+        """{path: dict 또는 None}"""
+        raise NotImplementedError
+
+    def set(self, path, data):
+        raise NotImplementedError
+
+    def commit(self, writes):
+        """(path, data) 목록을 한 번에 merge 저장한다. 실패하면 예외"""
+        raise NotImplementedError
+
+    def stream(self, collection_path, fields=None, filters=()) -> dict:
+        """collection의 문서를 {document id: dict}로. filters는 (field, op, value) 목록"""
+        raise NotImplementedError
+
+    def transaction(self, paths, update) -> dict:
+        """paths를 원자적으로 읽어 update({path: dict 또는 None})가 돌려준 {path: data}로 덮어쓰고 그 dict를 반환"""
+        raise NotImplementedError
+
+
+class FirestoreBackend(StorageBackend):
+    name = "firestore"
+
+    def __init__(self, client=None):
+        from google.cloud import firestore
+
+        self.firestore = firestore
+        self.db = client or firestore.Client()
+
+    def get(self, path):
+        return self.db.document(path).get().to_dict()
+
+    def get_many(self, paths) -> dict:
+        documents = dict.fromkeys(paths)
+        for snapshot in self.db.get_all([self.db.document(path) for path in paths]):
+            if snapshot.exists:
+                documents[snapshot.reference.path] = snapshot.to_dict()
+        return documents
+
+    def set(self, path, data):
+        self.db.document(path).set(document_data=data, merge=True)
+
+    def commit(self, writes):
+        batch = self.db.batch()
+        for path, data in writes:
+            batch.set(self.db.document(path), data, merge=True)
+        batch.commit()
+
+    def stream(self, collection_path, fields=None, filters=()) -> dict:
+        from google.cloud.firestore_v1.base_query import FieldFilter
+
+        query = self.db.collection(collection_path)
+        for field, op, value in filters:
+            query = query.where(filter=FieldFilter(field, op, value))
+        if fields is not None:
+            query = query.select(fields)
+        return {snapshot.id: snapshot.to_dict() for snapshot in query.stream()}
+
+    def transaction(self, paths, update) -> dict:
+        references = [self.db.document(path) for path in paths]
+
+        @self.firestore.transactional
+        def run(transaction):
+            documents = dict.fromkeys(paths)
+            for snapshot in transaction.get_all(references):
+                if snapshot.exists:
+                    documents[snapshot.reference.path] = snapshot.to_dict()
+            changes = update(documents)
+            for path, data in changes.items():
+                transaction.set(self.db.document(path), data)
+            return changes
+
+        return run(self.db.transaction())
+
+
+class MemoryBackend(StorageBackend):
+    """프로세스 메모리의 dict 저장소 (로컬 실행/profiling용, 프로세스가 끝나면 사라진다)"""
+
+    name = "memory"
+
+    def __init__(self):
+        self.documents = {}
+        self.lock = threading.Lock()
+
+    def get(self, path):
+        with self.lock:
+            return copy.deepcopy(self.documents.get(path))
+
+    def get_many(self, paths) -> dict:
+        with self.lock:
+            return {path: copy.deepcopy(self.documents.get(path)) for path in paths}
+
+    def _merge(self, path, data):
+        merge_document(self.documents.setdefault(path, {}), data)
+
+    def set(self, path, data):
+        with self.lock:
+            self._merge(path, data)
+
+    def commit(self, writes):
+        with self.lock:
+            for path, data in writes:
+                self._merge(path, data)
+
+    def stream(self, collection_path, fields=None, filters=()) -> dict:
+        with self.lock:
+            documents = {path.rsplit("/", 1)[-1]: _matches(copy.deepcopy(data), filters, fields)
+                         for path, data in self.documents.items() if _collection_of(path) == collection_path}
+        return {document_id: data for document_id, data in documents.items() if data is not None}
+
+    def transaction(self, paths, update) -> dict:
+        with self.lock:
+            changes = update({path: copy.deepcopy(self.documents.get(path)) for path in paths})
+            for path, data in changes.items():
+                self.documents[path] = copy.deepcopy(data)
+        return changes
+
+
+def _encode(value):
+    if isinstance(value, datetime):
+        return {"__datetime__": value.isoformat()}
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def _decode(value):
+    if "__datetime__" in value and len(value) == 1:
+        return datetime.fromisoformat(value["__datetime__"])
+    return value
+
+
+class SqliteBackend(StorageBackend):
+    """document를 JSON으로 한 행씩 저장하는 SQLite 저장소 (datetime은 tag를 붙여 그대로 되살린다)"""
+
+    name = "sqlite"
+
+    def __init__(self, path):
+        self.path = path
+        self.connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS documents (path TEXT PRIMARY KEY, collection TEXT NOT NULL, data TEXT NOT NULL)")
+        self.connection.execute("CREATE INDEX IF NOT EXISTS documents_collection ON documents (collection)")
+        self.lock = threading.Lock()  # connection 하나를 thread끼리 나눠 쓴다
+
+    @staticmethod
+    def _loads(data):
+        return json.loads(data, object_hook=_decode) if data is not None else None
+
+    def _read(self, paths) -> dict:
+        documents = dict.fromkeys(paths)
+        for i in range(0, len(paths), 500):  # SQLite 변수 개수 제한
+            chunk = paths[i:i + 500]
+            rows = self.connection.execute(
+                f"SELECT path, data FROM documents WHERE path IN ({','.join('?' * len(chunk))})", chunk)
+            documents.update((path, self._loads(data)) for path, data in rows)
+        return documents
+
+    def _write(self, path, data):
+        self.connection.execute(
+            "INSERT OR REPLACE INTO documents (path, collection, data) VALUES (?, ?, ?)",
+            (path, _collection_of(path), json.dumps(data, default=_encode)))
+
+    def _merge(self, writes):
+        paths = list(dict.fromkeys(path for path, _ in writes))
+        documents = self._read(paths)
+        for path, data in writes:
+            documents[path] = merge_document(documents[path] or {}, data)
+        for path in paths:
+            self._write(path, documents[path])
+
+    def get(self, path):
+        return self.get_many([path])[path]
+
+    def get_many(self, paths) -> dict:
+        with self.lock:
+            return self._read(list(paths))
+
+    def set(self, path, data):
+        self.commit([(path, data)])
+
+    def commit(self, writes):
+        with self.lock:
+            self.connection.execute("BEGIN IMMEDIATE")
+            try:
+                self._merge(list(writes))
+                self.connection.execute("COMMIT")
+            except Exception:
+                self.connection.execute("ROLLBACK")
+                raise
+
+    def stream(self, collection_path, fields=None, filters=()) -> dict:
+        with self.lock:
+            rows = self.connection.execute("SELECT path, data FROM documents WHERE collection = ?",
+                                           (collection_path,)).fetchall()
+        documents = {path.rsplit("/", 1)[-1]: _matches(self._loads(data), filters, fields) for path, data in rows}
+        return {document_id: data for document_id, data in documents.items() if data is not None}
+
+    def transaction(self, paths, update) -> dict:
+        with self.lock:
+            self.connection.execute("BEGIN IMMEDIATE")
+            try:
+                changes = update(self._read(list(paths)))
+                for path, data in changes.items():
+                    self._write(path, data)
+                self.connection.execute("COMMIT")
+            except Exception:
+                self.connection.execute("ROLLBACK")
+                raise
+        return changes
+
+
+# 프로세스에서 backend(Firestore client, 메모리 저장소, SQLite connection)를 하나씩만 만든다
+_shared_backends = {}
+_shared_backends_lock = threading.Lock()
+
+
+def get_storage_backend(name=None) -> StorageBackend:
+    """STORAGE_BACKEND(firestore|memory|sqlite)에 맞는 backend. sqlite 파일은 STORAGE_SQLITE_PATH"""
+    name = name or os.getenv("STORAGE_BACKEND", "firestore")
+    if name not in ("firestore", "memory", "sqlite"):
+        raise ValueError(f"Unknown storage backend {name}")
+    with _shared_backends_lock:
+        if name not in _shared_backends:
+            if name == "firestore":
+                _shared_backends[name] = FirestoreBackend()
+            elif name == "memory":
+                _shared_backends[name] = MemoryBackend()
+            else:
+                _shared_backends[name] = SqliteBackend(os.getenv("STORAGE_SQLITE_PATH", "storage.sqlite3"))
+            logger.info(f"Using {name} storage backend")
+        return _shared_backends[name]
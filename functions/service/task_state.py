@@ -1,42 +1,61 @@
-from service.firestore import FirestoreService
+import os
+
+from service.registry import get_firestore_service
+from service.sharding import shard_companies
 from datetime import datetime
 from companies import companies
 
 
 class TaskStateService:
-    def __init__(self):
-        self.firestore = FirestoreService()
+    def __init__(self, firestore=None):
+        self.firestore = firestore or get_firestore_service()
+        self.shard_strategy = os.getenv("SYNC_SHARD_STRATEGY", "range")
+
+    @staticmethod
+    def _task_name(task_name, shard, shard_count):
+        # shard가 하나면 기존 checkpoint 문서를 그대로 쓴다
+        if shard_count <= 1:
+            return task_name
+        return f"{task_name}_shard_{shard}_of_{shard_count}"
+
+    def _shard_companies(self, shard, shard_count) -> list:
+        return shard_companies(companies, shard, shard_count, self.shard_strategy)
 
-    def get_info_task_state(self):
-        return self.firestore.get_task_state("company_info")
+    def get_info_task_state(self, shard=0, shard_count=1):
+        return self.firestore.get_task_state(self._task_name("company_info", shard, shard_count))
 
-    def get_quote_task_state(self):
-        return self.firestore.get_task_state("company_quotes")
+    def get_quote_task_state(self, shard=0, shard_count=1):
+        return self.firestore.get_task_state(self._task_name("company_quotes", shard, shard_count))
 
-    def get_update_company_info_companies(self) -> list:
-        latest = self.get_info_task_state()
+    def get_update_company_info_companies(self, shard=0, shard_count=1) -> list:
+        shard_symbols = self._shard_companies(shard, shard_count)
+        latest = self.get_info_task_state(shard, shard_count)
         if latest is None or latest['date'] != datetime.now().strftime("%Y-%m"):
-            return companies
-        if latest['latest_symbol'] is companies[-1]:
+            return shard_symbols
+        if latest['latest_symbol'] == shard_symbols[-1]:
             return []
-        idx = companies.index(latest['latest_symbol'])
-        return companies[idx + 1:]
-
-    def get_update_company_quotes_companies(self) -> list:
-        latest = self.get_quote_task_state()
-        if latest is None or latest['latest_symbol'] is companies[-1]:
-            return companies
-        idx = companies.index(latest['latest_symbol'])
-        return companies[idx + 1:]
-
-    def set_latest_updated_company_info(self, symbol):
-        self.firestore.set_task_state("company_info", {
+        if latest['latest_symbol'] not in shard_symbols:  # 목록에서 빠진 symbol이면 처음부터
+            return shard_symbols
+        idx = shard_symbols.index(latest['latest_symbol'])
+        return shard_symbols[idx + 1:]
+
+    def get_update_company_quotes_companies(self, shard=0, shard_count=1) -> list:
+        shard_symbols = self._shard_companies(shard, shard_count)
+        latest = self.get_quote_task_state(shard, shard_count)
+        if (latest is None or latest['latest_symbol'] == shard_symbols[-1]
+                or latest['latest_symbol'] not in shard_symbols):
+            return shard_symbols
+        idx = shard_symbols.index(latest['latest_symbol'])
+        return shard_symbols[idx + 1:]
+
+    def set_latest_updated_company_info(self, symbol, shard=0, shard_count=1):
+        self.firestore.set_task_state(self._task_name("company_info", shard, shard_count), {
             'latest_symbol': symbol,
             'date': datetime.now().strftime("%Y-%m")
         })
 
-    def set_latest_updated_company_quote(self, symbol):
-        self.firestore.set_task_state("company_quotes", {
+    def set_latest_updated_company_quote(self, symbol, shard=0, shard_count=1):
+        self.firestore.set_task_state(self._task_name("company_quotes", shard, shard_count), {
             'latest_symbol': symbol,
             'date': datetime.now().strftime("%Y-%m-%d")
         })
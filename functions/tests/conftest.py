@@ -0,0 +1,21 @@
+from types import SimpleNamespace
+
+import pytest
+
+from clients.fmp.rateLimiter import RateLimiter
+from service.firestore import FirestoreService
+from service.storage import MemoryBackend
+
+
+@pytest.fixture
+def firestore():
+    return FirestoreService(MemoryBackend())
+
+
+@pytest.fixture
+def sync_service(firestore):
+    from service.company_data_sync import CompanyDataSyncService
+
+    fmp_client = SimpleNamespace(rate_limiter=RateLimiter(per_minute=60000, burst=1000), quote_chunk_size=2,
+                                 stream_prefetch=4)
+    return CompanyDataSyncService(fmp_client=fmp_client, firestore=firestore)
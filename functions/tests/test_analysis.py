@@ -0,0 +1,104 @@
+from datetime import datetime
+
+import pytest
+
+from service.analysis import AnalysisService
+
+
+@pytest.fixture
+def analysis_service(firestore):
+    firestore.store_company_profile("AAPL", {
+        "fundamentalsVersion": "v1",
+        "analysisFundamentalsVersion": "v1",
+        "analysisMarketCap": 100.0,
+        "annualNcavRatio": 0.5,
+        "per": 10.0,
+    })
+    return AnalysisService(firestore)
+
+
+def stored_analysis(firestore):
+    return firestore.backend.get(f"companies/AAPL/analysis/{datetime.today().date().strftime('%Y-%m-%d')}")
+
+
+def test_small_moves_accumulate_against_the_last_analysed_market_cap(analysis_service, firestore):
+    results = []
+    market_cap = 100.0
+    for _ in range(20):
+        market_cap *= 1.004
+        results.append(analysis_service.update_analysis_on_quote_change("AAPL", {"marketCap": market_cap}))
+        analysis = stored_analysis(firestore)
+        if analysis:
+            # sync_company_ncav trigger가 하는 것처럼 분석에 쓴 marketCap을 profile에 남긴다
+            firestore.store_company_profile("AAPL", {"analysisMarketCap": analysis["marketCap"]})
+
+    assert results[0] == "skipped"
+    assert results.count("rescaled") >= 9
+    assert stored_analysis(firestore)["marketCap"] == pytest.approx(market_cap, rel=0.005)
+
+
+def test_rescale_uses_the_last_analysed_market_cap(analysis_service, firestore):
+    assert analysis_service.update_analysis_on_quote_change("AAPL", {"marketCap": 200.0}) == "rescaled"
+
+    analysis = stored_analysis(firestore)
+    assert analysis["annualNcavRatio"] == pytest.approx(0.25)
+    assert analysis["per"] == pytest.approx(20.0)
+
+
+def test_changed_fundamentals_are_not_skipped(analysis_service, firestore, monkeypatch):
+    firestore.store_company_profile("AAPL", {"fundamentalsVersion": "v2"})
+    updated = []
+    monkeypatch.setattr(analysis_service, "update_analysis", lambda symbol, quote: updated.append(symbol))
+
+    assert analysis_service.update_analysis_on_quote_change("AAPL", {"marketCap": 100.0}) == "full"
+    assert updated == ["AAPL"]
+
+
+@pytest.fixture(scope="module")
+def fmp():
+    from benchmarks.fake_fmp import FakeFmpServer
+
+    with FakeFmpServer() as server:
+        yield server
+
+
+def test_batch_analysis_matches_update_analysis_on_the_last_trading_day_quote(fmp, firestore, monkeypatch):
+    from clients.fmp.fmpClient import FmpClient
+    from clients.fmp.rateLimiter import RateLimiter
+    from service import firestore as firestore_module
+    from service.analysis_batch import BatchAnalysisEngine
+    from service.company_data_sync import CompanyDataSyncService
+
+    sync_service = CompanyDataSyncService(
+        FmpClient(fmp.base_url, "test", rate_limiter=RateLimiter(per_minute=1000000, burst=1000)), firestore)
+    for symbol in ["AAPL", "MSFT"]:
+        sync_service.sync_financials(symbol)
+    # 순이익이 0이면 PER은 None, 재무제표가 없으면 NCAV는 -1
+    firestore.store_fundamentals("MSFT", {"annualIncomeStatement": {"netIncome": 0.0}})
+    firestore.store_fundamentals("EMPTY", {"version": "v1", "shareholderReturnsHistory": []})
+
+    class Friday(datetime):
+        @classmethod
+        def today(cls):
+            return cls(2024, 6, 7)
+
+    # 마지막 거래일(금요일)에 저장한 quote로 주말에 분석한다
+    monkeypatch.setattr(firestore_module, "datetime", Friday)
+    for symbol, market_cap in [("AAPL", 2.5e12), ("MSFT", 3.1e12), ("EMPTY", 1e9)]:
+        firestore.store_quote(symbol, {"symbol": symbol, "marketCap": market_cap})
+    monkeypatch.undo()
+
+    symbols = ["AAPL", "MSFT", "EMPTY", "NOQUOTE"]
+    engine = BatchAnalysisEngine(firestore)
+    loaded_symbols, market_caps, fundamentals = engine.load(symbols)
+    batch = engine.to_documents(loaded_symbols, market_caps, fundamentals, engine.compute(market_caps, fundamentals))
+
+    analysis_service = AnalysisService(firestore)
+    date_str = datetime.today().date().strftime("%Y-%m-%d")
+    assert sorted(batch) == ["AAPL", "EMPTY", "MSFT"]
+    for symbol in batch:
+        quote = firestore.get_latest_quote(symbol)
+        assert quote["quoteDate"] == "2024-06-07"
+        analysis_service.update_analysis(symbol, quote)
+        expected = firestore.backend.get(f"companies/{symbol}/analysis/{date_str}")
+        assert batch[symbol] == pytest.approx(expected), symbol
@@ -0,0 +1,133 @@
+import asyncio
+
+import pytest
+
+from benchmarks.fake_fmp import FakeFmpServer
+from clients.fmp.asyncFmpClient import AsyncFmpClient
+from clients.fmp.fmpClient import FmpClient
+from clients.fmp.rateLimiter import RateLimiter
+from service.async_company_data_sync import AsyncCompanyDataSyncService
+from service.company_data_sync import CompanyDataSyncService
+from service.firestore import FirestoreService
+from service.storage import MemoryBackend
+
+SYMBOLS = [f"S{i:02d}" for i in range(12)]
+# 실행 시각에 따라 달라지는 값
+VOLATILE_FIELDS = {"lastFullSync", "updatedAt"}
+
+
+@pytest.fixture(scope="module")
+def fmp():
+    with FakeFmpServer() as server:
+        yield server
+
+
+def without_volatile(value):
+    if isinstance(value, dict):
+        return {key: without_volatile(item) for key, item in value.items() if key not in VOLATILE_FIELDS}
+    return value
+
+
+def test_async_sync_all_stores_the_same_documents_as_the_thread_engine(fmp):
+    def rate_limiter():
+        return RateLimiter(per_minute=1000000, burst=1000)
+
+    threads = CompanyDataSyncService(FmpClient(fmp.base_url, "test", rate_limiter=rate_limiter()),
+                                     FirestoreService(MemoryBackend()))
+    threads.sync_all("AAPL")
+
+    service = AsyncCompanyDataSyncService(
+        CompanyDataSyncService(FmpClient(fmp.base_url, "test", rate_limiter=rate_limiter()),
+                               FirestoreService(MemoryBackend())),
+        AsyncFmpClient(fmp.base_url, "test", concurrency=8, rate_limiter=rate_limiter()))
+
+    async def run():
+        try:
+            await service.sync_all("AAPL")
+        finally:
+            await service.fmpClient.close()
+
+    asyncio.run(run())
+
+    expected = threads.firestore.backend.documents
+    actual = service.firestore.backend.documents
+    assert sorted(actual) == sorted(expected)
+    assert {path: without_volatile(data) for path, data in actual.items()} == \
+           {path: without_volatile(data) for path, data in expected.items()}
+    # manifest에는 incremental sync에 쓰는 상태가 남는다
+    manifest = actual["companies/AAPL/financials/incomeStatements"]
+    assert manifest["quarter"]["latestDate"] and manifest["quarter"]["lastFullSync"]
+
+
+class Recorder:
+    """async sync_func 호출과 checkpoint를 기록하고, checkpoint가 끝나지 않은 symbol을 넘지 않는지 확인한다"""
+
+    def __init__(self, durations=None, failing=()):
+        self.durations = durations or {}
+        self.failing = set(failing)
+        self.started = []
+        self.finished = set()
+        self.checkpoints = []
+
+    async def sync(self, symbol):
+        self.started.append(symbol)
+        await asyncio.sleep(self.durations.get(symbol, 0))
+        if symbol in self.failing:
+            raise RuntimeError(f"sync failed for {symbol}")
+        self.finished.add(symbol)
+
+    def set_latest(self, symbol):
+        assert set(SYMBOLS[:SYMBOLS.index(symbol) + 1]) <= self.finished, f"checkpoint {symbol} passed unfinished work"
+        self.checkpoints.append(symbol)
+
+
+class StopAfter:
+    """admit 횟수로 deadline을 흉내 내는 RunBudget stand-in"""
+
+    def __init__(self, admits):
+        self.admits = admits
+
+    def can_admit(self):
+        self.admits -= 1
+        return self.admits >= 0
+
+    def record(self, seconds, symbols=1):
+        pass
+
+    def report(self):
+        return {}
+
+
+def run_task(recorder, concurrency=3, budget=None):
+    service = AsyncCompanyDataSyncService(sync_service=CompanyDataSyncService(
+        fmp_client=object(), firestore=FirestoreService(MemoryBackend())), fmp_client=object())
+    service.symbol_concurrency = concurrency
+    return asyncio.run(service.sync_all_companies_task(lambda: list(SYMBOLS), recorder.sync, recorder.set_latest,
+                                                       budget=budget))
+
+
+def test_checkpoint_waits_for_a_slow_symbol():
+    recorder = Recorder(durations={"S01": 0.05})
+    report = run_task(recorder)
+
+    assert report["completedUnits"] == len(SYMBOLS)
+    assert recorder.checkpoints[-1] == SYMBOLS[-1]
+
+
+def test_error_drains_running_symbols_and_keeps_the_checkpoint_before_it():
+    recorder = Recorder(durations={"S05": 0.02}, failing={"S04"})
+    with pytest.raises(RuntimeError, match="S04"):
+        run_task(recorder)
+
+    assert recorder.checkpoints[-1] == "S03"
+    assert "S05" in recorder.finished  # 이미 시작한 symbol은 끝까지 기다린다
+    assert len(recorder.started) < len(SYMBOLS)
+
+
+def test_budget_stops_admitting_new_symbols():
+    recorder = Recorder()
+    report = run_task(recorder, budget=StopAfter(5))
+
+    assert report["stoppedEarly"]
+    assert report["completedUnits"] == 5
+    assert recorder.checkpoints[-1] == "S04"
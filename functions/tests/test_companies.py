@@ -0,0 +1,58 @@
+import pytest
+
+from companies import SymbolList, companies
+
+SYMBOLS = ["AAPL", "AMZN", "BRK.B", "GOOG", "META", "MSFT", "NVDA", "TSLA"]
+
+
+@pytest.fixture
+def symbols():
+    return SymbolList.of(SYMBOLS)
+
+
+@pytest.mark.parametrize("item", [
+    slice(None), slice(2, None), slice(None, 3), slice(2, 5), slice(-3, None), slice(5, 2), slice(100, None),
+    slice(None, None, 2), slice(None, None, -1), slice(6, 1, -2),
+])
+def test_slices_match_list_semantics(symbols, item):
+    assert list(symbols[item]) == SYMBOLS[item]
+    assert len(symbols[item]) == len(SYMBOLS[item])
+
+
+def test_nested_slices_are_views_over_the_same_data(symbols):
+    view = symbols[2:][1:4]
+
+    assert list(view) == SYMBOLS[2:][1:4]
+    assert view._symbols is symbols._symbols
+    assert view[0] == "GOOG" and view[-1] == "MSFT"
+    with pytest.raises(IndexError):
+        view[3]
+
+
+def test_membership_is_limited_to_the_view(symbols):
+    view = symbols[2:5]
+
+    assert "GOOG" in view
+    assert "AAPL" not in view and "NVDA" not in view and "XXXX" not in view
+    assert view.count("GOOG") == 1 and view.count("AAPL") == 0
+
+
+@pytest.mark.parametrize("start,stop", [(0, None), (2, None), (0, 4), (-3, None), (1, -1)])
+def test_index_matches_list_semantics(symbols, start, stop):
+    view = symbols[1:7]
+    expected_view = SYMBOLS[1:7]
+    for symbol in SYMBOLS + ["XXXX"]:
+        try:
+            expected = expected_view.index(symbol, start, len(expected_view) if stop is None else stop)
+        except ValueError:
+            with pytest.raises(ValueError):
+                view.index(symbol, start, stop)
+        else:
+            assert view.index(symbol, start, stop) == expected
+
+
+def test_resuming_after_a_checkpoint_symbol():
+    position = companies.index(companies[10]) + 1
+
+    assert companies[position:][0] == companies[11]
+    assert len(companies[position:]) == len(companies) - 11
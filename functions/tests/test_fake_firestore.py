@@ -0,0 +1,23 @@
+import pytest
+
+from benchmarks.fake_firestore import FakeFirestoreClient
+from service.firestore import FirestoreService
+from service.storage import FirestoreBackend
+
+
+def test_document_paths_must_have_an_even_number_of_elements():
+    client = FakeFirestoreClient()
+    with pytest.raises(ValueError, match="even number of path elements"):
+        client.document("companies/AKO/A/quotes/2024-06-07")
+    with pytest.raises(ValueError, match="even number of path elements"):
+        client.collection("companies").document("AKO/A")
+    with pytest.raises(ValueError, match="odd number of path elements"):
+        client.collection("companies/AKO/A/quotes")
+
+
+def test_store_quotes_reports_the_full_symbol_of_a_rejected_path():
+    firestore = FirestoreService(FirestoreBackend(FakeFirestoreClient()))
+    failed = firestore.store_quotes({"AAPL": {"marketCap": 1.0}, "AKO/A": {"marketCap": 2.0}})
+
+    assert failed == ["AKO/A"]
+    assert firestore.get_latest_quote("AAPL")["marketCap"] == 1.0
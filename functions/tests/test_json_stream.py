@@ -0,0 +1,85 @@
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+from clients.fmp.jsonStream import JsonNotArrayError, JsonStreamError, JsonTruncatedError, iter_json_array, prefetch
+
+FIXTURE_DIR = Path(__file__).resolve().parent.parent / "clients" / "fmp" / "data"
+
+
+def chunked(data, size):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize("fixture", sorted(FIXTURE_DIR.glob("*.json")), ids=lambda path: path.name)
+@pytest.mark.parametrize("chunk_size", [97, 4096, 64 * 1024])
+def test_fixtures_parse_the_same_at_any_chunk_boundary(fixture, chunk_size):
+    data = fixture.read_bytes()
+    assert list(iter_json_array(chunked(data, chunk_size))) == json.loads(data)
+
+
+def test_numbers_and_literals_split_across_chunks():
+    data = b'[1.5e3, -20, 3, true, null, {"a": 10}]'
+    assert list(iter_json_array(chunked(data, 1))) == [1500.0, -20, 3, True, None, {"a": 10}]
+    # 마지막 chunk 끝에서 끝나는 숫자도 구분자를 기다리지 않고 마무리한다
+    assert list(iter_json_array([b"[12", b"34]"])) == [1234]
+
+
+def test_multibyte_characters_split_across_chunks():
+    data = '﻿ [{"name": "삼성전자", "sector": "Technology"}]'.encode()
+    assert list(iter_json_array(chunked(data, 1))) == [{"name": "삼성전자", "sector": "Technology"}]
+
+
+def test_empty_array():
+    assert list(iter_json_array([b" [ ", b" ] "])) == []
+
+
+@pytest.mark.parametrize("data, error, message", [
+    (b"", JsonTruncatedError, "Empty JSON response"),
+    (b'{"Error Message": "Invalid API KEY"}', JsonNotArrayError, "Expected a JSON array"),
+    (b'[{"a": 1}, {"a": 2}', JsonTruncatedError, "not closed"),
+    (b'[{"a": 1}, {"name": "Sams', JsonTruncatedError, "Invalid JSON array element"),
+    (b"[1 2]", JsonStreamError, "Expected ','"),
+    (b'[{"a": }]', JsonStreamError, "Invalid JSON array element"),
+])
+def test_invalid_responses(data, error, message):
+    with pytest.raises(error, match=message) as raised:
+        list(iter_json_array(chunked(data, 3)))
+    assert type(raised.value) is error
+
+
+def test_truncated_body_yields_complete_elements_before_failing():
+    items = iter_json_array([b'[{"a": 1}, {"a": 2}, {"a"'])
+    assert next(items) == {"a": 1}
+    assert next(items) == {"a": 2}
+    with pytest.raises(JsonTruncatedError):
+        next(items)
+
+
+def test_prefetch_keeps_order_and_propagates_errors():
+    def source():
+        yield from range(5)
+        raise ConnectionError("dropped")
+
+    items = prefetch(source(), maxsize=2)
+    assert [next(items) for _ in range(5)] == list(range(5))
+    with pytest.raises(ConnectionError, match="dropped"):
+        next(items)
+
+
+def test_closing_prefetch_stops_and_closes_the_source():
+    closed = threading.Event()
+
+    def source():
+        try:
+            for i in range(1000):
+                yield i
+        finally:
+            closed.set()
+
+    items = prefetch(source(), maxsize=2)
+    assert next(items) == 0
+    items.close()
+    assert closed.is_set()
@@ -0,0 +1,86 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from service.leaderboard import LeaderboardService, apply_entry
+
+
+def entries(*pairs):
+    return [{"symbol": symbol, "value": value} for symbol, value in pairs]
+
+
+def test_apply_entry_inserts_in_rank_order():
+    board = entries(("A", 3.0), ("B", 1.0))
+
+    assert apply_entry("roi", board, "C", 2.0, capacity=5) == entries(("A", 3.0), ("C", 2.0), ("B", 1.0))
+    assert apply_entry("per", entries(("A", 5.0)), "C", 2.0, capacity=5) == entries(("C", 2.0), ("A", 5.0))
+
+
+def test_apply_entry_moves_and_removes_existing_symbols():
+    board = entries(("A", 3.0), ("B", 2.0), ("C", 1.0))
+
+    assert apply_entry("roi", board, "C", 4.0, capacity=5) == entries(("C", 4.0), ("A", 3.0), ("B", 2.0))
+    assert apply_entry("roi", board, "A", None, capacity=5) == entries(("B", 2.0), ("C", 1.0))
+    assert apply_entry("roi", board, "A", float("nan"), capacity=5) == entries(("B", 2.0), ("C", 1.0))
+
+
+def test_apply_entry_returns_none_when_nothing_changes():
+    board = entries(("A", 3.0), ("B", 2.0))
+
+    assert apply_entry("roi", board, "A", 3.0, capacity=5) is None
+    assert apply_entry("roi", board, "Z", 1.0, capacity=2) is None  # 꼴찌보다 낮으면 들어가지 못한다
+    assert apply_entry("roi", board, "Z", None, capacity=5) is None
+
+
+def test_apply_entry_keeps_capacity_and_breaks_ties_by_symbol():
+    board = entries(("A", 3.0), ("C", 2.0))
+
+    assert apply_entry("roi", board, "B", 2.0, capacity=2) == entries(("A", 3.0), ("B", 2.0))
+
+
+@pytest.mark.parametrize("metric,value", [("annualNcavRatio", -1), ("per", 0.0), ("pbr", -2.0), ("roi", True)])
+def test_apply_entry_skips_values_that_do_not_rank(metric, value):
+    assert apply_entry(metric, [], "A", value, capacity=5) is None
+
+
+def test_apply_entry_keeps_negative_ncav_other_than_the_missing_marker():
+    assert apply_entry("annualNcavRatio", [], "A", -0.5, capacity=5) == entries(("A", -0.5))
+
+
+def profile(firestore, symbol, sector, updated_at, **metrics):
+    firestore.store_company_profile(symbol, {"sector": sector, "analysisUpdatedAt": updated_at, **metrics})
+
+
+def test_refresh_rebuilds_first_and_then_applies_only_changed_profiles(firestore):
+    service = LeaderboardService(firestore, size=2, reserve=1)
+    past = datetime.now(timezone.utc) - timedelta(hours=1)
+    profile(firestore, "A", "Tech", past, roi=0.3, per=10.0)
+    profile(firestore, "B", "Energy", past, roi=0.2, per=5.0)
+
+    assert service.refresh()["mode"] == "rebuild"
+    assert firestore.backend.get("leaderboards/roi")["entries"] == entries(("A", 0.3), ("B", 0.2))
+
+    now = datetime.now(timezone.utc)
+    profile(firestore, "B", "Energy", now, roi=0.5, per=5.0)
+    profile(firestore, "C", "Tech", now, roi=0.1, per=None)
+    report = service.refresh()
+
+    assert report == {"mode": "incremental", "profiles": 2, "boards": 3}
+    assert firestore.backend.get("leaderboards/roi")["entries"] == entries(("B", 0.5), ("A", 0.3), ("C", 0.1))
+    assert firestore.backend.get("leaderboards/roi/sectors/Tech")["entries"] == entries(("A", 0.3), ("C", 0.1))
+    assert firestore.backend.get("leaderboards/per")["entries"] == entries(("B", 5.0), ("A", 10.0))
+
+
+def test_apply_updates_writes_each_board_once(firestore, monkeypatch):
+    service = LeaderboardService(firestore, size=10, reserve=0)
+    transactions = []
+    update = firestore.update_documents_transactionally
+    monkeypatch.setattr(firestore, "update_documents_transactionally",
+                        lambda paths, func: transactions.append(paths) or update(paths, func))
+
+    profiles = {f"S{i}": {"sector": "Tech", "roi": i / 100} for i in range(50)}
+    changed = service.apply_updates(profiles)
+
+    assert len(transactions) == 1
+    assert sorted(changed) == ["leaderboards/roi", "leaderboards/roi/sectors/Tech"]
+    assert [entry["symbol"] for entry in firestore.backend.get("leaderboards/roi")["entries"]][:2] == ["S49", "S48"]
@@ -0,0 +1,88 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from clients.fmp import rateLimiter
+from metrics import metrics
+from clients.fmp.rateLimiter import RateLimiter, parse_retry_after
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(rateLimiter.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_burst_is_free_then_calls_are_spaced_by_rate(clock):
+    limiter = RateLimiter(per_minute=60, burst=3)
+
+    assert [limiter.reserve() for _ in range(3)] == [0, 0, 0]
+    assert limiter.reserve() == pytest.approx(1.0)
+    assert limiter.reserve() == pytest.approx(2.0)
+
+
+def test_tokens_refill_up_to_burst(clock):
+    limiter = RateLimiter(per_minute=60, burst=2)
+    limiter.reserve()
+    limiter.reserve()
+
+    clock[0] += 10  # 10 token만큼 지났지만 burst까지만 쌓인다
+    assert [limiter.reserve() for _ in range(2)] == [0, 0]
+    assert limiter.reserve() == pytest.approx(1.0)
+
+
+def test_backoff_pauses_every_call_and_restarts_from_empty_bucket(clock):
+    limiter = RateLimiter(per_minute=60, burst=5)
+    limiter.backoff(5)
+
+    assert limiter.reserve() == pytest.approx(6.0)
+    assert limiter.reserve() == pytest.approx(7.0)
+
+    clock[0] += 7
+    assert limiter.reserve() == pytest.approx(1.0)
+
+
+def test_shorter_backoff_does_not_shorten_an_active_pause(clock):
+    limiter = RateLimiter(per_minute=60, burst=5)
+    limiter.backoff(10)
+    limiter.backoff(2)
+
+    assert limiter.reserve() == pytest.approx(11.0)
+
+
+def test_stats_count_waits_and_backoffs(clock):
+    limiter = RateLimiter(per_minute=60, burst=1)
+    limiter.reserve()
+    limiter.reserve()
+    limiter.backoff(1)
+
+    stats = limiter.stats()
+    assert stats["calls"] == 2
+    assert stats["waitedCalls"] == 1
+    assert stats["maxWaitSeconds"] == pytest.approx(1.0)
+    assert stats["backoffs"] == 1
+
+
+def test_invocation_counters_start_from_zero_on_a_shared_limiter(clock):
+    limiter = RateLimiter(per_minute=60, burst=1)
+    limiter.reserve()
+    limiter.reserve()
+
+    metrics.reset()  # 다음 invocation
+    limiter.reserve()
+    limiter.backoff(1)
+
+    assert metrics.summary()["counters"]["fmpRateLimiter"] == {"calls": 1, "waitedCalls": 1, "waitMs": 2000,
+                                                               "backoffs": 1}
+    assert limiter.stats()["calls"] == 3
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("-1") == 0.0
+    assert parse_retry_after(None) == rateLimiter.DEFAULT_BACKOFF_SECONDS
+    assert parse_retry_after("soon", default=7) == 7
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+    assert parse_retry_after(format_datetime(retry_at, usegmt=True)) == pytest.approx(30, abs=2)
@@ -0,0 +1,110 @@
+import math
+
+import pytest
+from werkzeug.datastructures import MultiDict
+
+from service.screener import MAX_LIMIT, ScreenerIndex, ScreenerQueryError, parse_query
+
+PROFILES = {
+    "A": {"roi": 0.3, "per": 10.0, "sector": "Tech"},
+    "B": {"roi": 0.1, "per": 25.0, "sector": "Energy"},
+    "C": {"roi": None, "per": 5.0, "sector": "Tech"},
+    "D": {"roi": 0.3, "per": None, "sector": "Tech"},
+    "E": {"roi": -0.2, "per": 8.0, "sector": "Energy"},
+    "F": {"per": "n/a"},
+}
+
+
+@pytest.fixture
+def index():
+    index = ScreenerIndex(capacity=4)  # capacity보다 많이 넣어 배열이 늘어나는 경로도 거친다
+    for symbol, profile in PROFILES.items():
+        index.upsert(symbol, profile)
+    return index
+
+
+def symbols(result):
+    return [item["symbol"] for item in result["results"]]
+
+
+def test_parse_query():
+    args = MultiDict([("filter", "annualNcavRatio > 0.66"), ("filter", "per<=10"), ("filter", "sector!=Energy"),
+                      ("sector", "Technology"), ("sort", "-roi"), ("limit", "20"), ("offset", "40")])
+
+    assert parse_query(args) == {
+        "filters": [("annualNcavRatio", ">", "0.66"), ("per", "<=", "10"), ("sector", "!=", "Energy"),
+                    ("sector", "=", "Technology")],
+        "sort": "-roi", "limit": 20, "offset": 40,
+    }
+    assert parse_query(MultiDict()) == {"filters": [], "sort": None, "limit": 50, "offset": 0}
+
+
+@pytest.mark.parametrize("args", [{"filter": "per"}, {"filter": "<10"}, {"limit": "ten"}, {"offset": "1.5"}])
+def test_parse_query_rejects_invalid_args(args):
+    with pytest.raises(ScreenerQueryError):
+        parse_query(MultiDict(args))
+
+
+@pytest.mark.parametrize("filters, expected", [
+    ([("roi", ">", "0")], ["A", "B", "D"]),
+    ([("roi", ">=", "0.3"), ("per", "<", "20")], ["A"]),
+    ([("per", "<=", "8")], ["C", "E"]),
+    ([("roi", "=", "0.3")], ["A", "D"]),
+    ([("sector", "=", "Tech")], ["A", "C", "D"]),
+    ([("sector", "!=", "Tech")], ["B", "E", "F"]),
+])
+def test_filters(index, filters, expected):
+    assert symbols(index.query(filters)) == expected
+
+
+def test_missing_values_never_match_a_numeric_filter(index):
+    # roi가 None인 C, roi가 없는 F, per가 문자열인 F는 != 조건에도 들어가지 않는다
+    assert symbols(index.query([("roi", "!=", "0.1")])) == ["A", "D", "E"]
+    assert symbols(index.query([("per", "!=", "0")])) == ["A", "B", "C", "E"]
+    assert index.query([("roi", ">", "0")], limit=1)["results"][0]["per"] == 10.0
+    assert index.query([("sector", "=", "Tech"), ("per", "<", "6")])["results"][0]["roi"] is None
+
+
+@pytest.mark.parametrize("filters, message", [
+    ([("unknown", "=", "1")], "Unknown field"),
+    ([("roi", ">", "high")], "numeric value"),
+    ([("sector", ">", "Tech")], "only supports"),
+])
+def test_invalid_filters(index, filters, message):
+    with pytest.raises(ScreenerQueryError, match=message):
+        index.query(filters)
+
+
+def test_sort_puts_nan_last_in_both_directions(index):
+    assert symbols(index.query(sort="-roi")) == ["A", "D", "B", "E", "C", "F"]
+    assert symbols(index.query(sort="roi")) == ["E", "B", "A", "D", "C", "F"]
+    assert symbols(index.query(sort="-per")) == ["B", "A", "E", "C", "D", "F"]
+    with pytest.raises(ScreenerQueryError, match="Cannot sort"):
+        index.query(sort="-sector")
+
+
+@pytest.mark.parametrize("sort", ["-roi", "roi", "per", None])
+@pytest.mark.parametrize("limit", [1, 2, 4])
+def test_pages_follow_next_offset_without_gaps_or_duplicates(sort, limit):
+    index = ScreenerIndex(capacity=8)
+    for i in range(23):
+        # 같은 값과 nan이 섞여 있어도 page 경계에서 순서가 바뀌지 않아야 한다
+        index.upsert(f"S{i:02d}", {"roi": math.nan if i % 5 == 0 else float(i % 4), "per": float(i % 3)})
+    expected = symbols(index.query(sort=sort, limit=MAX_LIMIT))
+
+    pages, offset = [], 0
+    while offset is not None:
+        result = index.query(sort=sort, limit=limit, offset=offset)
+        assert result["total"] == 23 and result["offset"] == offset
+        pages.extend(symbols(result))
+        offset = result["nextOffset"]
+
+    assert pages == expected
+    assert len(set(pages)) == 23
+
+
+def test_limit_and_offset_are_clamped(index):
+    assert len(index.query(limit=0)["results"]) == 1
+    result = index.query(offset=-3, limit=2)
+    assert result["offset"] == 0 and result["nextOffset"] == 2
+    assert index.query(offset=10) == {"total": 6, "offset": 10, "nextOffset": None, "results": []}
@@ -0,0 +1,49 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from service.sharding import HttpShardDispatcher
+
+
+@pytest.fixture
+def worker():
+    """shard 0은 오래 실행되고, shard 1은 바로 500을 돌려주는 worker 함수 stand-in"""
+    finished = threading.Event()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            shard = parse_qs(urlparse(self.path).query)["shard"][0]
+            if shard == "1":
+                self.send_response(500)
+                self.end_headers()
+                return
+            time.sleep(1)
+            finished.set()
+            self.send_response(200)
+            self.end_headers()
+            self.wfile.write(b"done")
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/", finished
+    finished.wait(5)
+    server.shutdown()
+    server.server_close()
+
+
+def test_dispatch_does_not_wait_for_running_shards(worker):
+    url, finished = worker
+    started = time.monotonic()
+    results = HttpShardDispatcher(url, ack_timeout_sec=0.2).dispatch("quotes", 2)
+
+    assert time.monotonic() - started < 1
+    assert not finished.is_set()
+    assert results[0] == "dispatched"
+    assert isinstance(results[1], Exception)
@@ -0,0 +1,53 @@
+import math
+
+import pytest
+
+from service.snapshot import StatementSnapshot, StatementSnapshotWriter, export_from_firestore
+
+
+def period(date, period_name, **values):
+    return {"date": date, "period": period_name, "calendarYear": date[:4], **values}
+
+
+def test_writer_appends_symbols_and_pads_columns_that_appear_later(tmp_path):
+    writer = StatementSnapshotWriter(tmp_path)
+    writer.append("AAPL", [period("2023-09-30", "FY", totalAssets=3.0), period("2022-09-30", "FY", totalAssets=2.0)])
+    writer.append("MSFT", [period("2023-06-30", "FY", totalAssets=5.0, goodwill=1.0)])
+    manifest = writer.close()
+
+    snapshot = StatementSnapshot(tmp_path)
+    assert manifest["rows"] == len(snapshot) == 3
+    assert snapshot.columns == ["goodwill", "totalAssets"]
+    assert [str(date) for date in snapshot.date] == ["2022-09-30", "2023-09-30", "2023-06-30"]
+    assert snapshot.rows_for("AAPL") == slice(0, 2)
+    assert snapshot.record(snapshot.latest("AAPL"))["totalAssets"] == 3.0
+    assert math.isnan(snapshot.column("goodwill")[0])
+    assert snapshot.record(2)["goodwill"] == 1.0
+    assert not (tmp_path / "raw").exists()
+
+
+def test_writer_keeps_the_last_duplicate_period_and_requires_sorted_symbols(tmp_path):
+    writer = StatementSnapshotWriter(tmp_path)
+    writer.append("MSFT", [period("2023-06-30", "FY", eps=1.0), period("2023-06-30", "FY", eps=2.0)])
+    with pytest.raises(ValueError, match="ascending"):
+        writer.append("AAPL", [period("2023-09-30", "FY", eps=1.0)])
+    writer.close()
+
+    assert StatementSnapshot(tmp_path).record(0)["eps"] == 2.0
+
+
+def test_export_from_firestore_writes_each_symbol_in_order(tmp_path, firestore):
+    for symbol, values in [("MSFT", [1.0, 2.0]), ("AAPL", [3.0])]:
+        documents = [(f"companies/{symbol}/financials/balanceSheets/periods/{2020 + i}-FY",
+                      period(f"{2020 + i}-12-31", "FY", symbol=symbol, totalAssets=value))
+                     for i, value in enumerate(values)]
+        firestore._store_documents(documents)
+
+    manifests = export_from_firestore(tmp_path, ["MSFT", "AAPL", "NONE"], firestore)
+
+    snapshot = StatementSnapshot(tmp_path / "balanceSheets")
+    assert manifests["balanceSheets"]["rows"] == 3
+    assert list(snapshot.symbol) == ["AAPL", "MSFT", "MSFT"]
+    assert list(snapshot.column("totalAssets")) == [3.0, 1.0, 2.0]
+    assert manifests["cashFlows"]["rows"] == 0
+    assert len(StatementSnapshot(tmp_path / "cashFlows")) == 0
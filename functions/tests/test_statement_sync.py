@@ -0,0 +1,122 @@
+import json
+
+import pytest
+import requests
+from tenacity import wait_none
+
+from clients.fmp.jsonStream import iter_json_array
+from service.company_data_sync import STATEMENT_STREAM_ATTEMPTS, CompanyDataSyncService
+
+PERIODS = [{"date": f"{2024 - i // 4}-{12 - i % 4 * 3:02d}-01", "calendarYear": str(2024 - i // 4),
+            "period": f"Q{4 - i % 4}", "totalAssets": float(i)} for i in range(10)]
+
+
+@pytest.fixture(autouse=True)
+def no_retry_wait(monkeypatch):
+    monkeypatch.setattr(CompanyDataSyncService._fetch_and_store.retry, "wait", wait_none())
+
+
+@pytest.fixture
+def commits(firestore, monkeypatch):
+    sizes = []
+    commit = firestore.backend.commit
+
+    def record(writes):
+        sizes.append(len(writes))
+        return commit(writes)
+
+    monkeypatch.setattr(firestore.backend, "commit", record)
+    return sizes
+
+
+class Fetch:
+    """FMP statement 요청 stand-in. drops번째 요청까지는 after개를 넘긴 뒤 연결이 끊긴다"""
+
+    def __init__(self, drops=0, after=3):
+        self.drops = drops
+        self.after = after
+        self.calls = []
+
+    def __call__(self, symbol, annual, limit, stream=False):
+        self.calls.append((symbol, annual, limit, stream))
+        dropped = len(self.calls) <= self.drops
+        for index, item in enumerate(PERIODS):
+            if dropped and index == self.after:
+                raise requests.exceptions.ChunkedEncodingError("Connection broken")
+            yield dict(item)
+
+
+def sync(sync_service, fetch):
+    sync_service.stream_statements = True
+    return sync_service._sync_statement("AAPL", "balanceSheets", fetch, sync_service.firestore.store_balancesheet,
+                                        annual=False, full_refresh=False)
+
+
+def test_streamed_periods_are_committed_every_stream_prefetch_items(sync_service, commits):
+    stats = sync(sync_service, Fetch())
+
+    assert stats["written"] == len(PERIODS)
+    assert commits == [4, 4, 2]
+
+
+def test_dropped_stream_is_fetched_and_stored_again(sync_service, firestore):
+    fetch = Fetch(drops=1)
+    stats = sync(sync_service, fetch)
+
+    assert len(fetch.calls) == 2
+    assert stats == {"written": len(PERIODS), "skipped": 0, "failed": 0}
+    manifest = firestore.get_financial_manifest("AAPL", "balanceSheets")
+    assert len(manifest["periodHashes"]) == len(PERIODS)
+    assert manifest["quarter"]["latestDate"] == PERIODS[0]["date"]
+
+
+def test_manifest_is_not_written_when_every_attempt_drops(sync_service, firestore):
+    fetch = Fetch(drops=STATEMENT_STREAM_ATTEMPTS)
+    with pytest.raises(requests.exceptions.ChunkedEncodingError):
+        sync(sync_service, fetch)
+
+    assert len(fetch.calls) == STATEMENT_STREAM_ATTEMPTS
+    assert firestore.get_financial_manifest("AAPL", "balanceSheets") == {}
+
+
+def test_bad_items_are_counted_as_failed_and_the_rest_is_stored(firestore):
+    items = [dict(PERIODS[0]), {"date": "2023/09/30", "period": "Q3"}, "not a period", dict(PERIODS[1])]
+    stats = firestore.store_balancesheet("AAPL", items)
+
+    assert stats == {"written": 2, "skipped": 0, "failed": 2}
+    assert len(firestore.get_financial_manifest("AAPL", "balanceSheets")["periodHashes"]) == 2
+
+
+def test_error_body_is_skipped_without_touching_the_manifest(sync_service, firestore):
+    sync_service.stream_statements = False
+    error_body = {"Error Message": "Limit Reach"}
+    stats = sync_service._sync_statement("AAPL", "balanceSheets", lambda *args, **kwargs: error_body,
+                                         firestore.store_balancesheet, annual=True, full_refresh=True)
+
+    assert stats == {"written": 0, "skipped": 0, "failed": 0}
+    assert firestore.store_balancesheet("AAPL", error_body) == stats
+    assert firestore.get_financial_manifest("AAPL", "balanceSheets") == {}
+
+
+def test_streamed_error_body_is_skipped_without_retrying(sync_service, firestore):
+    calls = []
+
+    def fetch(symbol, annual, limit, stream=False):
+        calls.append(symbol)
+        return iter_json_array([b'{"Error Message": "Limit Reach"}'])
+
+    assert sync(sync_service, fetch) == {"written": 0, "skipped": 0, "failed": 0}
+    assert len(calls) == 1
+    assert firestore.get_financial_manifest("AAPL", "balanceSheets") == {}
+
+
+def test_truncated_stream_is_retried(sync_service, firestore):
+    calls = []
+
+    def fetch(symbol, annual, limit, stream=False):
+        calls.append(symbol)
+        body = json.dumps(PERIODS).encode()
+        return iter_json_array([body[:len(body) // 2]] if len(calls) == 1 else [body])
+
+    assert sync(sync_service, fetch)["written"] == len(PERIODS)
+    assert len(calls) == 2
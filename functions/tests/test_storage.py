@@ -0,0 +1,105 @@
+from datetime import datetime
+
+import pytest
+
+from service.storage import MemoryBackend, SqliteBackend, merge_document
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def backend(request, tmp_path):
+    if request.param == "memory":
+        yield MemoryBackend()
+        return
+    backend = SqliteBackend(str(tmp_path / "storage.sqlite3"))
+    yield backend
+    backend.connection.close()
+
+
+def test_merge_document_merges_nested_maps_like_set_merge():
+    target = {"name": "Apple", "manifest": {"annual": {"latestDate": "2023-09-30"}, "count": 1}, "tags": ["a"]}
+    data = {"manifest": {"annual": {"lastFullSync": "2024-01-01"}, "count": 2}, "tags": ["b"], "sector": "Tech"}
+
+    assert merge_document(target, data) == {
+        "name": "Apple",
+        "manifest": {"annual": {"latestDate": "2023-09-30", "lastFullSync": "2024-01-01"}, "count": 2},
+        "tags": ["b"],  # map이 아닌 값은 통째로 덮어쓴다
+        "sector": "Tech",
+    }
+    data["manifest"]["annual"]["lastFullSync"] = "changed"
+    assert target["manifest"]["annual"]["lastFullSync"] == "2024-01-01"
+
+
+def test_writes_merge_into_the_stored_document(backend):
+    backend.set("companies/AAPL", {"profile": {"name": "Apple", "sector": "Tech"}})
+    backend.commit([("companies/AAPL", {"profile": {"sector": "Technology"}}), ("companies/MSFT", {"name": "MS"})])
+
+    assert backend.get_many(["companies/AAPL", "companies/MSFT", "companies/NONE"]) == {
+        "companies/AAPL": {"profile": {"name": "Apple", "sector": "Technology"}},
+        "companies/MSFT": {"name": "MS"},
+        "companies/NONE": None,
+    }
+
+
+def test_datetime_round_trips(backend):
+    updated_at = datetime(2024, 6, 7, 16, 0, 30, 123456)
+    backend.set("task_state/sync", {"updatedAt": updated_at, "history": [{"at": updated_at}], "note": {"__x__": 1}})
+
+    document = backend.get("task_state/sync")
+    assert document == {"updatedAt": updated_at, "history": [{"at": updated_at}], "note": {"__x__": 1}}
+    assert isinstance(document["history"][0]["at"], datetime)
+
+
+def test_stream_filters_skip_documents_without_the_field(backend):
+    backend.commit([
+        ("companies/A/analysis/2024", {"per": 10.0, "marketCap": 1.0}),
+        ("companies/B/analysis/2024", {"per": 30.0}),
+        ("companies/C/analysis/2024", {"marketCap": 3.0}),
+        ("companies/A/analysis/2024/history/x", {"per": 5.0}),
+    ])
+
+    assert backend.stream("companies/A/analysis") == {"2024": {"per": 10.0, "marketCap": 1.0}}
+    assert sorted(backend.stream("companies/B/analysis", filters=[("per", ">", 0)])) == ["2024"]
+    assert backend.stream("companies/C/analysis", filters=[("per", ">", 0)]) == {}
+    assert backend.stream("companies/C/analysis", filters=[("per", "!=", 10.0)]) == {}
+    assert backend.stream("companies/A/analysis", fields=["per", "missing"]) == {"2024": {"per": 10.0}}
+
+
+def test_transaction_replaces_the_returned_documents(backend):
+    backend.set("task_state/a", {"count": 1, "keep": True})
+
+    def update(documents):
+        assert documents == {"task_state/a": {"count": 1, "keep": True}, "task_state/b": None}
+        return {"task_state/a": {"count": 2}, "task_state/b": {"count": 1}}
+
+    assert backend.transaction(["task_state/a", "task_state/b"], update) == {
+        "task_state/a": {"count": 2}, "task_state/b": {"count": 1}}
+    assert backend.get("task_state/a") == {"count": 2}  # merge가 아니라 덮어쓴다
+
+
+def test_failed_update_leaves_the_documents_unchanged(backend):
+    backend.set("task_state/a", {"count": 1})
+
+    def update(documents):
+        raise RuntimeError("conflict")
+
+    with pytest.raises(RuntimeError, match="conflict"):
+        backend.transaction(["task_state/a"], update)
+    assert backend.get("task_state/a") == {"count": 1}
+
+
+def test_sqlite_rolls_back_a_transaction_that_fails_while_writing(tmp_path):
+    backend = SqliteBackend(str(tmp_path / "storage.sqlite3"))
+    backend.set("task_state/a", {"count": 1})
+
+    def update(documents):
+        # 첫 번째 문서를 쓴 뒤 두 번째 문서에서 실패한다
+        return {"task_state/a": {"count": 2}, "task_state/b": {"value": object()}}
+
+    with pytest.raises(TypeError):
+        backend.transaction(["task_state/a", "task_state/b"], update)
+    assert backend.get_many(["task_state/a", "task_state/b"]) == {"task_state/a": {"count": 1}, "task_state/b": None}
+
+    # connection은 다음 transaction/commit에 그대로 쓸 수 있다
+    backend.commit([("task_state/a", {"count": 3})])
+    assert backend.get("task_state/a") == {"count": 3}
+    backend.connection.close()
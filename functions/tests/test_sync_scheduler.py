@@ -0,0 +1,119 @@
+import threading
+import time
+
+import pytest
+
+SYMBOLS = [f"S{i:02d}" for i in range(12)]
+
+
+class Recorder:
+    """sync_func 호출과 checkpoint를 기록하고, checkpoint가 끝나지 않은 unit을 넘지 않는지 확인한다"""
+
+    def __init__(self, symbols, durations=None, failing=()):
+        self.symbols = symbols
+        self.durations = durations or {}
+        self.failing = set(failing)
+        self.lock = threading.Lock()
+        self.started = []
+        self.finished = set()
+        self.checkpoints = []
+
+    def sync(self, unit):
+        symbols = unit if isinstance(unit, list) else [unit]
+        with self.lock:
+            self.started.extend(symbols)
+        time.sleep(self.durations.get(symbols[-1], 0))
+        if self.failing & set(symbols):
+            raise RuntimeError(f"sync failed for {symbols}")
+        with self.lock:
+            self.finished.update(symbols)
+
+    def set_latest(self, symbol):
+        with self.lock:
+            done = set(self.finished)
+        position = self.symbols.index(symbol)
+        assert set(self.symbols[:position + 1]) <= done, f"checkpoint {symbol} passed unfinished work"
+        self.checkpoints.append(symbol)
+
+
+class StopAfter:
+    """admit 횟수로 deadline을 흉내 내는 RunBudget stand-in"""
+
+    def __init__(self, admits):
+        self.admits = admits
+
+    def can_admit(self):
+        self.admits -= 1
+        return self.admits >= 0
+
+    def record(self, seconds, symbols=1):
+        pass
+
+    def report(self):
+        return {}
+
+
+def run(sync_service, recorder, concurrency=3, chunk_size=None, budget=None):
+    sync_service.sync_concurrency = concurrency
+    return sync_service.sync_all_companies_task(lambda: list(recorder.symbols), recorder.sync, recorder.set_latest,
+                                                chunk_size=chunk_size, budget=budget)
+
+
+def test_checkpoint_never_passes_unfinished_work_when_units_complete_out_of_order(sync_service):
+    # 앞쪽 symbol일수록 오래 걸려서 뒤쪽이 먼저 끝난다
+    durations = {symbol: 0.002 * (len(SYMBOLS) - i) for i, symbol in enumerate(SYMBOLS)}
+    recorder = Recorder(SYMBOLS, durations)
+
+    report = run(sync_service, recorder)
+
+    assert recorder.finished == set(SYMBOLS)
+    assert recorder.checkpoints[-1] == SYMBOLS[-1]
+    assert recorder.checkpoints == sorted(recorder.checkpoints)
+    assert report["completedUnits"] == len(SYMBOLS)
+    assert report["stoppedEarly"] is False
+
+
+def test_slow_unit_holds_back_the_checkpoint(sync_service):
+    recorder = Recorder(SYMBOLS, {SYMBOLS[1]: 0.05})
+
+    run(sync_service, recorder, concurrency=2)
+
+    # S01이 끝나기 전에 다른 unit이 모두 끝나도 checkpoint는 S00을 넘지 못한다 (Recorder.set_latest가 확인)
+    assert recorder.finished == set(SYMBOLS)
+    assert recorder.checkpoints[-1] == SYMBOLS[-1]
+
+
+def test_error_drains_in_flight_units_and_checkpoints_before_the_failure(sync_service):
+    failing = SYMBOLS[4]
+    # 실패 뒤의 unit도 시간이 걸려야 실패가 처리되기 전에 여러 unit이 끝나 버리지 않는다
+    recorder = Recorder(SYMBOLS, {symbol: 0.01 for symbol in SYMBOLS if symbol != failing}, failing=[failing])
+
+    with pytest.raises(RuntimeError, match="sync failed"):
+        run(sync_service, recorder, concurrency=2)
+
+    # 실패 뒤로는 새 unit을 시작하지 않는다 (이미 돌고 있던 unit은 끝까지 기다린다)
+    assert len(recorder.started) <= SYMBOLS.index(failing) + 2
+    assert recorder.checkpoints[-1] == SYMBOLS[3]
+    assert set(recorder.started) - {failing} <= recorder.finished
+
+
+def test_deadline_stops_admitting_and_checkpoints_completed_units(sync_service):
+    recorder = Recorder(SYMBOLS, {symbol: 0.005 for symbol in SYMBOLS})
+
+    report = run(sync_service, recorder, concurrency=3, budget=StopAfter(5))
+
+    assert sorted(recorder.started) == SYMBOLS[:5]
+    assert recorder.finished == set(SYMBOLS[:5])
+    assert recorder.checkpoints[-1] == SYMBOLS[4]
+    assert report["stoppedEarly"] is True
+    assert report["completedUnits"] == 5
+
+
+def test_chunked_units_checkpoint_the_last_symbol_of_a_chunk(sync_service):
+    recorder = Recorder(SYMBOLS[:5])
+
+    report = run(sync_service, recorder, concurrency=2, chunk_size=2)
+
+    assert report["totalUnits"] == 3
+    assert recorder.checkpoints[-1] == SYMBOLS[4]
+    assert recorder.finished == set(SYMBOLS[:5])